@@ -18,6 +18,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from data_generator import TestDataGenerator
 from models.risk_predictor import RiskPredictor
 from models.model_trainer import ModelTrainer
+from models.model_registry import MODEL_REGISTRY
+from models.background_trainer import TRAINING_JOB
 from utils.data_processor import DataProcessor
 from utils.visualizer import Visualizer
 
@@ -303,8 +305,8 @@ Method {method} | {duration}
         
         if os.path.exists(model_path):
             try:
-                self.model = RiskPredictor()
-                self.model.load_model(model_path)
+                # Model süreç başına bir kez yüklenir; tüm oturumlar aynı anlık görüntüyü kullanır
+                self.model = MODEL_REGISTRY.get(model_path)
                 st.sidebar.success("✅ Model başarıyla yüklendi!")
             except Exception as e:
                 st.sidebar.warning(f"⚠️ Model yüklenemedi: {e}")
@@ -917,6 +919,14 @@ Method {method} | {duration}
         st.sidebar.markdown(f"*{selected_standard} standardına göre sabit değerler*")
         st.sidebar.markdown("*Tek tıkla hazır senaryo yükle*")
         
+        # Tüm senaryoların risk faktörleri tek toplu çağrıda hesaplanır
+        scenario_risks = self.data_processor.calculate_risk_factors_batch(pd.DataFrame({
+            'temperature': [scenario["temp"] for scenario in test_scenarios.values()],
+            'humidity': [scenario["humidity"] for scenario in test_scenarios.values()],
+            'vibration': [scenario["vibration"] for scenario in test_scenarios.values()],
+            'pressure': [scenario["pressure"] for scenario in test_scenarios.values()]
+        }, index=list(test_scenarios)))
+        
         # Test butonları - Dinamik olarak oluştur
         for test_name, scenario in test_scenarios.items():
             # Tooltip oluştur
@@ -965,12 +975,7 @@ Method {method} | {duration}
             st.sidebar.markdown(button_style, unsafe_allow_html=True)
             
             # Risk hesaplama ve renk kodlaması
-            scenario_risk = self.data_processor.calculate_risk_factors(
-                scenario["temp"], scenario["humidity"], 
-                scenario["vibration"], scenario["pressure"]
-            )
-            total_scenario_risk = (scenario_risk['temperature_risk'] + scenario_risk['humidity_risk'] +
-                                   scenario_risk['vibration_risk'] + scenario_risk['pressure_risk']) / 4
+            total_scenario_risk = scenario_risks.at[test_name, 'total_risk']
             
             # Risk emoji'si
             if total_scenario_risk <= 0.3:
@@ -1013,15 +1018,50 @@ Method {method} | {duration}
         # Veri işlemleri - Küçük bölüm
         st.sidebar.markdown("### Veri")
         
+        # Varsayılan olarak veri seti yeniden yazılır; ekleme açıkça seçilmelidir
+        append = st.sidebar.checkbox("Mevcut veriye ekle", value=False,
+                                     help="İşaretliyse yeni kayıtlar mevcut veri setine eklenir")
+        
         col1, col2 = st.sidebar.columns(2)
         with col1:
-            if st.button("Üret", help="Yeni veri oluştur"):
-                self.data_generator.save_mock_data()
+            if st.button("Üret", help="Yeni test verisi üret"):
+                self.data_generator.save_mock_data('data/mock_data.parquet', file_format='parquet',
+                                                   append=append)
                 st.success("✓")
         with col2:
-            if st.button("🔄 Eğit", help="Modeli eğit"):
-                self.train_new_model()
-                st.success("✓")
+            if st.button("🔄 Eğit", help="Modeli arka planda eğit"):
+                # Eğitim ayrı süreçte çalışır; mevcut model tahmin vermeye devam eder
+                if not TRAINING_JOB.start(3000):
+                    st.info("Eğitim zaten sürüyor")
+        
+        self.training_status()
+    
+    def training_status(self):
+        """Arka plan eğitiminin ilerlemesini sidebar'da gösterir"""
+        
+        state = TRAINING_JOB.poll()
+        
+        if state == 'done':
+            # Yeni model dosyası atomik olarak yazıldı; kayıt defteri değişikliği
+            # görüp yeni anlık görüntüyü yükler
+            self.model = MODEL_REGISTRY.get('models/risk_predictor.joblib')
+        
+        # Sonuç mesajı her oturumda bir kez gösterilir; iş, bitiş zamanıyla tanımlanır
+        if state in ('done', 'failed'):
+            if st.session_state.get('training_reported_at') == TRAINING_JOB.finished_at:
+                return
+            st.session_state.training_reported_at = TRAINING_JOB.finished_at
+        
+        if state == 'running':
+            st.sidebar.progress(TRAINING_JOB.progress, text=TRAINING_JOB.message)
+            if st.sidebar.button("Durumu yenile", help="Eğitim ilerlemesini güncelle"):
+                st.rerun()
+        elif state == 'done':
+            st.sidebar.success(f"✅ {TRAINING_JOB.message}")
+        elif state == 'failed':
+            st.sidebar.error("❌ Model eğitimi başarısız oldu")
+            with st.sidebar.expander("Hata ayrıntısı"):
+                st.code(TRAINING_JOB.error)
     
     def risk_analysis_tab(self):
         """Risk analizi sekmesi"""
@@ -1283,11 +1323,13 @@ Method {method} | {duration}
         
         st.subheader("📊 Veri Analizi")
         
-        # Mock data yükle
-        data_file = 'data/mock_data.csv'
+        # Mock data yükle - varsa bölümlenmiş sütunlu veri seti tercih edilir
+        data_file = 'data/mock_data.parquet'
+        if not os.path.exists(data_file):
+            data_file = 'data/mock_data.csv'
         
         if os.path.exists(data_file):
-            df = pd.read_csv(data_file)
+            df = self.data_processor.load_data(data_file)
             
             # Temel istatistikler
             col1, col2, col3 = st.columns(3)
@@ -1330,7 +1372,7 @@ Method {method} | {duration}
             
             # Veri tablosu
             st.subheader("📋 Veri Önizleme")
-            st.dataframe(df.head(10))
+            st.dataframe(self.data_processor.schema.with_display_ids(df.head(10)))
             
         else:
             st.warning("⚠️ Mock data bulunamadı. Lütfen sidebar'dan yeni veri üretin.")
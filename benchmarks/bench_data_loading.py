@@ -0,0 +1,71 @@
+"""
+TestScope AI - Veri Yükleme Süresi Testi
+Düz pd.read_csv + şema dönüşümü ile DataProcessor.load_data'nın (açık tipler,
+hızlı ayrıştırıcı) soğuk ve önbellekten (Streamlit yeniden çalıştırması) yükleme
+sürelerini karşılaştırır. Ölçümler geçici bir CSV dosyası üzerinde yapılır.
+
+Kullanım:
+    python benchmarks/bench_data_loading.py
+    python benchmarks/bench_data_loading.py 1000000
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_generator import TestDataGenerator
+from utils.data_processor import DataProcessor, CSV_ENGINE
+from utils.dataset_schema import DatasetSchema
+from utils.frame_cache import FRAME_CACHE
+
+DEFAULT_NUM_SAMPLES = 200_000
+
+
+def benchmark_data_loading(num_samples: int = DEFAULT_NUM_SAMPLES, warm_repeats: int = 100):
+    """Yükleme sürelerini saniye cinsinden sözlük olarak döndürür"""
+
+    processor = DataProcessor()
+    schema = DatasetSchema()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'mock_data.csv')
+        with contextlib.redirect_stdout(io.StringIO()):
+            TestDataGenerator().save_mock_data(path, num_samples=num_samples, seed=0)
+
+            start = time.perf_counter()
+            schema.apply(pd.read_csv(path))
+            plain = time.perf_counter() - start
+
+            FRAME_CACHE.clear()
+            start = time.perf_counter()
+            processor.load_data(path)
+            cold = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(warm_repeats):
+                processor.load_data(path)
+            warm = (time.perf_counter() - start) / warm_repeats
+
+    results = {
+        'plain_read_csv_seconds': plain,
+        'load_data_cold_seconds': cold,
+        'load_data_cached_seconds': warm
+    }
+
+    print(f"Kayıt sayısı: {num_samples}, CSV motoru: {CSV_ENGINE}")
+    print(f"pd.read_csv + şema        : {plain * 1e3:10.2f} ms")
+    print(f"load_data (soğuk)         : {cold * 1e3:10.2f} ms")
+    print(f"load_data (önbellekten)   : {warm * 1e6:10.2f} µs")
+
+    return results
+
+
+if __name__ == "__main__":
+    num_samples = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_SAMPLES
+    benchmark_data_loading(num_samples)
@@ -0,0 +1,64 @@
+"""
+TestScope AI - Hiperparametre Araması Süre Testi
+ModelTrainer.hyperparameter_tuning için tam GridSearchCV ile bütçeli ardışık
+yarılama aramasının süresini ve bekletilen test verisindeki F1 skorunu karşılaştırır.
+Bütçeli arama ikinci kez çalıştırılarak kayıtlı denemelerin yeniden kullanımı da ölçülür.
+
+Kullanım:
+    python benchmarks/bench_hyperparameter_search.py
+    python benchmarks/bench_hyperparameter_search.py 10000
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from sklearn.metrics import f1_score
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_generator import TestDataGenerator
+from models.model_trainer import ModelTrainer
+
+DEFAULT_NUM_SAMPLES = 3000
+
+
+def benchmark_hyperparameter_search(num_samples: int = DEFAULT_NUM_SAMPLES):
+    """Arama türü başına süre ve test F1 skorunu döndürür"""
+
+    generator = TestDataGenerator()
+    X, y = generator.generate_training_data(num_samples, seed=0)
+    X_test, y_test = generator.generate_training_data(num_samples, seed=1)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trials_path = os.path.join(tmp_dir, 'trials.jsonl')
+        runs = [('grid', 'grid'), ('budgeted', 'budgeted'), ('budgeted (devam)', 'budgeted')]
+
+        for name, search in runs:
+            trainer = ModelTrainer()
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                model = trainer.hyperparameter_tuning(X, y, search=search, trials_path=trials_path)
+                elapsed = time.perf_counter() - start
+
+            y_pred = (model.predict_batch(X_test)['prediction'] == 'FAIL').astype(int)
+            results.append({
+                'search': name,
+                'seconds': elapsed,
+                'test_f1': f1_score(y_test, y_pred, average='weighted'),
+                'params': model.model.get_params()
+            })
+
+    print(f"{'Arama':<18}{'Süre (sn)':>12}{'Test F1':>10}")
+    for row in results:
+        print(f"{row['search']:<18}{row['seconds']:>12.2f}{row['test_f1']:>10.3f}")
+
+    return results
+
+
+if __name__ == "__main__":
+    num_samples = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_SAMPLES
+    benchmark_hyperparameter_search(num_samples)
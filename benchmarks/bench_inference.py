@@ -0,0 +1,78 @@
+"""
+TestScope AI - Çıkarım Gecikme Testi
+RiskPredictor için sklearn yolu ile derlenmiş orman motorunun tek satır gecikmesini,
+toplu çıkarım hızını ve olasılık farkını karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_inference.py
+    python benchmarks/bench_inference.py 1000000
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_generator import TestDataGenerator
+from models.risk_predictor import RiskPredictor
+
+DEFAULT_BATCH_SIZE = 100_000
+
+
+def _best_time(func, repeats: int) -> float:
+    """Fonksiyonun en iyi çalışma süresini saniye olarak döndürür"""
+
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_inference(batch_size: int = DEFAULT_BATCH_SIZE, single_repeats: int = 200):
+    """sklearn ve derlenmiş motor için gecikme ve hız ölçümlerini döndürür"""
+
+    generator = TestDataGenerator()
+    X_train, y_train = generator.generate_training_data(5000, seed=0)
+    X_batch, _ = generator.generate_training_data(batch_size, seed=1)
+    X_single = X_batch.iloc[:1]
+
+    predictors = {}
+    for name, compiled in [('sklearn', False), ('compiled', True)]:
+        predictor = RiskPredictor('random_forest', use_compiled_engine=compiled)
+        with contextlib.redirect_stdout(io.StringIO()):
+            predictor.train(X_train, y_train)
+        predictors[name] = predictor
+
+    results = []
+    for name, predictor in predictors.items():
+        single = _best_time(lambda: predictor.predict(X_single), single_repeats)
+        batch = _best_time(lambda: predictor.predict_batch(X_batch), 3)
+
+        results.append({
+            'engine': name,
+            'single_row_us': single * 1e6,
+            'batch_seconds': batch,
+            'rows_per_second': batch_size / batch
+        })
+        print(f"{name:>9} | tek satır {single * 1e6:10.1f} µs | {batch_size:,} satır "
+              f"{batch:7.3f} s | {batch_size / batch:12,.0f} satır/s")
+
+    # Olasılık uyumu
+    expected = predictors['sklearn'].model.predict_proba(
+        predictors['sklearn'].scaler.transform(X_batch)
+    )
+    actual = predictors['compiled'].engine.predict_proba(X_batch[predictors['compiled'].feature_names])
+    print(f"En büyük olasılık farkı: {np.abs(expected - actual).max():.2e}")
+
+    return results
+
+
+if __name__ == "__main__":
+    batch_size = int(float(sys.argv[1])) if len(sys.argv) > 1 else DEFAULT_BATCH_SIZE
+    benchmark_inference(batch_size)
@@ -0,0 +1,107 @@
+"""
+TestScope AI - Parçalı Üretim Bellek Testi
+iter_test_data tepe bellek kullanımının veri boyutundan bağımsız, parça
+boyutuyla sınırlı kaldığını gösterir (save_mock_data aynı parçaları yazar).
+
+Her ölçüm ayrı bir süreçte yapılır ve süreç tepe RSS değeri (ru_maxrss)
+raporlanır. --tracemalloc ile NumPy/Python ayırmalarının tepe değeri de
+ölçülür (ölçüm belirgin şekilde yavaşlar).
+
+Kullanım:
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py 1000000 10000000
+    python benchmarks/bench_memory.py --tracemalloc 100000 1000000
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_SIZES = [100_000, 1_000_000, 10_000_000]
+CHUNK_SIZE = 100_000
+
+
+def _peak_rss_mb() -> float:
+    """Sürecin tepe RSS değerini MB cinsinden döndürür"""
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta byte
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def _measure(mode: str, num_samples: int, chunk_size: int, trace: bool):
+    """Tek ölçümü mevcut süreçte yapar ve sonucu tek satır olarak yazdırır"""
+    
+    from data_generator import TestDataGenerator
+    
+    generator = TestDataGenerator()
+    
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    
+    # Her iki modda da satırlar tüketilip özetlenir (FAIL sayısı)
+    if mode == 'chunked':
+        fail_count = 0
+        for chunk in generator.iter_test_data(num_samples, chunk_size, seed=42):
+            fail_count += int((chunk['pass_fail'] == 'FAIL').sum())
+    else:
+        df = generator.generate_test_data(num_samples, seed=42)
+        fail_count = int((df['pass_fail'] == 'FAIL').sum())
+        del df
+    
+    elapsed = time.perf_counter() - start
+    traced_peak = 0
+    if trace:
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    
+    print(f"RESULT {traced_peak / 1024 / 1024:.1f} {_peak_rss_mb():.1f} {elapsed:.2f}")
+
+
+def benchmark_memory(sizes=DEFAULT_SIZES, chunk_size: int = CHUNK_SIZE,
+                     include_full: bool = True, trace: bool = False):
+    """Parçalı ve tek seferde üretim için tepe bellek değerlerini karşılaştırır"""
+    
+    modes = ['chunked', 'full'] if include_full else ['chunked']
+    results = []
+    
+    print(f"Parça boyutu: {chunk_size:,}")
+    print(f"{'mod':>8} | {'satır':>12} | {'tracemalloc MB':>14} | {'tepe RSS MB':>11} | {'süre s':>7}")
+    
+    for num_samples in sizes:
+        for mode in modes:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--measure', mode,
+                 str(num_samples), str(chunk_size), str(int(trace))],
+                capture_output=True, text=True, check=True
+            ).stdout
+            line = [l for l in output.splitlines() if l.startswith('RESULT')][-1]
+            traced_mb, rss_mb, elapsed = map(float, line.split()[1:])
+            
+            results.append({
+                'mode': mode,
+                'rows': num_samples,
+                'tracemalloc_peak_mb': traced_mb,
+                'peak_rss_mb': rss_mb,
+                'seconds': elapsed
+            })
+            traced = f"{traced_mb:.1f}" if trace else '-'
+            print(f"{mode:>8} | {num_samples:>12,} | {traced:>14} | {rss_mb:>11.1f} | {elapsed:>7.2f}")
+    
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--measure':
+        _measure(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]), sys.argv[5] == '1')
+    else:
+        args = sys.argv[1:]
+        trace = '--tracemalloc' in args
+        sizes = [int(float(arg)) for arg in args if arg != '--tracemalloc'] or DEFAULT_SIZES
+        benchmark_memory(sizes, trace=trace)
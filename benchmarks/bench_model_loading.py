@@ -0,0 +1,82 @@
+"""
+TestScope AI - Model Yükleme Süresi Testi
+RiskPredictor.load_model (her yeniden çalıştırmada joblib.load) ile ModelRegistry'nin
+soğuk yükleme, paylaşılan motor hazırken yeni süreçte soğuk yükleme ve sıcak erişim
+sürelerini karşılaştırır. Ölçümler geçici bir model kopyası üzerinde yapılır.
+
+Kullanım:
+    python benchmarks/bench_model_loading.py
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+from models.model_registry import ModelRegistry
+from models.risk_predictor import RiskPredictor
+
+MODEL_PATH = os.path.join(ROOT, 'models', 'risk_predictor.joblib')
+
+# Ayrı süreçte soğuk yükleme süresini ölçen betik
+CHILD_SCRIPT = """
+import sys, time
+sys.path.append({root!r})
+from models.model_registry import ModelRegistry
+start = time.perf_counter()
+ModelRegistry().get({path!r})
+print(time.perf_counter() - start)
+"""
+
+
+def benchmark_model_loading(model_path: str = MODEL_PATH, warm_repeats: int = 1000):
+    """Yükleme sürelerini saniye cinsinden sözlük olarak döndürür"""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, os.path.basename(model_path))
+        shutil.copy(model_path, path)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            RiskPredictor().load_model(path)
+            joblib_load = time.perf_counter() - start
+
+            registry = ModelRegistry()
+            start = time.perf_counter()
+            registry.get(path)
+            cold_first = time.perf_counter() - start
+
+        child = subprocess.run(
+            [sys.executable, '-c', CHILD_SCRIPT.format(root=ROOT, path=path)],
+            capture_output=True, text=True, check=True
+        )
+        cold_shared = float(child.stdout.strip().splitlines()[-1])
+
+        start = time.perf_counter()
+        for _ in range(warm_repeats):
+            registry.get(path)
+        warm = (time.perf_counter() - start) / warm_repeats
+
+    results = {
+        'joblib_load_seconds': joblib_load,
+        'registry_cold_first_seconds': cold_first,
+        'registry_cold_shared_engine_seconds': cold_shared,
+        'registry_warm_seconds': warm
+    }
+
+    print(f"load_model (her yeniden çalıştırma)   : {joblib_load * 1e3:10.2f} ms")
+    print(f"Kayıt defteri soğuk (motor derleme)   : {cold_first * 1e3:10.2f} ms")
+    print(f"Kayıt defteri soğuk (yeni süreç)      : {cold_shared * 1e3:10.2f} ms")
+    print(f"Kayıt defteri sıcak erişim            : {warm * 1e6:10.2f} µs")
+
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_model_loading()
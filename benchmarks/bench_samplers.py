@@ -0,0 +1,113 @@
+"""
+TestScope AI - Örnekleme Yöntemi Karşılaştırması
+generate_training_data örnekleyicileri (random, lhs, sobol, halton ve sınır
+yoğunlaştırmalı lhs) ile eğitilen RiskPredictor modellerinin, ortak bir düzgün
+dağılımlı değerlendirme setindeki doğruluğunu ve eğitim süresini ölçer.
+Sonuçlar örnek sayısına göre çizilip PNG olarak kaydedilir.
+
+Kullanım:
+    python benchmarks/bench_samplers.py
+    python benchmarks/bench_samplers.py 250 500 1000 2000 5000
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from sklearn.metrics import accuracy_score
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_generator import TestDataGenerator
+from models.risk_predictor import RiskPredictor
+
+DEFAULT_SIZES = [250, 500, 1000, 2000, 5000]
+
+# (etiket, sampler, boundary_fraction)
+SAMPLER_CONFIGS = [
+    ('random', 'random', 0.0),
+    ('lhs', 'lhs', 0.0),
+    ('sobol', 'sobol', 0.0),
+    ('halton', 'halton', 0.0),
+    ('lhs + sınır %30', 'lhs', 0.3)
+]
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sampler_accuracy.png')
+
+
+def benchmark_samplers(sizes=DEFAULT_SIZES, eval_samples: int = 50_000, repeats: int = 3):
+    """Her örnekleyici ve örnek sayısı için ortalama doğruluğu ve eğitim süresini döndürür"""
+
+    generator = TestDataGenerator()
+    X_eval, y_eval = generator.generate_training_data(eval_samples, seed=12345)
+    results = []
+
+    for label, sampler, boundary_fraction in SAMPLER_CONFIGS:
+        for num_samples in sizes:
+            accuracies, seconds = [], []
+
+            for repeat in range(repeats):
+                X, y = generator.generate_training_data(
+                    num_samples, seed=repeat, sampler=sampler, boundary_fraction=boundary_fraction
+                )
+                predictor = RiskPredictor('random_forest')
+
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    predictor.train(X, y)
+                seconds.append(time.perf_counter() - start)
+
+                y_pred = predictor.model.predict(predictor.scaler.transform(X_eval))
+                accuracies.append(accuracy_score(y_eval, y_pred))
+
+            accuracy = sum(accuracies) / repeats
+            train_seconds = sum(seconds) / repeats
+            results.append({
+                'sampler': label,
+                'samples': num_samples,
+                'accuracy': accuracy,
+                'train_seconds': train_seconds
+            })
+            print(f"{label:>16} | {num_samples:>7,} örnek | doğruluk {accuracy:.4f} | "
+                  f"eğitim {train_seconds:6.2f} s")
+
+    return results
+
+
+def plot_results(results, output_path: str = OUTPUT_PATH):
+    """Doğruluk ve eğitim süresini örnek sayısına göre çizer"""
+
+    fig, (ax_acc, ax_time) = plt.subplots(1, 2, figsize=(12, 5))
+
+    for label, _, _ in SAMPLER_CONFIGS:
+        rows = [r for r in results if r['sampler'] == label]
+        samples = [r['samples'] for r in rows]
+        ax_acc.plot(samples, [r['accuracy'] for r in rows], marker='o', label=label)
+        ax_time.plot(samples, [r['train_seconds'] for r in rows], marker='o', label=label)
+
+    ax_acc.set_xscale('log')
+    ax_acc.set_xlabel('Eğitim örnek sayısı')
+    ax_acc.set_ylabel('Doğruluk (düzgün değerlendirme seti)')
+    ax_acc.set_title('Doğruluk / örnek sayısı')
+    ax_acc.grid(True, alpha=0.3)
+    ax_acc.legend()
+
+    ax_time.set_xscale('log')
+    ax_time.set_xlabel('Eğitim örnek sayısı')
+    ax_time.set_ylabel('Eğitim süresi (s)')
+    ax_time.set_title('Eğitim süresi / örnek sayısı')
+    ax_time.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=120)
+    plt.close(fig)
+    print(f"Grafik kaydedildi: {output_path}")
+
+
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    plot_results(benchmark_samplers(sizes))
@@ -0,0 +1,80 @@
+"""
+TestScope AI - Paralel (Shard) Veri Üretim Testi
+generate_test_data_sharded için işçi sayısına göre süre ve hızlanma ölçer,
+çıktının işçi sayısından bağımsız olarak birebir aynı kaldığını doğrular.
+
+Kullanım:
+    python benchmarks/bench_sharded_generation.py
+    python benchmarks/bench_sharded_generation.py 10000000 32
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_generator import TestDataGenerator
+
+REFERENCE_DATE = pd.Timestamp('2025-01-01')
+
+
+def _frame_digest(df: pd.DataFrame) -> str:
+    """DataFrame içeriğinin SHA-256 özetini döndürür"""
+    
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=False).values.tobytes()).hexdigest()
+
+
+def benchmark_sharded(num_samples: int = 2_000_000, n_shards: int = None, seed: int = 42):
+    """1, 2, 4, ... işçi ile üretim süresini ve hızlanmayı raporlar"""
+    
+    generator = TestDataGenerator()
+    cpu_count = os.cpu_count() or 1
+    n_shards = n_shards or cpu_count
+    
+    worker_counts = []
+    workers = 1
+    while workers < min(cpu_count, n_shards):
+        worker_counts.append(workers)
+        workers *= 2
+    worker_counts.append(min(cpu_count, n_shards))
+    
+    print(f"{num_samples:,} satır, {n_shards} shard, {cpu_count} çekirdek")
+    print(f"{'işçi':>5} | {'süre s':>8} | {'satır/s':>14} | {'hızlanma':>8} | özet")
+    
+    results = []
+    baseline = None
+    
+    for workers in worker_counts:
+        start = time.perf_counter()
+        df = generator.generate_test_data_sharded(
+            num_samples, n_shards=n_shards, seed=seed,
+            max_workers=workers, reference_date=REFERENCE_DATE
+        )
+        elapsed = time.perf_counter() - start
+        digest = _frame_digest(df)
+        del df
+        
+        baseline = baseline or elapsed
+        results.append({
+            'workers': workers,
+            'seconds': elapsed,
+            'rows_per_second': num_samples / elapsed,
+            'speedup': baseline / elapsed,
+            'digest': digest
+        })
+        print(f"{workers:>5} | {elapsed:>8.2f} | {num_samples / elapsed:>14,.0f} | "
+              f"{baseline / elapsed:>7.2f}x | {digest[:12]}")
+    
+    if len({r['digest'] for r in results}) != 1:
+        raise RuntimeError("Shard çıktısı işçi sayısına göre farklılaştı!")
+    
+    return results
+
+
+if __name__ == "__main__":
+    num_samples = int(float(sys.argv[1])) if len(sys.argv) > 1 else 2_000_000
+    n_shards = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    benchmark_sharded(num_samples, n_shards)
@@ -0,0 +1,100 @@
+"""
+TestScope AI - Depolama Formatı Karşılaştırması
+CSV ile bölümlenmiş Parquet/Feather veri setlerini yazma süresi, disk boyutu,
+tam okuma ve projeksiyonlu (sütun + bölüm filtreli) okuma süresi açısından karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_storage.py
+    python benchmarks/bench_storage.py 2000 1000000
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_generator import TestDataGenerator
+from utils.columnar_storage import ColumnarStorage
+from utils.data_processor import DataProcessor
+
+DEFAULT_SIZES = [2_000, 1_000_000, 10_000_000]
+FORMATS = ['csv', 'parquet', 'feather']
+
+# Veri analizi sekmesine benzer dar bir okuma
+PROJECTED_COLUMNS = ['risk_score', 'pass_fail']
+PROJECTED_CATEGORIES = ['temperature']
+
+
+def _disk_size_mb(path: str) -> float:
+    """Dosya veya dizinin toplam boyutunu MB cinsinden döndürür"""
+    
+    if os.path.isfile(path):
+        return os.path.getsize(path) / 1024 / 1024
+    
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total / 1024 / 1024
+
+
+def _timed(func):
+    """Fonksiyonu çalıştırır, (süre, sonuç) döndürür"""
+    
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def benchmark_storage(sizes=DEFAULT_SIZES, formats=FORMATS):
+    """Her boyut ve format için yazma/okuma süreleri ile disk boyutunu raporlar"""
+    
+    generator = TestDataGenerator()
+    processor = DataProcessor()
+    results = []
+    
+    print(f"{'satır':>12} | {'format':>8} | {'yazma s':>8} | {'boyut MB':>9} | "
+          f"{'tam okuma s':>11} | {'projeksiyon s':>13}")
+    
+    for num_samples in sizes:
+        df = generator.generate_test_data(num_samples, seed=42)
+        
+        for file_format in formats:
+            tmp_dir = tempfile.mkdtemp()
+            path = os.path.join(tmp_dir, f'mock_data.{file_format}')
+            
+            try:
+                if file_format == 'csv':
+                    write_time, _ = _timed(lambda df=df: df.to_csv(path, index=False))
+                else:
+                    storage = ColumnarStorage(file_format)
+                    write_time, _ = _timed(lambda df=df: storage.write(df, path))
+                
+                full_time, _ = _timed(lambda: processor.load_data(path))
+                projected_time, _ = _timed(lambda: processor.load_data(
+                    path, columns=PROJECTED_COLUMNS, categories=PROJECTED_CATEGORIES
+                ))
+                size_mb = _disk_size_mb(path)
+            finally:
+                shutil.rmtree(tmp_dir)
+            
+            results.append({
+                'rows': num_samples,
+                'format': file_format,
+                'write_seconds': write_time,
+                'size_mb': size_mb,
+                'full_load_seconds': full_time,
+                'projected_load_seconds': projected_time
+            })
+            print(f"{num_samples:>12,} | {file_format:>8} | {write_time:>8.3f} | {size_mb:>9.2f} | "
+                  f"{full_time:>11.3f} | {projected_time:>13.3f}")
+        
+        del df
+    
+    return results
+
+
+if __name__ == "__main__":
+    sizes = [int(float(arg)) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    benchmark_storage(sizes)
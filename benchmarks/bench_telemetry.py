@@ -0,0 +1,55 @@
+"""
+TestScope AI - Telemetri Simülatörü Performans Testi
+ChamberTelemetrySimulator için test tipi başına saniyede üretilen örnek sayısını
+(halka tampona yazım dahil) ölçer.
+
+Kullanım:
+    python benchmarks/bench_telemetry.py
+    python benchmarks/bench_telemetry.py 10000
+"""
+
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from telemetry_simulator import ChamberTelemetrySimulator
+from utils.dataset_schema import TEST_TYPES
+
+DEFAULT_SAMPLE_RATE = 10_000.0
+
+
+def benchmark_telemetry(sample_rate: float = DEFAULT_SAMPLE_RATE, test_minutes: int = 60):
+    """Her test tipi için saniye başına örnek sayısını döndürür"""
+
+    simulator = ChamberTelemetrySimulator(sample_rate=sample_rate)
+    buffer = simulator.make_buffer(seconds=60.0)
+    base = simulator.generator.generate_test_data(1, seed=0)
+    results = []
+
+    for test_type in TEST_TYPES:
+        tests = base.assign(test_type=test_type, test_duration=test_minutes)
+        buffer.clear()
+
+        start = time.perf_counter()
+        simulator.simulate(tests, seed=0, buffer=buffer)
+        seconds = time.perf_counter() - start
+
+        samples = buffer.total_written
+        results.append({
+            'test_type': test_type,
+            'samples': samples,
+            'seconds': seconds,
+            'samples_per_second': samples / seconds
+        })
+        print(f"{test_type:>22} | {samples:>12,} örnek | {seconds:7.3f} s | "
+              f"{samples / seconds:14,.0f} örnek/s")
+
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    sample_rate = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SAMPLE_RATE
+    benchmark_telemetry(sample_rate)
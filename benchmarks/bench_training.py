@@ -0,0 +1,49 @@
+"""
+TestScope AI - Model Eğitim Süresi Testi
+ModelTrainer.train_multiple_models için sıralı eğitim ile süreç havuzunda paralel
+eğitimin duvar saati sürelerini karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_training.py
+    python benchmarks/bench_training.py 20000
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_generator import TestDataGenerator
+from models.model_trainer import ModelTrainer
+
+DEFAULT_NUM_SAMPLES = 5000
+
+
+def benchmark_training(num_samples: int = DEFAULT_NUM_SAMPLES, cores: int = None):
+    """Sıralı ve paralel eğitim sürelerini saniye cinsinden döndürür"""
+
+    cores = cores or os.cpu_count() or 1
+    X, y = TestDataGenerator().generate_training_data(num_samples, seed=0)
+
+    results = {}
+    for name, parallel in [('sequential', False), ('parallel', True)]:
+        trainer = ModelTrainer()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            metrics = trainer.train_multiple_models(X, y, parallel=parallel, cores=cores)
+            results[name] = time.perf_counter() - start
+        results[f'{name}_best_f1'] = max(m['f1_score'] for m in metrics.values())
+
+    print(f"Örnek sayısı: {num_samples}, çekirdek: {cores}")
+    print(f"Sıralı eğitim  : {results['sequential']:8.2f} sn")
+    print(f"Paralel eğitim : {results['parallel']:8.2f} sn "
+          f"({results['sequential'] / results['parallel']:.2f}x)")
+
+    return results
+
+
+if __name__ == "__main__":
+    num_samples = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_SAMPLES
+    benchmark_training(num_samples)
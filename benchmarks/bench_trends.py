@@ -0,0 +1,75 @@
+"""
+TestScope AI - Trend Analizi Tarama Testi
+Tüm veriyi yükleyip analyze_test_trends çalıştırmak ile analyze_test_trends_scan'in
+parça parça (CSV) ve dosya başına paralel (bölümlenmiş Parquet) taramasını
+karşılaştırır. Ölçümler geçici dosyalar üzerinde yapılır.
+
+Kullanım:
+    python benchmarks/bench_trends.py
+    python benchmarks/bench_trends.py 2000000
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_generator import TestDataGenerator
+from utils.columnar_storage import ColumnarStorage
+from utils.data_processor import DataProcessor
+
+DEFAULT_NUM_SAMPLES = 500_000
+
+
+def benchmark_trends(num_samples: int = DEFAULT_NUM_SAMPLES, chunk_size: int = 250_000):
+    """Tarama sürelerini saniye cinsinden ve medyan farkını sözlük olarak döndürür"""
+
+    processor = DataProcessor()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, 'mock_data.csv')
+        dataset_path = os.path.join(tmp_dir, 'dataset')
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            TestDataGenerator().save_mock_data(csv_path, num_samples=num_samples, seed=0)
+            ColumnarStorage().write(processor.load_data(csv_path, use_cache=False), dataset_path)
+
+            start = time.perf_counter()
+            full = processor.analyze_test_trends(processor.load_data(csv_path, use_cache=False))
+            in_memory = time.perf_counter() - start
+
+            start = time.perf_counter()
+            csv_scan = processor.analyze_test_trends_scan(csv_path, chunk_size=chunk_size)
+            csv_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            dataset_scan = processor.analyze_test_trends_scan(dataset_path)
+            dataset_seconds = time.perf_counter() - start
+
+    median_error = max(
+        abs(scan['risk_analysis']['median_risk'] - full['risk_analysis']['median_risk'])
+        for scan in (csv_scan, dataset_scan)
+    )
+
+    results = {
+        'load_and_analyze_seconds': in_memory,
+        'csv_scan_seconds': csv_seconds,
+        'dataset_scan_seconds': dataset_seconds,
+        'median_abs_error': median_error
+    }
+
+    print(f"Kayıt sayısı: {num_samples}, parça boyutu: {chunk_size}")
+    print(f"load_data + analyze_test_trends : {in_memory:8.3f} s")
+    print(f"tarama (CSV, parça parça)       : {csv_seconds:8.3f} s")
+    print(f"tarama (Parquet, paralel)       : {dataset_seconds:8.3f} s")
+    print(f"Medyan risk farkı (en fazla)    : {median_error:.2e}")
+
+    return results
+
+
+if __name__ == "__main__":
+    num_samples = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_SAMPLES
+    benchmark_trends(num_samples)
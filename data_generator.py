@@ -5,13 +5,35 @@ MIL-STD-810, ISO 16750, IEC 60068 standartlarına uygun mock data üretir.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
-import random
+import os
+import shutil
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils.risk_rules import RISK_RULES
+from utils.columnar_storage import ColumnarStorage
+from utils.append_dataset import AppendableDataset
+from utils.dataset_schema import DatasetSchema
+from utils.standards import STANDARD_LOOKUP
+
+# Eğitim verisi parametre örnekleme yöntemleri
+SAMPLERS = ('random', 'lhs', 'sobol', 'halton')
+
+# Model hedef değişkeninin risk eşiği (risk_score >= eşik -> FAIL)
+FAIL_THRESHOLD = 0.7
 
 class TestDataGenerator:
     """Çevresel test standartlarına uygun sentetik veri üretici"""
     
     def __init__(self):
+        # Üretilen verinin sütun tipleri
+        self.schema = DatasetSchema()
+        
+        # Kategori/test tipi -> standart tablosu (süreç genelinde bir kez derlenir)
+        self.standard_lookup = STANDARD_LOOKUP
+        
         # Test standartları limit değerleri
         self.test_limits = {
             'temperature': {
@@ -42,113 +64,326 @@ class TestDataGenerator:
             'humidity': ['humidity_resistance', 'condensation', 'water_splash'],
             'vibration': ['mechanical_vibration', 'acoustic_vibration', 'shock']
         }
+        
+        # Risk bantları - utils/risk_rules.json 'risk_score' kural seti (bir kez derlenir)
+        self.risk_rules = RISK_RULES
+        self.risk_bands = RISK_RULES.tables('risk_score')
     
-    def generate_test_data(self, num_samples: int = 1000) -> pd.DataFrame:
+    def generate_test_data(self, num_samples: int = 1000, seed: Optional[int] = None) -> pd.DataFrame:
         """Ana test verisi üretir"""
         
-        data = []
-        
-        for i in range(num_samples):
-            # Test parametreleri
-            temp = np.random.uniform(self.test_limits['temperature']['min'], 
-                                   self.test_limits['temperature']['max'])
-            humidity = np.random.uniform(self.test_limits['humidity']['min'], 
-                                       self.test_limits['humidity']['max'])
-            vibration = np.random.uniform(self.test_limits['vibration']['min'], 
-                                        self.test_limits['vibration']['max'])
-            pressure = np.random.uniform(self.test_limits['pressure']['min'], 
-                                       self.test_limits['pressure']['max'])
-            
-            # Test kategorisi seçimi
-            test_category = random.choice(list(self.test_categories.keys()))
-            test_type = random.choice(self.test_categories[test_category])
-            
-            # Risk hesaplama (basit kurallar)
-            risk_score = self._calculate_risk_score(temp, humidity, vibration, pressure)
-            
-            # Pass/Fail belirleme
-            pass_fail = 'PASS' if risk_score < 0.7 else 'FAIL'
-            
-            # Test süresi (dakika)
-            test_duration = np.random.randint(30, 480)  # 30 dakika - 8 saat
+        return pd.DataFrame(self._generate_columns(num_samples, rng=self._make_rng(seed)))
+    
+    def iter_test_data(self, num_samples: int, chunk_size: int = 100_000,
+                       seed: Optional[int] = None,
+                       reference_date: Optional[pd.Timestamp] = None) -> Iterator[pd.DataFrame]:
+        """Test verisini sabit boyutlu parçalar halinde üretir
+        
+        Her parça kök tohumdan türetilen kendi rastgele akışıyla üretilir; bellek
+        kullanımı veri boyutuyla değil parça boyutuyla sınırlıdır. test_id
+        numaralandırması parçalar boyunca devam eder.
+        """
+        
+        if reference_date is None:
+            reference_date = pd.Timestamp.now()
+        
+        for start, rng in self._chunk_streams(num_samples, chunk_size, seed):
+            size = min(chunk_size, num_samples - start)
+            yield pd.DataFrame(self._generate_columns(
+                size, start_id=start + 1, rng=rng, reference_date=reference_date
+            ))
+    
+    def iter_training_data(self, num_samples: int, chunk_size: int = 100_000,
+                           seed: Optional[int] = None, sampler: str = 'random',
+                           boundary_fraction: float = 0.0) -> Iterator[Tuple[pd.DataFrame, pd.Series]]:
+        """Eğitim verisini (X, y) parçaları halinde üretir
+        
+        sampler ve boundary_fraction generate_training_data ile aynıdır; tasarım her
+        parça içinde ayrı kurulur.
+        """
+        
+        for start, rng in self._chunk_streams(num_samples, chunk_size, seed):
+            size = min(chunk_size, num_samples - start)
+            X, y = self._generate_training_columns(size, rng, sampler, boundary_fraction)
             
-            # Test tarihi
-            test_date = pd.Timestamp.now() - pd.Timedelta(days=np.random.randint(1, 365))
+            index = pd.RangeIndex(start, start + size)
+            yield pd.DataFrame(X, index=index), pd.Series(y, index=index)
+    
+    def _resolve_seed(self, seed: Optional[int]) -> int:
+        """Tohum verilmemişse global np.random durumundan türetir (np.random.seed ile tekrarlanabilir)"""
+        
+        if seed is None:
+            seed = int(np.random.randint(np.iinfo(np.int64).max, dtype=np.int64))
+        return seed
+    
+    def _make_rng(self, seed: Optional[int] = None) -> np.random.Generator:
+        """Tek parça üretim için rastgele sayı üreteci oluşturur"""
+        
+        return np.random.default_rng(self._resolve_seed(seed))
+    
+    def _chunk_streams(self, num_samples: int, chunk_size: int,
+                       seed: Optional[int]) -> Iterator[Tuple[int, np.random.Generator]]:
+        """Her parça için (başlangıç satırı, bağımsız rastgele akış) çiftleri üretir"""
+        
+        if chunk_size <= 0:
+            raise ValueError(f"Geçersiz parça boyutu: {chunk_size}")
+        
+        num_chunks = -(-num_samples // chunk_size)
+        root = np.random.SeedSequence(self._resolve_seed(seed))
+        
+        for i, child in enumerate(root.spawn(num_chunks)):
+            yield i * chunk_size, np.random.default_rng(child)
+    
+    def _generate_measurements(self, num_samples: int, rng: np.random.Generator,
+                               sampler: str = 'random',
+                               boundary_fraction: float = 0.0,
+                               standards=None) -> Tuple[np.ndarray, ...]:
+        """Test parametrelerini ve risk skorlarını (yuvarlanmamış) üretir
+        
+        boundary_fraction > 0 ise örneklerin bu oranı, gürültüsüz risk skoru
+        FAIL eşiğine yakın olan aday noktalardan seçilir. standards (satır başına
+        standart) verilirse risk, her satırın standart ailesinin bantlarıyla hesaplanır.
+        """
+        
+        if not 0.0 <= boundary_fraction < 1.0:
+            raise ValueError(f"Geçersiz sınır örnekleme oranı: {boundary_fraction}")
+        
+        num_boundary = int(round(num_samples * boundary_fraction))
+        temp, humidity, vibration, pressure = self._sample_parameters(
+            num_samples - num_boundary, rng, sampler
+        )
+        
+        if num_boundary > 0:
+            near = self._sample_boundary(num_boundary, rng, sampler)
+            order = rng.permutation(num_samples)
+            temp, humidity, vibration, pressure = (
+                np.concatenate((design, extra))[order]
+                for design, extra in zip((temp, humidity, vibration, pressure), near)
+            )
+        
+        # Risk hesaplama (toplu)
+        risk_score = self.calculate_risk_scores(
+            temp, humidity, vibration, pressure,
+            noise=rng.normal(0, 0.03, num_samples), standards=standards
+        )
+        
+        return temp, humidity, vibration, pressure, risk_score
+    
+    def _sample_parameters(self, num_samples: int, rng: np.random.Generator,
+                           sampler: str = 'random') -> Tuple[np.ndarray, ...]:
+        """Sıcaklık, nem, titreşim ve basınç değerlerini test limitleri içinde örnekler
+        
+        'random' bağımsız düzgün dağılım, 'lhs' Latin hiperküp, 'sobol' ve 'halton'
+        karıştırılmış (scrambled) düşük tutarsızlıklı diziler kullanır.
+        """
+        
+        limits = self.test_limits
+        parameters = ['temperature', 'humidity', 'vibration', 'pressure']
+        
+        if sampler == 'random':
+            return tuple(rng.uniform(limits[p]['min'], limits[p]['max'], num_samples)
+                         for p in parameters)
+        
+        if sampler not in SAMPLERS:
+            raise ValueError(f"Desteklenmeyen örnekleme yöntemi: {sampler}")
+        
+        from scipy.stats import qmc
+        
+        engines = {
+            'lhs': qmc.LatinHypercube,
+            'sobol': qmc.Sobol,
+            'halton': qmc.Halton
+        }
+        engine = engines[sampler](d=len(parameters), seed=rng)
+        
+        with warnings.catch_warnings():
+            # Sobol dizisi 2'nin kuvveti olmayan örnek sayılarında denge uyarısı verir
+            warnings.simplefilter('ignore', UserWarning)
+            unit = engine.random(num_samples)
+        
+        low = np.array([limits[p]['min'] for p in parameters], dtype=np.float64)
+        high = np.array([limits[p]['max'] for p in parameters], dtype=np.float64)
+        scaled = qmc.scale(unit, low, high) if num_samples else unit
+        
+        return tuple(scaled[:, i] for i in range(len(parameters)))
+    
+    def _sample_boundary(self, num_samples: int, rng: np.random.Generator, sampler: str,
+                         width: float = 0.1, max_rounds: int = 20) -> Tuple[np.ndarray, ...]:
+        """Gürültüsüz risk skoru FAIL eşiğinin ±width aralığında kalan noktaları seçer
+        
+        Aday noktalar aynı örnekleyiciyle turlar halinde üretilir; max_rounds turda
+        yeterli nokta bulunamazsa eksik kısım son turun adaylarıyla tamamlanır.
+        """
+        
+        selected = []
+        found = 0
+        candidates = None
+        
+        for _ in range(max_rounds):
+            candidates = self._sample_parameters(max(num_samples * 8, 1024), rng, sampler)
+            risk = self.calculate_risk_scores(*candidates, noise=np.zeros(len(candidates[0])))
             
-            data.append({
-                'test_id': f'TEST_{i+1:06d}',
-                'test_category': test_category,
-                'test_type': test_type,
-                'temperature': round(temp, 2),
-                'humidity': round(humidity, 2),
-                'vibration': round(vibration, 2),
-                'pressure': round(pressure, 2),
-                'risk_score': round(risk_score, 3),
-                'pass_fail': pass_fail,
-                'test_duration': test_duration,
-                'test_date': test_date,
-                'standard': self._get_standard(test_category, test_type)
-            })
-        
-        return pd.DataFrame(data)
+            idx = np.flatnonzero(np.abs(risk - FAIL_THRESHOLD) <= width)[:num_samples - found]
+            selected.append(np.column_stack(candidates)[idx])
+            found += len(idx)
+            if found >= num_samples:
+                break
+        
+        if found < num_samples:
+            selected.append(np.column_stack(candidates)[:num_samples - found])
+        
+        points = np.concatenate(selected)
+        return tuple(points[:, i] for i in range(points.shape[1]))
     
-    def _calculate_risk_score(self, temp: float, humidity: float, 
-                             vibration: float, pressure: float) -> float:
-        """Risk skoru hesaplar (0-1 arası) - Güncellenmiş mantık"""
+    def _generate_training_columns(self, num_samples: int, rng: np.random.Generator,
+                                   sampler: str = 'random',
+                                   boundary_fraction: float = 0.0) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Yalnızca model özelliklerini ve hedef değişkeni üretir"""
         
-        risk = 0.0
+        temp, humidity, vibration, pressure, risk_score = self._generate_measurements(
+            num_samples, rng, sampler, boundary_fraction
+        )
+        
+        measurement_dtype = self.schema.dtypes['temperature']
+        X = {
+            'temperature': np.round(temp, 2).astype(measurement_dtype),
+            'humidity': np.round(humidity, 2).astype(measurement_dtype),
+            'vibration': np.round(vibration, 2).astype(measurement_dtype),
+            'pressure': np.round(pressure, 2).astype(measurement_dtype)
+        }
+        
+        # Hedef değişken (0: PASS, 1: FAIL)
+        y = (risk_score >= FAIL_THRESHOLD).astype(int)
+        
+        return X, y
+    
+    def _generate_columns(self, num_samples: int, start_id: int = 1,
+                          rng: Optional[np.random.Generator] = None,
+                          reference_date: Optional[pd.Timestamp] = None) -> Dict[str, np.ndarray]:
+        """Tüm sütunları satır döngüsü olmadan, tek seferde NumPy dizileri olarak üretir"""
+        
+        if rng is None:
+            rng = self._make_rng()
+        if reference_date is None:
+            reference_date = pd.Timestamp.now()
+        
+        # Test kategorisi seçimi - kategori eşit olasılıklı, test tipi kategori içinde eşit olasılıklı
+        categories = list(self.test_categories.keys())
+        type_pairs = [(category, test_type)
+                      for category in categories
+                      for test_type in self.test_categories[category]]
+        type_counts = np.array([len(self.test_categories[c]) for c in categories])
+        type_offsets = np.concatenate(([0], np.cumsum(type_counts)[:-1]))
+        
+        category_idx = rng.integers(0, len(categories), num_samples)
+        type_idx = type_offsets[category_idx] + (
+            rng.random(num_samples) * type_counts[category_idx]
+        ).astype(np.int64)
+        
+        # Etiketler şemadaki kategori kodlarına bir kez eşlenir, satırlar kod indeksleme ile kurulur
+        category_dtype, category_codes = self._label_codes('test_category', categories)
+        type_dtype, type_codes = self._label_codes('test_type', [t for _, t in type_pairs])
+        
+        # Standart sütunu kod tablosundan dizi indeksleme ile eşlenir; şema kategorileri
+        # tablo sırasını izlediğinden kodlar doğrudan kullanılır
+        standard_codes = self.standard_lookup.lookup_codes(
+            category_codes[category_idx], type_codes[type_idx]
+        )
+        standard = self.schema.categorical('standard', standard_codes)
+        
+        # Test parametreleri ve risk skorları - risk, satırın standart ailesinin bantlarıyla
+        temp, humidity, vibration, pressure, risk_score = self._generate_measurements(
+            num_samples, rng, standards=pd.Series(standard)
+        )
+        
+        # Pass/Fail belirleme (kod 0: PASS, kod 1: FAIL)
+        pass_fail_codes = (risk_score >= FAIL_THRESHOLD).astype(np.int8)
+        
+        # Test süresi (dakika) - 30 dakika - 8 saat
+        test_duration = rng.integers(30, 480, num_samples)
+        
+        # Test tarihi
+        days_ago = rng.integers(1, 365, num_samples)
+        test_date = reference_date - pd.to_timedelta(days_ago, unit='D')
         
-        # Sıcaklık riski - Daha katı kurallar
-        if temp > 65 or temp < -35:
-            risk += 0.5  # Çok yüksek risk
-        elif temp > 60 or temp < -30:
-            risk += 0.4  # Yüksek risk
-        elif temp > 50 or temp < -20:
-            risk += 0.3  # Orta-yüksek risk
-        elif temp > 40 or temp < -10:
-            risk += 0.2  # Orta risk
-        elif temp > 30 or temp < 0:
-            risk += 0.1  # Düşük risk
-        
-        # Nem riski - Daha katı kurallar
-        if humidity > 95:
-            risk += 0.4  # Çok yüksek risk
-        elif humidity > 90:
-            risk += 0.3  # Yüksek risk
-        elif humidity > 80:
-            risk += 0.2  # Orta risk
-        elif humidity < 15:
-            risk += 0.15  # Düşük risk
-        
-        # Titreşim riski - Daha katı kurallar
-        if vibration > 40:
-            risk += 0.5  # Çok yüksek risk
-        elif vibration > 30:
-            risk += 0.4  # Yüksek risk
-        elif vibration > 20:
-            risk += 0.3  # Orta risk
-        elif vibration > 10:
-            risk += 0.2  # Düşük risk
-        
-        # Basınç riski - Daha katı kurallar
-        if pressure < 850 or pressure > 1150:
-            risk += 0.3  # Yüksek risk
-        elif pressure < 900 or pressure > 1100:
-            risk += 0.2  # Orta risk
-        elif pressure < 950 or pressure > 1050:
-            risk += 0.1  # Düşük risk
+        dtypes = self.schema.dtypes
+        
+        return {
+            'test_id': np.arange(start_id, start_id + num_samples, dtype=dtypes['test_id']),
+            'test_category': pd.Categorical.from_codes(category_codes[category_idx], dtype=category_dtype),
+            'test_type': pd.Categorical.from_codes(type_codes[type_idx], dtype=type_dtype),
+            'temperature': np.round(temp, 2).astype(dtypes['temperature']),
+            'humidity': np.round(humidity, 2).astype(dtypes['humidity']),
+            'vibration': np.round(vibration, 2).astype(dtypes['vibration']),
+            'pressure': np.round(pressure, 2).astype(dtypes['pressure']),
+            'risk_score': np.round(risk_score, 3).astype(dtypes['risk_score']),
+            'pass_fail': self.schema.categorical('pass_fail', pass_fail_codes),
+            'test_duration': test_duration.astype(dtypes['test_duration']),
+            'test_date': test_date.astype(dtypes['test_date']),
+            'standard': standard
+        }
+    
+    def _label_codes(self, column: str, labels: List[str]) -> Tuple[pd.CategoricalDtype, np.ndarray]:
+        """Etiketlerin şemadaki kategori kodlarını döndürür; şemada olmayan etiketler sona eklenir"""
+        
+        categories = list(self.schema.dtypes[column].categories)
+        categories += [label for label in dict.fromkeys(labels) if label not in categories]
+        
+        codes = np.array([categories.index(label) for label in labels], dtype=np.int8)
+        return pd.CategoricalDtype(categories), codes
+    
+    def calculate_risk_scores(self, temp: np.ndarray, humidity: np.ndarray,
+                              vibration: np.ndarray, pressure: np.ndarray,
+                              noise: np.ndarray = None, standards=None) -> np.ndarray:
+        """Risk skorlarını dizi halinde tek çağrıda hesaplar (0-1 arası)
+        
+        _calculate_risk_score ile aynı bant eşiklerini ve kombinasyon riskini uygular;
+        aynı gürültü değerleri verildiğinde sonuçlar skaler sürümle birebir aynıdır.
+        noise verilmezse global np.random.normal(0, 0.03) ile üretilir.
+        standards (tek ad veya satır başına adlar) verilirse standart ailesinin bantları kullanılır.
+        """
+        
+        bands = self.risk_rules.evaluate('risk_score', {
+            'temperature': temp, 'humidity': humidity, 'vibration': vibration, 'pressure': pressure
+        }, standards)
+        temp_risk, temp_high = bands['temperature']
+        humidity_risk, humidity_high = bands['humidity']
+        vibration_risk, vibration_high = bands['vibration']
+        pressure_risk, pressure_high = bands['pressure']
+        
+        # Toplama sırası skaler sürümle aynı tutulur (kayan nokta eşitliği için)
+        risk = temp_risk + humidity_risk + vibration_risk + pressure_risk
         
         # Kombinasyon riski - Birden fazla yüksek parametre varsa ek risk
+        high_risk_params = (temp_high.astype(np.int8) + humidity_high
+                            + vibration_high + pressure_high)
+        risk = risk + np.where(high_risk_params >= 2, 0.2, 0.0)
+        
+        # Rastgele faktör (daha az etkili)
+        if noise is None:
+            noise = np.random.normal(0, 0.03, risk.shape)
+        risk = risk + noise
+        
+        return np.clip(risk, 0.0, 1.0)
+    
+    def _calculate_risk_score(self, temp: float, humidity: float, 
+                             vibration: float, pressure: float,
+                             standard: Optional[str] = None) -> float:
+        """Risk skoru hesaplar (0-1 arası) - 'risk_score' kural setinin bantlarıyla"""
+        
+        bands = self.risk_bands if standard is None else self.risk_rules.tables('risk_score', standard)
+        
+        risk = 0.0
         high_risk_params = 0
-        if temp > 60 or temp < -30:
-            high_risk_params += 1
-        if humidity > 90:
-            high_risk_params += 1
-        if vibration > 30:
-            high_risk_params += 1
-        if pressure < 900 or pressure > 1100:
-            high_risk_params += 1
         
+        # Parametre bant riskleri; yüksek risk bandındaki parametreler sayılır
+        for name, value in (('temperature', temp), ('humidity', humidity),
+                            ('vibration', vibration), ('pressure', pressure)):
+            band_risk, is_high = bands[name].lookup_one_with_flag(value)
+            risk += band_risk
+            high_risk_params += is_high
+        
+        # Kombinasyon riski - Birden fazla yüksek parametre varsa ek risk
         if high_risk_params >= 2:
             risk += 0.2  # Kombinasyon riski
         
@@ -160,48 +395,202 @@ class TestDataGenerator:
     def _get_standard(self, category: str, test_type: str) -> str:
         """Test standardını belirler"""
         
-        standards = {
-            'temperature': {
-                'high_temp': 'MIL-STD-810 Method 501.7',
-                'low_temp': 'MIL-STD-810 Method 502.7',
-                'thermal_shock': 'IEC 60068-2-14'
-            },
-            'humidity': {
-                'humidity_resistance': 'MIL-STD-810 Method 507.7',
-                'condensation': 'ISO 16750-4',
-                'water_splash': 'IEC 60529'
-            },
-            'vibration': {
-                'mechanical_vibration': 'MIL-STD-810 Method 514.8',
-                'acoustic_vibration': 'MIL-STD-810 Method 515.8',
-                'shock': 'IEC 60068-2-27'
-            }
-        }
+        return self.standard_lookup.get(category, test_type)
+    
+    def generate_training_data(self, num_samples: int = 5000, seed: Optional[int] = None,
+                               sampler: str = 'random',
+                               boundary_fraction: float = 0.0) -> Tuple[pd.DataFrame, pd.Series]:
+        """Eğitim için veri üretir
+        
+        sampler: 'random' (varsayılan), 'lhs', 'sobol' veya 'halton'. Düşük
+        tutarsızlıklı tasarımlar dört boyutlu parametre uzayını daha az örnekle kaplar.
+        boundary_fraction: örneklerin risk eşiği (0.7) çevresinden seçilecek oranı.
+        """
         
-        return standards.get(category, {}).get(test_type, 'ISO 16750')
+        # Özellikler ve hedef değişken (0: PASS, 1: FAIL)
+        X, y = self._generate_training_columns(num_samples, self._make_rng(seed),
+                                               sampler, boundary_fraction)
+        
+        return pd.DataFrame(X), pd.Series(y)
     
-    def generate_training_data(self, num_samples: int = 5000) -> Tuple[pd.DataFrame, pd.Series]:
-        """Eğitim için veri üretir"""
+    def generate_test_data_sharded(self, num_samples: int, n_shards: Optional[int] = None,
+                                   seed: Optional[int] = None, max_workers: Optional[int] = None,
+                                   reference_date: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Test verisini paralel süreçlerde, parçalara (shard) bölerek üretir
         
-        df = self.generate_test_data(num_samples)
+        Her shard kök tohumdan SeedSequence.spawn ile türetilen bağımsız bir
+        np.random.Generator akışı kullanır; çıktı işçi sayısından bağımsızdır ve
+        aynı (seed, num_samples, n_shards, reference_date) için birebir aynıdır.
+        """
         
-        # Özellikler
-        X = df[['temperature', 'humidity', 'vibration', 'pressure']]
+        tasks = self._shard_tasks(num_samples, n_shards, seed, reference_date)
+        shards = self._run_shards(_generate_shard_columns, tasks, max_workers)
         
-        # Hedef değişken (0: PASS, 1: FAIL)
-        y = (df['pass_fail'] == 'FAIL').astype(int)
+        # Shard'lar aynı kategori tiplerini kullandığından birleştirmede tipler korunur
+        return pd.concat([pd.DataFrame(shard) for shard in shards], ignore_index=True)
+    
+    def _shard_tasks(self, num_samples: int, n_shards: Optional[int], seed: Optional[int],
+                     reference_date: Optional[pd.Timestamp],
+                     outputs: Optional[List[tuple]] = None) -> List[tuple]:
+        """Shard sınırlarını ve her shard'ın bağımsız tohum dizisini hazırlar"""
         
-        return X, y
+        if n_shards is None:
+            n_shards = os.cpu_count() or 1
+        if n_shards <= 0:
+            raise ValueError(f"Geçersiz shard sayısı: {n_shards}")
+        if reference_date is None:
+            reference_date = pd.Timestamp.now()
+        
+        # Satırlar shard'lara olabildiğince eşit dağıtılır
+        base, extra = divmod(num_samples, n_shards)
+        sizes = [base + (1 if i < extra else 0) for i in range(n_shards)]
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        
+        seed_sequences = np.random.SeedSequence(self._resolve_seed(seed)).spawn(n_shards)
+        if outputs is None:
+            outputs = [None] * n_shards
+        
+        return [
+            (self, size, int(start) + 1, seed_sequence, reference_date, output)
+            for size, start, seed_sequence, output in zip(sizes, starts, seed_sequences, outputs)
+        ]
+    
+    def _run_shards(self, worker, tasks: List[tuple], max_workers: Optional[int]) -> list:
+        """Shard görevlerini süreç havuzunda (veya tek shard'da aynı süreçte) sırayla çalıştırır"""
+        
+        if max_workers is None:
+            max_workers = min(len(tasks), os.cpu_count() or 1)
+        
+        if max_workers <= 1 or len(tasks) <= 1:
+            return [worker(task) for task in tasks]
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(worker, tasks))
     
-    def save_mock_data(self, filename: str = 'data/mock_data.csv'):
-        """Mock veriyi CSV dosyasına kaydeder"""
+    def save_mock_data(self, filename: str = 'data/mock_data.csv', num_samples: int = 2000,
+                       chunk_size: int = 100_000, seed: Optional[int] = None,
+                       n_shards: int = 1, max_workers: Optional[int] = None,
+                       reference_date: Optional[pd.Timestamp] = None,
+                       file_format: str = 'csv', append: bool = False):
+        """Mock veriyi parça parça kaydeder
+        
+        file_format 'csv' ise tek CSV dosyası, 'parquet' / 'feather' ise filename
+        dizininde test_category ve test_date ayına göre bölümlenmiş veri seti yazılır.
+        n_shards > 1 ise her shard ayrı süreçte yazılır; bu modda bellek kullanımını
+        shard boyutu belirler. seed ve reference_date sabitlendiğinde içerik birebir
+        tekrarlanabilir.
+        
+        append=True ise (yalnızca parquet / feather) mevcut veri seti silinmez; yeni
+        kayıtlar test_id numaralandırması sürdürülerek eklenir ve manifest güncellenir.
+        """
+        
+        if append:
+            return self._append_mock_data(filename, file_format, num_samples, chunk_size,
+                                          seed, reference_date)
+        
+        storage = None
+        if file_format != 'csv':
+            storage = ColumnarStorage(file_format)
+            if os.path.isdir(filename):
+                shutil.rmtree(filename)
+        
+        if n_shards > 1:
+            pass_count = self._save_sharded(filename, file_format, num_samples, n_shards, seed,
+                                            max_workers, reference_date)
+        else:
+            pass_count = 0
+            chunks = self.iter_test_data(num_samples, chunk_size, seed, reference_date)
+            
+            for i, chunk in enumerate(chunks):
+                if storage is None:
+                    self.schema.with_display_ids(chunk).to_csv(
+                        filename, index=False, mode='w' if i == 0 else 'a', header=(i == 0))
+                else:
+                    storage.write(chunk, filename, basename=f'part-{i:05d}')
+                pass_count += int((chunk['pass_fail'] == 'PASS').sum())
         
-        df = self.generate_test_data(2000)
-        df.to_csv(filename, index=False)
         print(f"Mock data kaydedildi: {filename}")
-        print(f"Toplam kayıt sayısı: {len(df)}")
-        print(f"PASS oranı: {(df['pass_fail'] == 'PASS').mean():.2%}")
-        print(f"FAIL oranı: {(df['pass_fail'] == 'FAIL').mean():.2%}")
+        print(f"Toplam kayıt sayısı: {num_samples}")
+        print(f"PASS oranı: {pass_count / num_samples:.2%}")
+        print(f"FAIL oranı: {(num_samples - pass_count) / num_samples:.2%}")
+    
+    def _append_mock_data(self, filename: str, file_format: str, num_samples: int,
+                          chunk_size: int, seed: Optional[int],
+                          reference_date: Optional[pd.Timestamp]) -> int:
+        """Yeni kayıtları eklemeli veri setine parça parça ekler, son izleme değerini döndürür"""
+        
+        if file_format == 'csv':
+            raise ValueError("Ekleme modu yalnızca 'parquet' ve 'feather' formatlarını destekler")
+        
+        dataset = AppendableDataset(filename, file_format)
+        first_id = dataset.watermark + 1
+        pass_count = 0
+        
+        for chunk in self.iter_test_data(num_samples, chunk_size, seed, reference_date):
+            dataset.append(chunk)
+            pass_count += int((chunk['pass_fail'] == 'PASS').sum())
+        
+        print(f"Mock data eklendi: {filename} (test_id {first_id} - {dataset.watermark})")
+        print(f"Toplam kayıt sayısı: {dataset.row_count}")
+        print(f"Yeni kayıtlarda PASS oranı: {pass_count / max(num_samples, 1):.2%}")
+        
+        return dataset.watermark
+    
+    def _save_sharded(self, filename: str, file_format: str, num_samples: int, n_shards: int,
+                      seed: Optional[int], max_workers: Optional[int],
+                      reference_date: Optional[pd.Timestamp]) -> int:
+        """Shard'ları paralel olarak yazar, toplam PASS sayısını döndürür
+        
+        Sütunlu formatlarda her shard veri setine kendi dosyalarını ekler; CSV'de
+        shard'lar geçici dosyalara yazılıp sırayla birleştirilir.
+        """
+        
+        if file_format != 'csv':
+            outputs = [(filename, file_format, i) for i in range(n_shards)]
+            tasks = self._shard_tasks(num_samples, n_shards, seed, reference_date, outputs)
+            return sum(self._run_shards(_write_shard, tasks, max_workers))
+        
+        target_dir = os.path.dirname(os.path.abspath(filename))
+        
+        with tempfile.TemporaryDirectory(dir=target_dir) as tmp_dir:
+            shard_files = [os.path.join(tmp_dir, f'shard_{i:05d}.csv') for i in range(n_shards)]
+            outputs = [(shard_file, file_format, i) for i, shard_file in enumerate(shard_files)]
+            tasks = self._shard_tasks(num_samples, n_shards, seed, reference_date, outputs)
+            pass_counts = self._run_shards(_write_shard, tasks, max_workers)
+            
+            # Başlık yalnızca ilk shard dosyasında bulunur
+            with open(filename, 'wb') as out:
+                for shard_file in shard_files:
+                    with open(shard_file, 'rb') as part:
+                        shutil.copyfileobj(part, out)
+        
+        return sum(pass_counts)
+
+
+def _generate_shard_columns(task: tuple) -> Dict[str, np.ndarray]:
+    """İşçi süreçte tek bir shard'ın sütunlarını üretir"""
+    
+    generator, num_samples, start_id, seed_sequence, reference_date, _ = task
+    
+    return generator._generate_columns(
+        num_samples, start_id=start_id,
+        rng=np.random.default_rng(seed_sequence), reference_date=reference_date
+    )
+
+
+def _write_shard(task: tuple) -> int:
+    """İşçi süreçte tek bir shard'ı üretip yazar, PASS sayısını döndürür"""
+    
+    generator = task[0]
+    target, file_format, shard_index = task[-1]
+    df = pd.DataFrame(_generate_shard_columns(task))
+    
+    if file_format == 'csv':
+        generator.schema.with_display_ids(df).to_csv(target, index=False, header=(shard_index == 0))
+    else:
+        ColumnarStorage(file_format).write(df, target, basename=f'shard-{shard_index:05d}')
+    
+    return int((df['pass_fail'] == 'PASS').sum())
 
 if __name__ == "__main__":
     # Test verisi üretimi
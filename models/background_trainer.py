@@ -0,0 +1,115 @@
+"""
+TestScope AI - Arka Plan Model Eğitimi
+ModelTrainer.full_training_pipeline'ı ayrı bir süreçte çalıştırır ve ilerlemeyi
+kuyruk üzerinden bildirir. Yeni model dosyası atomik olarak yerine taşındığında
+ModelRegistry sonraki erişimde yeni anlık görüntüyü yükler; o zamana kadar eski
+model tahmin vermeye devam eder.
+"""
+
+import multiprocessing as mp
+import queue
+import threading
+import time
+import traceback
+from typing import Optional
+
+
+def _training_worker(num_samples: int, model_path: str, events):
+    """İşçi süreçte eğitim pipeline'ını çalıştırır, ilerlemeyi kuyruğa yazar"""
+
+    from models.model_trainer import ModelTrainer
+
+    try:
+        trainer = ModelTrainer()
+        trainer.full_training_pipeline(
+            num_samples,
+            progress=lambda fraction, message: events.put(('progress', fraction, message)),
+            model_path=model_path
+        )
+        events.put(('done', 1.0, "Yeni model devreye alındı"))
+    except Exception:
+        events.put(('failed', 0.0, traceback.format_exc()))
+
+
+class BackgroundTrainer:
+    """Süreç başına tek arka plan eğitim işi ve ilerleme durumu"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._context = mp.get_context('spawn')
+        self._process = None
+        self._events = None
+
+        self.state = 'idle'  # idle | running | done | failed
+        self.progress = 0.0
+        self.message = ''
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.poll() == 'running'
+
+    def start(self, num_samples: int = 3000,
+              model_path: str = 'models/risk_predictor.joblib') -> bool:
+        """Eğitimi başlatır; zaten çalışan bir eğitim varsa False döndürür"""
+
+        with self._lock:
+            if self._poll_locked() == 'running':
+                return False
+
+            self._events = self._context.Queue()
+            self._process = self._context.Process(
+                # daemon olmayan süreç: eğitim kendi süreç havuzunu açar
+                target=_training_worker, args=(num_samples, model_path, self._events)
+            )
+            self._process.start()
+
+            self.state = 'running'
+            self.progress = 0.0
+            self.message = "Eğitim başlatıldı"
+            self.error = None
+            self.started_at = time.time()
+            self.finished_at = None
+            return True
+
+    def poll(self) -> str:
+        """Bekleyen ilerleme olaylarını işler ve güncel durumu döndürür"""
+
+        with self._lock:
+            return self._poll_locked()
+
+    def _poll_locked(self) -> str:
+        if self.state != 'running':
+            return self.state
+
+        while True:
+            try:
+                kind, fraction, message = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            self.progress = fraction
+            if kind == 'failed':
+                self.state, self.error, self.message = 'failed', message, "Eğitim başarısız"
+            else:
+                self.message = message
+                if kind == 'done':
+                    self.state = 'done'
+
+        if self.state != 'running':
+            self.finished_at = time.time()
+            self._process.join(timeout=1)
+        elif not self._process.is_alive():
+            # İşçi olay bırakmadan sonlandı (ör. bellek yetersizliği)
+            self.state = 'failed'
+            self.error = f"Eğitim süreci beklenmedik şekilde sonlandı (çıkış kodu {self._process.exitcode})"
+            self.message = "Eğitim başarısız"
+            self.finished_at = time.time()
+
+        return self.state
+
+
+# Süreç genelinde tek eğitim işi (paylaşılan sunucuda tüm oturumlar aynı işi görür)
+TRAINING_JOB = BackgroundTrainer()
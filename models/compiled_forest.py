@@ -0,0 +1,193 @@
+"""
+TestScope AI - Derlenmiş Ağaç Topluluğu Çıkarımı
+Eğitilmiş RandomForestClassifier'ı düz NumPy düğüm dizilerine derler; StandardScaler
+parametreleri motora gömülür, ağaçlar tüm satırlar için birlikte gezilir.
+"""
+
+import numpy as np
+from typing import Optional
+import json
+import os
+
+
+class CompiledForest:
+    """Düz düğüm dizileri üzerinde vektörel orman çıkarımı
+
+    Tüm ağaçların düğümleri tek dizilerde tutulur (feature, threshold, children,
+    leaf_values). Yaprak düğümler kendilerine döner; böylece her adımda tüm ağaçlar
+    bir seviye birlikte ilerletilir ve en derin ağaç kadar adım atılır.
+
+    sklearn ağaçları özellikleri float32'ye çevirip float64 eşikle karşılaştırır.
+    Eşikler bu yüzden float32'ye aşağı yuvarlanarak saklanır (``x32 <= t`` ile
+    ``x32 <= floor32(t)`` eşdeğerdir) ve ölçekleme sklearn ile aynı sırayla yapılır;
+    eşiklerin ham uzaya katlanması veri ızgarasındaki eşitliklerde farklı dal seçtirir.
+
+    Motor tek satır ve küçük girdiler içindir (tek satır ~0,1 ms, sklearn ~8-13 ms).
+    Yaklaşık 8000 satırdan büyük toplu girdilerde sklearn'ün derlenmiş ağaç gezintisi
+    daha hızlıdır; RiskPredictor bu girdileri sklearn ormanına yönlendirir.
+    """
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, children: np.ndarray,
+                 leaf_values: np.ndarray, roots: np.ndarray, depth: int,
+                 classes: np.ndarray, mean: Optional[np.ndarray] = None,
+                 scale: Optional[np.ndarray] = None):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.leaf_values = leaf_values
+        self.roots = roots
+        self.depth = depth
+        self.classes = classes
+        self.mean = mean
+        self.scale = scale
+
+    @classmethod
+    def from_sklearn(cls, forest, scaler=None) -> 'CompiledForest':
+        """Eğitilmiş ormanı (ve isteğe bağlı StandardScaler'ı) derler"""
+
+        features, thresholds, children, values, roots = [], [], [], [], []
+        offset = 0
+        depth = 0
+
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            is_leaf = tree.children_left < 0
+            node_ids = np.arange(tree.node_count, dtype=np.int32) + offset
+
+            # Yaprakta koşul daima doğru ve sol çocuk düğümün kendisidir
+            threshold = np.where(is_leaf, np.inf, tree.threshold)
+            left = np.where(is_leaf, node_ids, tree.children_left + offset)
+            right = np.where(is_leaf, node_ids, tree.children_right + offset)
+
+            # sklearn >= 1.4 yapraklarda zaten oranları saklar ve predict_proba bunları
+            # olduğu gibi döndürür; eski sürümlerin ağırlıklı sayıları normalize edilir
+            value = tree.value[:, 0, :].astype(np.float64)
+            totals = value.sum(axis=1, keepdims=True)
+            if not np.allclose(totals, 1.0):
+                value = value / totals
+
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(threshold)
+            # Çocuklar iç içe saklanır: düğüm i için sol 2i, sağ 2i + 1
+            children.append(np.column_stack((left, right)).ravel())
+            values.append(value)
+            roots.append(offset)
+
+            offset += tree.node_count
+            depth = max(depth, tree.max_depth)
+
+        return cls(
+            feature=np.concatenate(features).astype(np.int32),
+            threshold=cls._floor_float32(np.concatenate(thresholds)),
+            children=np.concatenate(children).astype(np.int32),
+            leaf_values=np.concatenate(values),
+            roots=np.array(roots, dtype=np.int32),
+            depth=depth,
+            classes=np.asarray(forest.classes_),
+            mean=None if scaler is None else scaler.mean_,
+            scale=None if scaler is None else scaler.scale_
+        )
+
+    @staticmethod
+    def _floor_float32(values: np.ndarray) -> np.ndarray:
+        """float64 değerleri kendilerini aşmayan en büyük float32 değere yuvarlar"""
+
+        rounded = values.astype(np.float32)
+        too_big = rounded.astype(np.float64) > values
+        rounded[too_big] = np.nextafter(rounded[too_big], np.float32(-np.inf))
+        return rounded
+
+    # Diske ayrı .npy dosyaları olarak yazılan diziler
+    ARRAY_FIELDS = ('feature', 'threshold', 'children', 'leaf_values', 'roots', 'classes',
+                    'mean', 'scale')
+
+    def save(self, directory: str):
+        """Dizileri ayrı .npy dosyaları olarak yazar (bellek eşlemeli yüklenebilir)"""
+
+        os.makedirs(directory, exist_ok=True)
+        for name in self.ARRAY_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                np.save(os.path.join(directory, f'{name}.npy'), value)
+
+        with open(os.path.join(directory, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'depth': self.depth}, f)
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: Optional[str] = 'r') -> 'CompiledForest':
+        """save ile yazılmış motoru yükler; varsayılan olarak diziler bellek eşlemelidir
+
+        Aynı dosyaları eşleyen süreçler fiziksel bellek sayfalarını paylaşır.
+        """
+
+        arrays = {}
+        for name in cls.ARRAY_FIELDS:
+            path = os.path.join(directory, f'{name}.npy')
+            # np.asarray kopyalamaz; memmap alt sınıfının işlem başı ek yükünü kaldırır
+            arrays[name] = np.asarray(np.load(path, mmap_mode=mmap_mode)) if os.path.exists(path) else None
+
+        with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+
+        return cls(depth=meta['depth'], **arrays)
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """StandardScaler.transform ile aynı aritmetikle ölçekler ve float32'ye çevirir"""
+
+        if self.mean is not None:
+            # sklearn ortalama ve ölçeği girdi tipine çevirip o tipte hesaplar
+            X = (X - self.mean.astype(X.dtype)) / self.scale.astype(X.dtype)
+        return np.ascontiguousarray(X, dtype=np.float32)
+
+    def predict_proba(self, X, chunk_size: int = 512) -> np.ndarray:
+        """Ham (ölçeklenmemiş) özelliklerden sınıf olasılıklarını döndürür
+
+        Olasılıklar sklearn predict_proba ile bit düzeyinde aynıdır. Tek satır /
+        küçük girdi yoludur; büyük toplu skorlama için sklearn ormanı daha hızlıdır.
+        """
+
+        X = np.asarray(X)
+        if X.dtype != np.float32:
+            X = X.astype(np.float64)
+        if X.ndim == 1:
+            X = X[None, :]
+        X = self.transform(X)
+
+        proba = np.empty((len(X), self.leaf_values.shape[1]), dtype=np.float64)
+        for start in range(0, len(X), chunk_size):
+            proba[start:start + chunk_size] = self._predict_chunk(X[start:start + chunk_size])
+
+        return proba
+
+    def predict(self, X, chunk_size: int = 512) -> np.ndarray:
+        """Olasılığı en yüksek sınıf etiketlerini döndürür"""
+
+        return self.classes[np.argmax(self.predict_proba(X, chunk_size), axis=1)]
+
+    def _predict_chunk(self, X: np.ndarray) -> np.ndarray:
+        """(ağaç, satır) düğüm dizisini yapraklara kadar ilerletip yaprak değerlerinin ortalamasını alır"""
+
+        n, n_features = X.shape
+        flat = X.ravel()
+        row_offsets = np.arange(n, dtype=np.int32) * n_features
+
+        nodes = np.repeat(self.roots[:, None], n, axis=1)
+
+        for _ in range(self.depth):
+            values = flat.take(row_offsets + self.feature.take(nodes))
+            go_right = values > self.threshold.take(nodes)
+            nodes = self.children.take(2 * nodes + go_right)
+
+        return self.leaf_values.take(nodes, axis=0).mean(axis=0)
+
+
+def compile_model(model, scaler=None) -> Optional[CompiledForest]:
+    """Desteklenen modeller için derlenmiş motoru döndürür, diğerleri için None"""
+
+    if hasattr(model, 'estimators_') and hasattr(model.estimators_[0], 'tree_'):
+        return CompiledForest.from_sklearn(model, scaler)
+    return None
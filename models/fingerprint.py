@@ -0,0 +1,17 @@
+"""
+TestScope AI - Model Dosyası Parmak İzi
+Model dosyasından türetilen yapıtların (derlenmiş motor, risk yüzeyi) hangi model
+sürümüne ait olduğunu belirlemek için kullanılır.
+"""
+
+import hashlib
+
+
+def model_fingerprint(model_path: str) -> str:
+    """Model dosyası içeriğinin SHA-1 özeti (model sürümü kimliği)"""
+
+    digest = hashlib.sha1()
+    with open(model_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,239 @@
+"""
+TestScope AI - Bütçeli Hiperparametre Araması
+Yarı-rastgele (Sobol) ya da rastgele örneklenen adayları ardışık yarılama
+(successive halving) ile eler: ilk turlarda adaylar verinin ve ağaç sayısının
+küçük bir kesriyle değerlendirilir, yalnızca en iyi 1/eta'lık kısım bir sonraki
+tura daha büyük kaynakla geçer. Biten denemeler JSONL dosyasına eklenir;
+kesilen bir arama aynı veriyle yeniden başlatıldığında kayıtlı sonuçlar
+yeniden kullanılır.
+"""
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.model_selection import StratifiedKFold, cross_val_score, train_test_split
+from scipy.stats import qmc
+from typing import Dict, List, Optional
+import hashlib
+import json
+import math
+import os
+import time
+
+
+class BudgetedSearch:
+    """Zaman bütçeli, kaldığı yerden devam edebilen ardışık yarılama araması
+
+    Kaynak hem örnek sayısıdır hem de (varsa) ağaç sayısı: tur r'de kesir
+    eta^(r - son tur) olur, son tur tam veri ve adayın kendi n_estimators değeriyle
+    çalışır. Süre bütçesi dolarsa arama durur ve en iyi aday, tüm adaylarının aynı
+    kaynakla skorlandığı son tamamlanmış turdan seçilir; yarım kalan tur yalnızca
+    önceki turun ilk sıralarını içerdiğinden seçimde kullanılmaz (hiçbir tur
+    tamamlanmadıysa ilk turun biten denemelerinden seçilir).
+    """
+
+    SAMPLERS = ('sobol', 'random')
+
+    def __init__(self, base_model, param_space: Dict[str, List], n_candidates: int = 27,
+                 eta: int = 3, sampler: str = 'sobol', cv: int = 3,
+                 time_budget: Optional[float] = None, min_samples: int = 300,
+                 trials_path: Optional[str] = None, scoring: str = 'f1_weighted',
+                 n_jobs: int = -1, seed: int = 42):
+        if sampler not in self.SAMPLERS:
+            raise ValueError(f"Desteklenmeyen örnekleyici: {sampler}")
+        if eta < 2:
+            raise ValueError(f"Geçersiz eta: {eta}")
+        if n_candidates < 1:
+            raise ValueError(f"Geçersiz aday sayısı: {n_candidates}")
+
+        self.base_model = base_model
+        self.param_space = param_space
+        self.n_candidates = n_candidates
+        self.eta = eta
+        self.sampler = sampler
+        self.cv = cv
+        self.time_budget = time_budget
+        self.min_samples = min_samples
+        self.trials_path = trials_path
+        self.scoring = scoring
+        self.n_jobs = n_jobs
+        self.seed = seed
+
+        self.trials: List[Dict] = []
+        self.best_params_: Optional[Dict] = None
+        self.best_score_: Optional[float] = None
+        self.best_estimator_ = None
+        self.fits = 0
+        self.reused = 0
+        self.budget_exhausted = False
+
+    @property
+    def n_rungs(self) -> int:
+        return max(1, math.ceil(math.log(self.n_candidates, self.eta)))
+
+    def sample_candidates(self) -> List[Dict]:
+        """Parametre uzayından tekrarsız aday kümesi örnekler"""
+
+        names = list(self.param_space)
+        if self.sampler == 'sobol':
+            # Sobol dengesi 2'nin kuvveti kadar nokta ister; fazlası atılır
+            m = max(0, math.ceil(math.log2(self.n_candidates)))
+            points = qmc.Sobol(len(names), scramble=True, seed=self.seed).random_base2(m)
+            points = points[:self.n_candidates]
+        else:
+            points = np.random.default_rng(self.seed).random((self.n_candidates, len(names)))
+
+        candidates, seen = [], set()
+        for point in points:
+            params = {}
+            for name, u in zip(names, point):
+                values = self.param_space[name]
+                params[name] = values[min(int(u * len(values)), len(values) - 1)]
+
+            key = json.dumps(params, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                candidates.append(params)
+
+        return candidates
+
+    def fit(self, X, y) -> 'BudgetedSearch':
+        """Aramayı çalıştırır ve en iyi modeli tüm veriyle yeniden eğitir"""
+
+        X = np.asarray(X)
+        y = np.asarray(y)
+        start = time.perf_counter()
+
+        data_key = self._data_fingerprint(X, y)
+        past = self._load_trials(data_key)
+
+        candidates = self.sample_candidates()
+        completed = []
+        partial = []
+
+        for rung in range(self.n_rungs):
+            fraction = float(self.eta) ** (rung - self.n_rungs + 1)
+            X_rung, y_rung = self._subsample(X, y, fraction)
+
+            results = []
+            for params in candidates:
+                if self.time_budget is not None and time.perf_counter() - start > self.time_budget:
+                    self.budget_exhausted = True
+                    break
+
+                trial_params = self._rung_params(params, fraction)
+                trial = {
+                    'data': data_key,
+                    'model': type(self.base_model).__name__,
+                    'params': params,
+                    'fraction': fraction,
+                    'n_samples': len(y_rung),
+                    'fit_params': trial_params,
+                    'cv': self.cv,
+                    'scoring': self.scoring,
+                    'seed': self.seed
+                }
+                key = self._trial_key(trial)
+
+                if key in past:
+                    trial['score'] = past[key]
+                    self.reused += 1
+                else:
+                    model = clone(self.base_model).set_params(**trial_params)
+                    folds = StratifiedKFold(self.cv, shuffle=True, random_state=self.seed)
+                    scores = cross_val_score(model, X_rung, y_rung, cv=folds,
+                                             scoring=self.scoring, n_jobs=self.n_jobs)
+                    trial['score'] = float(scores.mean())
+                    self.fits += self.cv
+                    self._save_trial(trial)
+
+                self.trials.append(trial)
+                results.append(trial)
+
+            if self.budget_exhausted:
+                partial = results
+                break
+            completed = results
+
+            # En iyi 1/eta'lık kısım sonraki tura geçer
+            results = sorted(results, key=lambda t: t['score'], reverse=True)
+            candidates = [t['params'] for t in results[:max(1, len(results) // self.eta)]]
+
+        # Skorlar yalnızca aynı kaynakla değerlendirilmiş denemeler arasında karşılaştırılır
+        rung_results = completed or partial
+        if not rung_results:
+            raise ValueError("Süre bütçesi hiçbir deneme tamamlanmadan doldu")
+
+        best = max(rung_results, key=lambda t: t['score'])
+        self.best_params_ = best['params']
+        self.best_score_ = best['score']
+        self.best_estimator_ = clone(self.base_model).set_params(**self.best_params_).fit(X, y)
+
+        return self
+
+    def _rung_params(self, params: Dict, fraction: float) -> Dict:
+        """Tur kesrine göre ölçeklenmiş ağaç sayısı ile eğitim parametreleri"""
+
+        trial_params = dict(params)
+        n_estimators = trial_params.get('n_estimators', self.base_model.get_params().get('n_estimators'))
+        if n_estimators is not None:
+            trial_params['n_estimators'] = max(10, int(round(n_estimators * fraction)))
+        return trial_params
+
+    def _subsample(self, X: np.ndarray, y: np.ndarray, fraction: float):
+        """Sınıf oranlarını koruyan sabit tohumlu alt örnek"""
+
+        n_samples = max(self.min_samples, int(round(len(y) * fraction)))
+        if n_samples >= len(y):
+            return X, y
+
+        X_sub, _, y_sub, _ = train_test_split(
+            X, y, train_size=n_samples, random_state=self.seed, stratify=y
+        )
+        return X_sub, y_sub
+
+    @staticmethod
+    def _data_fingerprint(X: np.ndarray, y: np.ndarray) -> str:
+        """Eğitim verisinin SHA-1 özeti (kayıtlı denemeler yalnızca aynı veride geçerlidir)"""
+
+        digest = hashlib.sha1()
+        digest.update(np.ascontiguousarray(X, dtype=np.float64).tobytes())
+        digest.update(np.ascontiguousarray(y).tobytes())
+        return digest.hexdigest()
+
+    # Aynı skoru üreten deneme alanları (yeniden kullanım anahtarı)
+    TRIAL_KEY_FIELDS = ('data', 'model', 'params', 'fraction', 'cv', 'scoring', 'seed')
+
+    def _trial_key(self, trial: Dict) -> str:
+        return json.dumps({k: trial.get(k) for k in self.TRIAL_KEY_FIELDS},
+                          sort_keys=True, default=str)
+
+    def _load_trials(self, data_key: str) -> Dict[str, float]:
+        """Deneme kaydından aynı veriye ait skorları okur"""
+
+        past = {}
+        if self.trials_path is None or not os.path.exists(self.trials_path):
+            return past
+
+        with open(self.trials_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    trial = json.loads(line)
+                except json.JSONDecodeError:
+                    # Yarım kalmış son satır (süreç yazım sırasında öldü)
+                    continue
+                if trial.get('data') == data_key:
+                    past[self._trial_key(trial)] = trial['score']
+
+        return past
+
+    def _save_trial(self, trial: Dict):
+        """Biten denemeyi kayda ekler ve diske yazar"""
+
+        if self.trials_path is None:
+            return
+
+        os.makedirs(os.path.dirname(self.trials_path) or '.', exist_ok=True)
+        with open(self.trials_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(trial, default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,137 @@
+"""
+TestScope AI - Süreç Geneli Model Kayıt Defteri
+Model dosyasını süreç başına bir kez yükler ve tüm oturumlara aynı değiştirilemez
+RiskPredictor anlık görüntüsünü verir. Orman, model dosyasının yanındaki bir
+dizine .npy dizileri olarak derlenir; süreçler bu dizileri bellek eşlemeli açarak
+fiziksel bellek sayfalarını paylaşır. Motor tek satır ve küçük girdiler içindir;
+büyük toplu skorlama daha hızlı olan sklearn ormanıyla yapıldığından orman da
+anlık görüntüde tutulur (sklearn ağaçları yüklenirken kopyalandığından bu kısım
+süreç başına bellekte kalır).
+"""
+
+import threading
+import time
+import json
+import os
+import shutil
+from typing import Dict, Optional
+
+from models.compiled_forest import CompiledForest, compile_model
+from models.risk_predictor import RiskPredictor
+from models.fingerprint import model_fingerprint
+
+
+class ModelRegistry:
+    """Model dosyası yolu -> paylaşılan RiskPredictor anlık görüntüsü
+
+    Model dosyası değiştiğinde (boyut veya değişiklik zamanı) sonraki ``get``
+    çağrısı yeni bir anlık görüntü yükler; eski görüntüyü tutan çağıranlar onu
+    kullanmaya devam edebilir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, tuple] = {}
+
+        self.cold_loads = 0
+        self.warm_hits = 0
+        self.last_cold_load_seconds: Optional[float] = None
+
+    def get(self, model_path: str = 'models/risk_predictor.joblib') -> RiskPredictor:
+        """Paylaşılan model anlık görüntüsünü döndürür (gerekirse bir kez yükler)"""
+
+        path = os.path.abspath(model_path)
+        stat = os.stat(path)
+        version = (stat.st_size, stat.st_mtime_ns)
+
+        entry = self._snapshots.get(path)
+        if entry is not None and entry[0] == version:
+            self.warm_hits += 1
+            return entry[1]
+
+        with self._lock:
+            # Kilidi bekleyen başka bir iş parçacığı aynı sürümü yüklemiş olabilir
+            entry = self._snapshots.get(path)
+            if entry is not None and entry[0] == version:
+                self.warm_hits += 1
+                return entry[1]
+
+            start = time.perf_counter()
+            snapshot = self._load_snapshot(path)
+            self.last_cold_load_seconds = time.perf_counter() - start
+            self.cold_loads += 1
+
+            self._snapshots[path] = (version, snapshot)
+            return snapshot
+
+    def invalidate(self, model_path: Optional[str] = None):
+        """Bir modelin (veya tümünün) anlık görüntüsünü unutur"""
+
+        with self._lock:
+            if model_path is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(os.path.abspath(model_path), None)
+
+    def stats(self) -> dict:
+        """Soğuk yükleme / sıcak erişim sayıları ve son soğuk yükleme süresi"""
+
+        return {
+            'models': len(self._snapshots),
+            'cold_loads': self.cold_loads,
+            'warm_hits': self.warm_hits,
+            'last_cold_load_seconds': self.last_cold_load_seconds
+        }
+
+    def _load_snapshot(self, path: str) -> RiskPredictor:
+        """Modeli yükler, paylaşılan motoru bağlar ve anlık görüntüyü dondurur"""
+
+        predictor = RiskPredictor()
+        predictor.load_model(path)
+
+        engine = self._shared_engine(path, predictor)
+        if engine is not None:
+            predictor.use_compiled_engine = True
+            predictor.engine = engine
+
+        predictor.frozen = True
+        return predictor
+
+    def _shared_engine(self, path: str, predictor: RiskPredictor) -> Optional[CompiledForest]:
+        """Model dosyasının yanındaki derlenmiş motoru bellek eşlemeli açar
+
+        Motor yoksa veya model dosyası değiştiyse bir kez derlenip yazılır. Yazım
+        geçici dizine yapılıp yerine taşındığından eşzamanlı süreçler yarım motor görmez.
+        """
+
+        engine_dir = os.path.splitext(path)[0] + '.engine'
+        meta_path = os.path.join(engine_dir, 'model.json')
+        fingerprint = model_fingerprint(path)
+
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as f:
+                if json.load(f).get('fingerprint') == fingerprint:
+                    return CompiledForest.load(engine_dir)
+
+        engine = compile_model(predictor.model, predictor.scaler)
+        if engine is None:
+            return None
+
+        tmp_dir = f'{engine_dir}.tmp-{os.getpid()}'
+        engine.save(tmp_dir)
+        with open(os.path.join(tmp_dir, 'model.json'), 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint}, f)
+
+        if os.path.isdir(engine_dir):
+            shutil.rmtree(engine_dir, ignore_errors=True)
+        try:
+            os.replace(tmp_dir, engine_dir)
+        except OSError:
+            # Başka bir süreç aynı anda yazdıysa onun motoru kullanılır
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        return CompiledForest.load(engine_dir)
+
+
+# Süreç genelinde tek kayıt defteri
+MODEL_REGISTRY = ModelRegistry()
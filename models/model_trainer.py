@@ -4,7 +4,7 @@ TestScope AI - Model Eğitim Araçları
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.model_selection import GridSearchCV
@@ -12,13 +12,100 @@ from sklearn.metrics import confusion_matrix, classification_report
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import StandardScaler
+from concurrent.futures import ProcessPoolExecutor
+from threadpoolctl import threadpool_limits
+import contextlib
+import io
+import joblib
+import multiprocessing as mp
 import os
+import shutil
+import sklearn
+import tempfile
+import time
 
 from .risk_predictor import RiskPredictor
+from .hyperparameter_search import BudgetedSearch
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from data_generator import TestDataGenerator
+from utils.artifact_cache import ArtifactCache
+
+# Aday modeller ve paralel eğitimde çekirdek payı ağırlıkları
+CANDIDATE_MODELS = {'random_forest': 3, 'logistic_regression': 1}
+
+# parallel=None iken süreç havuzu bu örnek sayısından itibaren kullanılır; daha küçük
+# verilerde spawn işçilerinin içe aktarma maliyeti (~2 sn) eğitim süresini aşar
+PARALLEL_MIN_SAMPLES = 50_000
+
+# Aday modellerin eğitim ayarları (RiskPredictor.train argümanları)
+TRAIN_OPTIONS = {'test_size': 0.2, 'evaluation': 'auto'}
+
+# Varsayılan eğitim verisi tohumu - varsayılan çalıştırma tekrarlanabilir olur ve önbellekten yararlanır
+DEFAULT_SEED = 42
+
+# Pipeline yapıt biçimi veya eğitim kodu değiştiğinde artırılır (önbelleği geçersiz kılar);
+# hiperparametreler ve eğitim ayarları zaten anahtarın parçasıdır
+PIPELINE_VERSION = 1
+
+# Değerlendirme grafiklerinin dosya adları
+PLOT_FILES = ['confusion_matrix.png', 'risk_score_distribution.png', 'feature_importance.png']
+
+
+def _core_budgets(model_types: List[str], cores: int) -> Dict[str, int]:
+    """Çekirdekleri modellere ağırlıklarıyla orantılı paylaştırır (her modele en az 1)
+    
+    Paylar toplamı cores'u aşmaz; böylece eşzamanlı eğitimler çekirdekleri aşırı kullanmaz.
+    """
+    
+    weights = np.array([CANDIDATE_MODELS[name] for name in model_types], dtype=float)
+    budgets = np.maximum(1, np.floor(cores * weights / weights.sum())).astype(int)
+    
+    # Yuvarlamadan kalan çekirdekler en ağır modele verilir
+    budgets[weights.argmax()] += cores - budgets.sum()
+    return dict(zip(model_types, budgets.tolist()))
+
+
+def _candidate_config() -> Dict[str, Dict]:
+    """Aday modellerin eğitilen modeli belirleyen ayarları (önbellek anahtarı için)
+    
+    n_jobs sonucu değiştirmediğinden dışarıda bırakılır.
+    """
+    
+    config = {}
+    for name in CANDIDATE_MODELS:
+        predictor = RiskPredictor(name, cache_size=0)
+        params = predictor.model.get_params()
+        params.pop('n_jobs', None)
+        config[name] = {'params': params, 'decision_threshold': predictor.decision_threshold,
+                        'train': TRAIN_OPTIONS}
+    return config
+
+
+def _train_candidate(model_type: str, data_dir: str, cores: int):
+    """İşçi süreçte bir aday modeli eğitir
+    
+    Eğitim verisi bellek eşlemeli açılır (süreçler arasında kopyalanmaz). BLAS ve
+    orman iş parçacıkları çekirdek payıyla sınırlanır.
+    """
+    
+    columns = joblib.load(os.path.join(data_dir, 'columns.joblib'))
+    X = pd.DataFrame(joblib.load(os.path.join(data_dir, 'X.joblib'), mmap_mode='r'),
+                     columns=columns, copy=False)
+    y = pd.Series(joblib.load(os.path.join(data_dir, 'y.joblib'), mmap_mode='r'), copy=False)
+    
+    output = io.StringIO()
+    with threadpool_limits(cores), contextlib.redirect_stdout(output):
+        model = RiskPredictor(model_type, n_jobs=cores)
+        metrics = model.train(X, y, cv_jobs=cores, **TRAIN_OPTIONS)
+    
+    # Çıkarım çoğunlukla tek satırlıktır; iş parçacığı havuzu yalnızca gecikme ekler
+    if model_type == 'random_forest':
+        model.model.set_params(n_jobs=None)
+    
+    return model_type, model, metrics, output.getvalue()
+
 
 class ModelTrainer:
     """Model eğitim ve değerlendirme araçları"""
@@ -29,11 +116,12 @@ class ModelTrainer:
         self.best_model = None
         self.training_results = {}
     
-    def generate_training_data(self, num_samples: int = 5000) -> Tuple[pd.DataFrame, pd.Series]:
+    def generate_training_data(self, num_samples: int = 5000,
+                               seed: Optional[int] = None) -> Tuple[pd.DataFrame, pd.Series]:
         """Eğitim verisi üretir"""
         
         print(f"{num_samples} adet eğitim verisi üretiliyor...")
-        X, y = self.data_generator.generate_training_data(num_samples)
+        X, y = self.data_generator.generate_training_data(num_samples, seed=seed)
         
         print(f"Veri dağılımı:")
         print(f"PASS: {sum(y == 0)} ({sum(y == 0)/len(y)*100:.1f}%)")
@@ -41,27 +129,43 @@ class ModelTrainer:
         
         return X, y
     
-    def train_multiple_models(self, X: pd.DataFrame, y: pd.Series) -> Dict:
-        """Birden fazla model eğitir ve karşılaştırır"""
-        
-        models_to_train = {
-            'random_forest': RiskPredictor('random_forest'),
-            'logistic_regression': RiskPredictor('logistic_regression')
-        }
+    def train_multiple_models(self, X: pd.DataFrame, y: pd.Series,
+                              parallel: Optional[bool] = None, cores: Optional[int] = None) -> Dict:
+        """Birden fazla model eğitir ve karşılaştırır
+        
+        parallel=True ise aday modeller süreç havuzunda eşzamanlı eğitilir; her model
+        cores içinden kendi çekirdek payını kullanır. Çekirdek sayısı aday sayısından
+        azsa modeller sırayla, tüm çekirdeklerle eğitilir. parallel=None (varsayılan)
+        yalnızca PARALLEL_MIN_SAMPLES ve üzeri örnekte paralel eğitir.
+        """
+        
+        if parallel is None:
+            parallel = len(X) >= PARALLEL_MIN_SAMPLES
+        cores = cores or os.cpu_count() or 1
+        model_types = list(CANDIDATE_MODELS)
+        
+        start = time.perf_counter()
+        if parallel and cores >= len(model_types):
+            trained = self._train_parallel(X, y, model_types, cores)
+        else:
+            trained = []
+            for name in model_types:
+                print(f"\n{name.upper()} modeli eğitiliyor...")
+                model = RiskPredictor(name, n_jobs=cores if parallel else None)
+                metrics = model.train(X, y, cv_jobs=cores if parallel else 1, **TRAIN_OPTIONS)
+                if name == 'random_forest':
+                    model.model.set_params(n_jobs=None)
+                trained.append((name, model, metrics))
+                print(f"{name} eğitimi tamamlandı!")
+        elapsed = time.perf_counter() - start
         
         results = {}
-        
-        for name, model in models_to_train.items():
-            print(f"\n{name.upper()} modeli eğitiliyor...")
-            
-            # Model eğitimi
-            metrics = model.train(X, y)
-            
+        for name, model, metrics in trained:
             # Sonuçları kaydet
             self.models[name] = model
             results[name] = metrics
-            
-            print(f"{name} eğitimi tamamlandı!")
+        
+        print(f"\nEğitim süresi: {elapsed:.2f} sn ({len(model_types)} model, {cores} çekirdek)")
         
         # En iyi modeli seç
         best_model_name = max(results.keys(), 
@@ -74,11 +178,46 @@ class ModelTrainer:
         self.training_results = results
         return results
     
+    def _train_parallel(self, X: pd.DataFrame, y: pd.Series, model_types: List[str],
+                        cores: int) -> List[Tuple[str, RiskPredictor, Dict]]:
+        """Aday modelleri süreç havuzunda eğitir; veri bellek eşlemeli dosyalarla paylaşılır"""
+        
+        budgets = _core_budgets(model_types, cores)
+        
+        with tempfile.TemporaryDirectory(prefix='testscope-train-') as data_dir:
+            joblib.dump(np.ascontiguousarray(X.to_numpy()), os.path.join(data_dir, 'X.joblib'))
+            joblib.dump(np.asarray(y), os.path.join(data_dir, 'y.joblib'))
+            joblib.dump(list(X.columns), os.path.join(data_dir, 'columns.joblib'))
+            
+            with ProcessPoolExecutor(max_workers=len(model_types),
+                                     mp_context=mp.get_context('spawn')) as pool:
+                futures = [pool.submit(_train_candidate, name, data_dir, budgets[name])
+                           for name in model_types]
+                
+                trained = []
+                for future in futures:
+                    name, model, metrics, output = future.result()
+                    print(f"\n{name.upper()} modeli eğitildi ({budgets[name]} çekirdek)")
+                    print(output, end='')
+                    trained.append((name, model, metrics))
+        
+        return trained
+    
     def hyperparameter_tuning(self, X: pd.DataFrame, y: pd.Series, 
-                            model_type: str = 'random_forest') -> RiskPredictor:
-        """Hiperparametre optimizasyonu yapar"""
+                            model_type: str = 'random_forest', search: str = 'budgeted',
+                            time_budget: Optional[float] = None,
+                            trials_path: Optional[str] = '.cache/search_trials.jsonl') -> RiskPredictor:
+        """Hiperparametre optimizasyonu yapar
+        
+        search='budgeted' ardışık yarılamalı bütçeli arama (time_budget saniye, biten
+        denemeler trials_path'e kaydedilir; None: kayıt yok), search='grid' tam
+        GridSearchCV yapar. Deneme kaydı varsayılan olarak git dışı .cache/ altındadır.
+        """
         
-        print(f"{model_type} için hiperparametre optimizasyonu...")
+        if search not in ('budgeted', 'grid'):
+            raise ValueError(f"Desteklenmeyen arama tipi: {search}")
+        
+        print(f"{model_type} için hiperparametre optimizasyonu ({search})...")
         
         if model_type == 'random_forest':
             param_grid = {
@@ -99,26 +238,38 @@ class ModelTrainer:
             
             base_model = LogisticRegression(random_state=42, class_weight='balanced', max_iter=1000)
         
-        # Grid search
-        grid_search = GridSearchCV(
-            base_model, param_grid, cv=5, scoring='f1_weighted', n_jobs=-1
-        )
+        else:
+            raise ValueError(f"Desteklenmeyen model tipi: {model_type}")
+        
+        if search == 'grid':
+            # Grid search
+            searcher = GridSearchCV(
+                base_model, param_grid, cv=5, scoring='f1_weighted', n_jobs=-1
+            )
+        else:
+            searcher = BudgetedSearch(
+                base_model, param_grid, time_budget=time_budget, trials_path=trials_path
+            )
         
         # Veri ölçeklendirme
         scaler = StandardScaler()
         X_scaled = scaler.fit_transform(X)
         
-        # Grid search eğitimi
-        grid_search.fit(X_scaled, y)
+        # Arama eğitimi
+        searcher.fit(X_scaled, y)
         
-        print(f"En iyi parametreler: {grid_search.best_params_}")
-        print(f"En iyi F1-Score: {grid_search.best_score_:.3f}")
+        print(f"En iyi parametreler: {searcher.best_params_}")
+        print(f"En iyi F1-Score: {searcher.best_score_:.3f}")
+        if search == 'budgeted':
+            print(f"Eğitim sayısı: {searcher.fits} (yeniden kullanılan deneme: {searcher.reused})"
+                  + (" - süre bütçesi doldu" if searcher.budget_exhausted else ""))
         
         # Optimize edilmiş modeli oluştur
         optimized_model = RiskPredictor(model_type)
-        optimized_model.model = grid_search.best_estimator_
+        optimized_model.model = searcher.best_estimator_
         optimized_model.scaler = scaler
         optimized_model.is_trained = True
+        optimized_model._model_changed()
         
         return optimized_model
     
@@ -147,7 +298,8 @@ class ModelTrainer:
         
         return evaluation
     
-    def create_evaluation_plots(self, evaluation: Dict, save_path: str = 'notebooks/'):
+    def create_evaluation_plots(self, evaluation: Dict, save_path: str = 'notebooks/',
+                                dpi: int = 300):
         """Değerlendirme grafikleri oluşturur"""
         
         os.makedirs(save_path, exist_ok=True)
@@ -162,7 +314,7 @@ class ModelTrainer:
         plt.ylabel('Gerçek Değerler')
         plt.xlabel('Tahmin Edilen Değerler')
         plt.tight_layout()
-        plt.savefig(f'{save_path}confusion_matrix.png', dpi=300, bbox_inches='tight')
+        plt.savefig(f'{save_path}confusion_matrix.png', dpi=dpi, bbox_inches='tight')
         plt.close()
         
         # Risk Skor Dağılımı
@@ -176,7 +328,7 @@ class ModelTrainer:
         plt.legend()
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
-        plt.savefig(f'{save_path}risk_score_distribution.png', dpi=300, bbox_inches='tight')
+        plt.savefig(f'{save_path}risk_score_distribution.png', dpi=dpi, bbox_inches='tight')
         plt.close()
         
         # Özellik Önem Dereceleri
@@ -188,7 +340,7 @@ class ModelTrainer:
                 plt.title('Özellik Önem Dereceleri')
                 plt.xlabel('Önem Derecesi')
                 plt.tight_layout()
-                plt.savefig(f'{save_path}feature_importance.png', dpi=300, bbox_inches='tight')
+                plt.savefig(f'{save_path}feature_importance.png', dpi=dpi, bbox_inches='tight')
                 plt.close()
         
         print(f"Grafikler kaydedildi: {save_path}")
@@ -211,8 +363,15 @@ class ModelTrainer:
                 f.write(f"  Precision: {metrics['precision']:.3f}\n")
                 f.write(f"  Recall: {metrics['recall']:.3f}\n")
                 f.write(f"  F1-Score: {metrics['f1_score']:.3f}\n")
-                f.write(f"  CV Mean: {metrics['cv_mean']:.3f}\n")
-                f.write(f"  CV Std: {metrics['cv_std']:.3f}\n")
+                if metrics.get('evaluation') == 'oob':
+                    f.write(f"  OOB Doğruluğu: {metrics['oob_score']:.3f}\n")
+                    for label, class_metrics in metrics['class_metrics'].items():
+                        f.write(f"  Sınıf {label}: Precision {class_metrics['precision']:.3f}, "
+                                f"Recall {class_metrics['recall']:.3f}, "
+                                f"F1 {class_metrics['f1_score']:.3f}\n")
+                else:
+                    f.write(f"  CV Mean: {metrics['cv_mean']:.3f}\n")
+                    f.write(f"  CV Std: {metrics['cv_std']:.3f}\n")
             
             if self.best_model:
                 f.write(f"\nEn İyi Model: {self.best_model.model_type}\n")
@@ -220,41 +379,165 @@ class ModelTrainer:
         
         print(f"Eğitim raporu kaydedildi: {save_path}")
     
-    def full_training_pipeline(self, num_samples: int = 5000) -> RiskPredictor:
-        """Tam eğitim pipeline'ı çalıştırır"""
+    def full_training_pipeline(self, num_samples: int = 5000,
+                               progress: Optional[Callable[[float, str], None]] = None,
+                               model_path: str = 'models/risk_predictor.joblib',
+                               seed: Optional[int] = DEFAULT_SEED,
+                               cache_dir: Optional[str] = '.cache/training',
+                               plot_dpi: int = 300, plot_path: str = 'notebooks/',
+                               report_path: str = 'notebooks/training_report.txt') -> RiskPredictor:
+        """Tam eğitim pipeline'ı çalıştırır
+        
+        progress verilirse her adımın başında (tamamlanma oranı 0-1, mesaj) ile çağrılır.
+        
+        Her aşamanın çıktısı, girdilerinin (tohum, hiperparametreler, eğitim ayarları)
+        özetiyle cache_dir altında saklanır; aynı girdilerle tekrar çalıştırmada aşamalar
+        önbellekten gelir ve yalnızca girdisi değişen aşamalar (ör. sadece plot_dpi
+        değiştiyse grafikler) yeniden hesaplanır. seed varsayılan olarak DEFAULT_SEED'dir;
+        seed=None yeni veri için tohumu global np.random durumundan bir kez çözer ve yazdırır.
+        """
+        
+        def report(step: int, message: str):
+            print(f"\n{step}. {message}")
+            if progress is not None:
+                progress((step - 1) / 6, message)
         
         print("TestScope AI - Model Eğitim Pipeline'ı Başlatılıyor...")
         print("=" * 60)
         
+        # Somut tohum baştan çözülür; aşama anahtarları ve veri üretimi aynı tohumu kullanır
+        if seed is None:
+            seed = self.data_generator._resolve_seed(seed)
+            print(f"Eğitim verisi tohumu: {seed}")
+        
+        cache = ArtifactCache(cache_dir) if cache_dir is not None else None
+        
+        # Her aşamanın anahtarı bir önceki aşamanın anahtarını içerir
+        data_inputs = {'version': PIPELINE_VERSION, 'num_samples': num_samples, 'seed': seed}
+        model_inputs = {'version': PIPELINE_VERSION, 'data': ArtifactCache.key('data', data_inputs),
+                        'candidates': _candidate_config(), 'sklearn': sklearn.__version__}
+        models_key = ArtifactCache.key('models', model_inputs)
+        evaluation_inputs = {'version': PIPELINE_VERSION, 'models': models_key}
+        
         # 1. Veri üretimi
-        print("\n1. Eğitim verisi üretiliyor...")
-        X, y = self.generate_training_data(num_samples)
+        report(1, "Eğitim verisi üretiliyor...")
+        X, y = self._run_stage(
+            cache, 'data', data_inputs,
+            compute=lambda: self.generate_training_data(num_samples, seed),
+            save=lambda data, path: joblib.dump(data, os.path.join(path, 'data.joblib')),
+            load=lambda path: joblib.load(os.path.join(path, 'data.joblib'))
+        )
         
         # 2. Model eğitimi
-        print("\n2. Modeller eğitiliyor...")
-        results = self.train_multiple_models(X, y)
+        report(2, "Modeller eğitiliyor...")
+        self._run_stage(
+            cache, 'models', model_inputs,
+            compute=lambda: self.train_multiple_models(X, y),
+            save=lambda _, path: joblib.dump(self._training_state(),
+                                             os.path.join(path, 'models.joblib')),
+            load=lambda path: self._restore_training_state(
+                joblib.load(os.path.join(path, 'models.joblib')))
+        )
+        results = self.training_results
         
         # 3. Model değerlendirmesi
-        print("\n3. Model değerlendirmesi yapılıyor...")
-        evaluation = self.evaluate_model(self.best_model, X, y)
+        report(3, "Model değerlendirmesi yapılıyor...")
+        evaluation = self._run_stage(
+            cache, 'evaluation', evaluation_inputs,
+            compute=lambda: self.evaluate_model(self.best_model, X, y),
+            save=lambda value, path: joblib.dump(value, os.path.join(path, 'evaluation.joblib')),
+            load=lambda path: joblib.load(os.path.join(path, 'evaluation.joblib'))
+        )
         
         # 4. Grafikler oluşturuluyor
-        print("\n4. Değerlendirme grafikleri oluşturuluyor...")
-        self.create_evaluation_plots(evaluation)
+        report(4, "Değerlendirme grafikleri oluşturuluyor...")
+        self._run_file_stage(
+            cache, 'plots',
+            {'evaluation': ArtifactCache.key('evaluation', evaluation_inputs), 'dpi': plot_dpi},
+            render=lambda path: self.create_evaluation_plots(evaluation, path + os.sep, plot_dpi),
+            outputs={name: os.path.join(plot_path, name) for name in PLOT_FILES}
+        )
         
         # 5. Rapor kaydediliyor
-        print("\n5. Eğitim raporu kaydediliyor...")
-        self.save_training_report()
+        report(5, "Eğitim raporu kaydediliyor...")
+        self._run_file_stage(
+            cache, 'report', {'models': models_key},
+            render=lambda path: self.save_training_report(os.path.join(path, 'training_report.txt')),
+            outputs={'training_report.txt': report_path}
+        )
         
-        # 6. En iyi modeli kaydet
-        print("\n6. En iyi model kaydediliyor...")
-        self.best_model.save_model()
+        # 6. En iyi modeli kaydet - içerik aynıysa dosyaya dokunulmaz (kayıt defteri yeniden yüklemez)
+        report(6, "En iyi model kaydediliyor...")
+        self._run_file_stage(
+            cache, 'model', {'models': models_key},
+            render=lambda path: self.best_model.save_model(os.path.join(path, 'model.joblib')),
+            outputs={'model.joblib': model_path}
+        )
         
         print("\nEğitim pipeline'ı tamamlandı!")
         print(f"En iyi model: {self.best_model.model_type}")
         print(f"F1-Score: {results[self.best_model.model_type]['f1_score']:.3f}")
+        if cache is not None:
+            print(f"[önbellek] {cache.hits} isabet, {cache.misses} ıska")
+        
+        if progress is not None:
+            progress(1.0, "Eğitim tamamlandı")
         
         return self.best_model
+    
+    def _training_state(self) -> Dict:
+        return {'models': self.models, 'results': self.training_results,
+                'best': self.best_model.model_type}
+    
+    def _restore_training_state(self, state: Dict):
+        self.models = state['models']
+        self.training_results = state['results']
+        self.best_model = self.models[state['best']]
+    
+    @staticmethod
+    def _run_stage(cache: Optional[ArtifactCache], stage: str, inputs: Dict,
+                   compute: Callable, save: Callable, load: Callable):
+        """Aşamayı önbellekten yükler; yoksa hesaplayıp kaydeder"""
+        
+        if cache is None:
+            return compute()
+        
+        key, path = cache.lookup(stage, inputs)
+        if path is not None:
+            return load(path)
+        
+        value = compute()
+        cache.store(stage, key, inputs, lambda tmp_path: save(value, tmp_path))
+        return value
+    
+    @staticmethod
+    def _run_file_stage(cache: Optional[ArtifactCache], stage: str, inputs: Dict,
+                        render: Callable[[str], None], outputs: Dict[str, str]):
+        """Dosya üreten aşamayı çalıştırır ve çıktıları hedeflerine kopyalar
+        
+        Hedefteki dosya aynı içerikteyse yeniden yazılmaz.
+        """
+        
+        with tempfile.TemporaryDirectory(prefix=f'testscope-{stage}-') as tmp_dir:
+            if cache is None:
+                render(tmp_dir)
+                source_dir = tmp_dir
+            else:
+                key, source_dir = cache.lookup(stage, inputs)
+                if source_dir is None:
+                    source_dir = cache.store(stage, key, inputs, render)
+            
+            for name, target in outputs.items():
+                source = os.path.join(source_dir, name)
+                if not os.path.exists(source):
+                    continue
+                if ArtifactCache.file_hash(source) == ArtifactCache.file_hash(target):
+                    continue
+                
+                os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+                tmp_target = f"{target}.tmp-{os.getpid()}"
+                shutil.copyfile(source, tmp_target)
+                os.replace(tmp_target, target)
 
 if __name__ == "__main__":
     # Tam eğitim pipeline'ı çalıştır
@@ -0,0 +1,109 @@
+"""
+TestScope AI - Tahmin Önbelleği
+Izgara üzerindeki özellik vektörü ve model sürümü ile anahtarlanan, boyutu sınırlı LRU önbellek.
+"""
+
+import numpy as np
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Sequence
+
+
+class PredictionCache:
+    """Sayaçlı, boyutu sınırlı LRU tahmin önbelleği
+
+    Anahtar ``(model sürümü, ızgara indisleri)`` çiftidir. Yalnızca her özelliği kendi
+    adım genişliğinin tam katı olan (ızgara üzerindeki) girdiler önbelleğe alınır;
+    böylece saklanan sonuç anahtarın temsil ettiği girdinin kendi skorudur ve
+    çağrı sırasına bağlı değildir.
+    """
+
+    # Kayan nokta bölme hatası (ör. 2.3 / 0.1) için ızgara toleransı
+    GRID_TOLERANCE = 1e-9
+
+    def __init__(self, max_size: int = 256, steps: Optional[Sequence[float]] = None):
+        if max_size <= 0:
+            raise ValueError(f"Geçersiz önbellek boyutu: {max_size}")
+
+        self.max_size = max_size
+        self.steps = None if steps is None else np.asarray(steps, dtype=np.float64)
+        self._entries: OrderedDict = OrderedDict()
+        # Paylaşılan model anlık görüntüsü birden çok oturum iş parçacığından kullanılır
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getstate__(self):
+        # Süreçler arası aktarımda kilit taşınamaz; kayıtlar da alıcıda geçersizdir
+        state = self.__dict__.copy()
+        state['_entries'] = OrderedDict()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def make_key(self, version: int, features: Sequence[float]) -> Optional[Hashable]:
+        """Izgara üzerindeki özelliklerden anahtar üretir; ızgara dışı girdide None
+
+        Adım aralığının içindeki bir girdi, aralığın ilk skorlanan girdisinin sonucunu
+        almamalıdır; bu yüzden ızgara dışı girdiler önbelleğe hiç alınmaz.
+        """
+
+        values = np.asarray(features, dtype=np.float64)
+        if self.steps is not None:
+            values = values / self.steps
+
+        grid = np.rint(values)
+        if not np.all(np.abs(values - grid) <= self.GRID_TOLERANCE):
+            return None
+        return (version, tuple(grid.astype(np.int64).tolist()))
+
+    def get(self, key: Hashable):
+        """Kayıt varsa döndürür ve en son kullanılan yapar; yoksa None"""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, value):
+        """Kaydı ekler; kapasite aşılırsa en uzun süredir kullanılmayan kaydı çıkarır"""
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Tüm kayıtları siler (sayaçlar korunur)"""
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """İsabet, ıska, çıkarma sayıları ve isabet oranı"""
+
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -11,16 +11,54 @@ from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_sc
 from sklearn.preprocessing import StandardScaler
 import joblib
 import os
+import sys
+from typing import Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.dataset_schema import DatasetSchema
+from models.compiled_forest import compile_model
+from models.prediction_cache import PredictionCache
 
 class RiskPredictor:
     """Çevresel test risk tahmin modeli"""
     
-    def __init__(self, model_type: str = 'random_forest'):
+    # Tahmin önbelleği ızgara adımları (arayüz kaydırıcılarının adımları; ızgara dışı girdiler önbelleğe alınmaz)
+    CACHE_STEPS = {'temperature': 1.0, 'humidity': 1.0, 'vibration': 0.1, 'pressure': 1.0}
+    
+    # Eğitim değerlendirme modları: 'auto' ormanlarda 'oob', diğer modellerde 'cv' seçer
+    EVALUATION_MODES = ('auto', 'oob', 'cv')
+    
+    # Derlenmiş motorun kullanıldığı en büyük satır sayısı; daha büyük girdilerde sklearn
+    # ormanı daha hızlıdır (100 ağaçta kesişim ~8000 satır)
+    ENGINE_MAX_ROWS = 4096
+    
+    def __init__(self, model_type: str = 'random_forest', use_compiled_engine: bool = False,
+                 decision_threshold: float = 0.5, cache_size: int = 256,
+                 n_jobs: Optional[int] = None):
         self.model_type = model_type
         self.model = None
         self.scaler = StandardScaler()
         self.is_trained = False
+        
+        # FAIL olasılığı bu eşiği aşarsa tahmin FAIL olur (0.5: sklearn predict ile aynı)
+        self.decision_threshold = decision_threshold
+        
+        # İsteğe bağlı derlenmiş çıkarım motoru (yalnızca ağaç toplulukları)
+        self.use_compiled_engine = use_compiled_engine
+        self.engine = None
         self.feature_names = ['temperature', 'humidity', 'vibration', 'pressure']
+        self.schema = DatasetSchema()
+        
+        # Paylaşılan (kayıt defterinden dağıtılan) anlık görüntüler değiştirilemez
+        self.frozen = False
+        
+        # Tek satır tahmin önbelleği - model her değiştiğinde sürüm artar (cache_size=0: kapalı)
+        self.model_version = 0
+        self.cache = None
+        if cache_size > 0:
+            self.cache = PredictionCache(
+                cache_size, steps=[self.CACHE_STEPS[name] for name in self.feature_names]
+            )
         
         # Model seçimi
         if model_type == 'random_forest':
@@ -28,7 +66,8 @@ class RiskPredictor:
                 n_estimators=100,
                 max_depth=10,
                 random_state=42,
-                class_weight='balanced'
+                class_weight='balanced',
+                n_jobs=n_jobs
             )
         elif model_type == 'logistic_regression':
             self.model = LogisticRegression(
@@ -39,8 +78,23 @@ class RiskPredictor:
         else:
             raise ValueError(f"Desteklenmeyen model tipi: {model_type}")
     
-    def train(self, X: pd.DataFrame, y: pd.Series, test_size: float = 0.2):
-        """Modeli eğitir"""
+    def train(self, X: pd.DataFrame, y: pd.Series, test_size: float = 0.2,
+              evaluation: str = 'auto', cv_jobs: int = -1):
+        """Modeli eğitir
+        
+        evaluation='oob' (yalnızca random forest) genelleme metriklerini eğitilen tek
+        ormanın torba dışı (out-of-bag) tahminlerinden hesaplar; 'cv' 5 katlı çapraz
+        doğrulamayı cv_jobs süreçte paralel çalıştırır.
+        """
+        
+        self._check_mutable()
+        
+        if evaluation not in self.EVALUATION_MODES:
+            raise ValueError(f"Geçersiz değerlendirme modu: {evaluation}")
+        if evaluation == 'auto':
+            evaluation = 'oob' if self.model_type == 'random_forest' else 'cv'
+        if evaluation == 'oob' and self.model_type != 'random_forest':
+            raise ValueError(f"Desteklenmeyen değerlendirme modu: oob ({self.model_type})")
         
         # Veriyi eğitim ve test setlerine ayır
         X_train, X_test, y_train, y_test = train_test_split(
@@ -51,7 +105,9 @@ class RiskPredictor:
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
         
-        # Model eğitimi
+        # Model eğitimi - OOB modunda orman torba dışı tahminleri de tutar
+        if self.model_type == 'random_forest':
+            self.model.set_params(oob_score=evaluation == 'oob')
         self.model.fit(X_train_scaled, y_train)
         
         # Tahminler
@@ -64,12 +120,24 @@ class RiskPredictor:
         self.recall = recall_score(y_test, y_pred, average='weighted')
         self.f1 = f1_score(y_test, y_pred, average='weighted')
         
-        # Cross-validation
-        cv_scores = cross_val_score(self.model, X_train_scaled, y_train, cv=5)
-        self.cv_mean = cv_scores.mean()
-        self.cv_std = cv_scores.std()
+        # Genelleme metrikleri
+        # (OOB modunda çapraz doğrulama yapılmaz; cv_mean / cv_std None kalır)
+        self.evaluation = evaluation
+        self.oob_score = None
+        self.cv_mean = None
+        self.cv_std = None
+        self.class_metrics = None
+        if evaluation == 'oob':
+            # Her örnek, onu görmeyen ağaçların oylarıyla skorlanır - ek model eğitimi yok
+            self.oob_score = self.model.oob_score_
+            self.class_metrics = self._class_metrics(y_train, self.model.oob_decision_function_)
+        else:
+            cv_scores = cross_val_score(self.model, X_train_scaled, y_train, cv=5, n_jobs=cv_jobs)
+            self.cv_mean = cv_scores.mean()
+            self.cv_std = cv_scores.std()
         
         self.is_trained = True
+        self._model_changed()
         
         # Sonuçları yazdır
         print(f"Model Eğitimi Tamamlandı - {self.model_type.upper()}")
@@ -77,7 +145,10 @@ class RiskPredictor:
         print(f"Precision: {self.precision:.3f}")
         print(f"Recall: {self.recall:.3f}")
         print(f"F1-Score: {self.f1:.3f}")
-        print(f"Cross-Validation: {self.cv_mean:.3f} (+/- {self.cv_std * 2:.3f})")
+        if evaluation == 'oob':
+            print(f"OOB Doğruluğu: {self.oob_score:.3f}")
+        else:
+            print(f"Cross-Validation: {self.cv_mean:.3f} (+/- {self.cv_std * 2:.3f})")
         
         return {
             'accuracy': self.accuracy,
@@ -85,7 +156,32 @@ class RiskPredictor:
             'recall': self.recall,
             'f1_score': self.f1,
             'cv_mean': self.cv_mean,
-            'cv_std': self.cv_std
+            'cv_std': self.cv_std,
+            'evaluation': self.evaluation,
+            'oob_score': self.oob_score,
+            'class_metrics': self.class_metrics
+        }
+    
+    def _class_metrics(self, y_true: pd.Series, decision: np.ndarray) -> dict:
+        """OOB olasılıklarından sınıf bazında precision / recall / F1 / destek
+        
+        Hiçbir ağacın dışında kalmayan (NaN olasılıklı) örnekler atlanır.
+        """
+        
+        scored = ~np.isnan(decision).any(axis=1)
+        y_pred = self.model.classes_[decision[scored].argmax(axis=1)]
+        report = classification_report(np.asarray(y_true)[scored], y_pred,
+                                       output_dict=True, zero_division=0)
+        
+        return {
+            str(label): {
+                'precision': report[str(label)]['precision'],
+                'recall': report[str(label)]['recall'],
+                'f1_score': report[str(label)]['f1-score'],
+                'support': int(report[str(label)]['support'])
+            }
+            for label in self.model.classes_
+            if str(label) in report
         }
     
     def predict(self, X: pd.DataFrame) -> dict:
@@ -94,25 +190,34 @@ class RiskPredictor:
         if not self.is_trained:
             raise ValueError("Model henüz eğitilmemiş!")
         
-        # Özellik ölçeklendirme
-        X_scaled = self.scaler.transform(X)
+        # Aynı (ızgara üzerindeki) girdi bu model sürümüyle daha önce skorlandıysa çıkarım atlanır
+        cache_key = None
+        if self.cache is not None and len(X) == 1:
+            features = X[self.feature_names] if isinstance(X, pd.DataFrame) else X
+            cache_key = self.cache.make_key((self.model_version, self.decision_threshold),
+                                            np.asarray(features, dtype=np.float64)[0])
+            cached = self.cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                return dict(cached)
         
-        # Tahminler
-        prediction = self.model.predict(X_scaled)[0]
-        probability = self.model.predict_proba(X_scaled)[0]
+        # Tahminler - olasılıklar tek geçişte hesaplanır, etiket olasılıktan türetilir
+        probability = self._predict_proba(X)[0]
         
         # Risk skoru (FAIL olasılığı)
         risk_score = probability[1] if len(probability) > 1 else 0.0
         
         # Sonuç
         result = {
-            'prediction': 'FAIL' if prediction == 1 else 'PASS',
+            'prediction': 'FAIL' if risk_score > self.decision_threshold else 'PASS',
             'risk_score': round(risk_score, 3),
             'confidence': round(max(probability), 3),
             'pass_probability': round(probability[0], 3),
             'fail_probability': round(probability[1], 3)
         }
         
+        if cache_key is not None:
+            self.cache.put(cache_key, dict(result))
+        
         return result
     
     def predict_batch(self, X: pd.DataFrame) -> pd.DataFrame:
@@ -121,20 +226,63 @@ class RiskPredictor:
         if not self.is_trained:
             raise ValueError("Model henüz eğitilmemiş!")
         
+        # Tahminler - olasılıklar tek geçişte hesaplanır
+        probabilities = self._predict_proba(X)
+        fail_probability = (probabilities[:, 1] if probabilities.shape[1] > 1
+                            else np.zeros(len(probabilities)))
+        
+        # Sonuç sütunları dizi işlemleriyle, doğrudan şema tipleriyle doldurulur
+        # (kod 0: PASS, kod 1: FAIL); girdi sütunları olduğu gibi kopyalanır
+        dtypes = self.schema.dtypes
+        results = X.copy()
+        results['prediction'] = self.schema.categorical(
+            'prediction', (fail_probability > self.decision_threshold).astype(np.int8)
+        )
+        results['risk_score'] = np.round(fail_probability, 3).astype(dtypes['risk_score'])
+        results['confidence'] = np.round(probabilities.max(axis=1), 3).astype(dtypes['confidence'])
+        
+        return results
+    
+    def _predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        """Sınıf olasılıklarını tek orman geçişiyle döndürür
+        
+        Derlenmiş motor varsa ve girdi ENGINE_MAX_ROWS satırı aşmıyorsa ölçekleme
+        motorda yapılır ve ham özellikler kullanılır; büyük toplu girdiler sklearn
+        ormanıyla skorlanır (iki yolun olasılıkları aynıdır).
+        """
+        
+        if self.engine is not None and len(X) <= self.ENGINE_MAX_ROWS:
+            features = X[self.feature_names] if isinstance(X, pd.DataFrame) else X
+            return self.engine.predict_proba(features)
+        
         # Özellik ölçeklendirme
         X_scaled = self.scaler.transform(X)
         
-        # Tahminler
-        predictions = self.model.predict(X_scaled)
-        probabilities = self.model.predict_proba(X_scaled)
+        return self.model.predict_proba(X_scaled)
+    
+    def _check_mutable(self):
+        """Paylaşılan anlık görüntü üzerinde eğitim/yükleme yapılmasını engeller"""
         
-        # Sonuçları DataFrame'e ekle
-        results = X.copy()
-        results['prediction'] = ['FAIL' if p == 1 else 'PASS' for p in predictions]
-        results['risk_score'] = [round(prob[1], 3) for prob in probabilities]
-        results['confidence'] = [round(max(prob), 3) for prob in probabilities]
+        if self.frozen:
+            raise ValueError("Paylaşılan model anlık görüntüsü değiştirilemez; yeni bir RiskPredictor kullanın")
+    
+    def _model_changed(self):
+        """Model değiştiğinde sürümü artırır, önbelleği boşaltır ve motoru yeniden derler"""
         
-        return results
+        self.model_version += 1
+        if self.cache is not None:
+            self.cache.clear()
+        self._refresh_engine()
+    
+    def get_cache_stats(self) -> dict:
+        """Tahmin önbelleği sayaçlarını döndürür (önbellek kapalıysa boş)"""
+        
+        return self.cache.stats() if self.cache is not None else {}
+    
+    def _refresh_engine(self):
+        """Derlenmiş motoru mevcut model ve scaler'dan yeniden oluşturur"""
+        
+        self.engine = compile_model(self.model, self.scaler) if self.use_compiled_engine else None
     
     def get_feature_importance(self) -> pd.DataFrame:
         """Özellik önem derecelerini döndürür"""
@@ -175,16 +323,26 @@ class RiskPredictor:
                 'accuracy': self.accuracy,
                 'precision': self.precision,
                 'recall': self.recall,
-                'f1_score': self.f1
+                'f1_score': self.f1,
+                'evaluation': getattr(self, 'evaluation', None),
+                'oob_score': getattr(self, 'oob_score', None),
+                'cv_mean': getattr(self, 'cv_mean', None),
+                'cv_std': getattr(self, 'cv_std', None),
+                'class_metrics': getattr(self, 'class_metrics', None)
             }
         }
         
-        joblib.dump(model_data, filepath)
+        # Geçici dosyaya yazılıp yerine taşınır; okuyucular yarım dosya görmez
+        tmp_path = f"{filepath}.tmp-{os.getpid()}"
+        joblib.dump(model_data, tmp_path)
+        os.replace(tmp_path, filepath)
         print(f"Model kaydedildi: {filepath}")
     
     def load_model(self, filepath: str = 'models/risk_predictor.joblib'):
         """Modeli yükler"""
         
+        self._check_mutable()
+        
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Model dosyası bulunamadı: {filepath}")
         
@@ -202,8 +360,15 @@ class RiskPredictor:
             self.precision = model_data['metrics']['precision']
             self.recall = model_data['metrics']['recall']
             self.f1 = model_data['metrics']['f1_score']
+            # Eski model dosyalarında değerlendirme modu kayıtlı değildir
+            self.evaluation = model_data['metrics'].get('evaluation')
+            self.oob_score = model_data['metrics'].get('oob_score')
+            self.cv_mean = model_data['metrics'].get('cv_mean')
+            self.cv_std = model_data['metrics'].get('cv_std')
+            self.class_metrics = model_data['metrics'].get('class_metrics')
         
         self.is_trained = True
+        self._model_changed()
         print(f"Model yüklendi: {filepath}")
     
     def get_model_info(self) -> dict:
@@ -220,7 +385,11 @@ class RiskPredictor:
                 'accuracy': self.accuracy,
                 'precision': self.precision,
                 'recall': self.recall,
-                'f1_score': self.f1
+                'f1_score': self.f1,
+                'evaluation': getattr(self, 'evaluation', None),
+                'oob_score': getattr(self, 'oob_score', None),
+                'cv_mean': getattr(self, 'cv_mean', None),
+                'cv_std': getattr(self, 'cv_std', None)
             })
         
         return info 
\ No newline at end of file
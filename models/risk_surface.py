@@ -0,0 +1,197 @@
+"""
+TestScope AI - Önceden Hesaplanmış Risk Yüzeyi
+Arayüz kaydırıcı alanını kaplayan kaba ızgarada model risk skorlarını bir kez
+hesaplar, model dosyasının yanında bellek eşlemeli dizi olarak saklar ve
+çok doğrusal ara değerleme ile sabit sürede yanıt verir.
+"""
+
+import pandas as pd
+import numpy as np
+from itertools import product
+from typing import Dict, Optional
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.fingerprint import model_fingerprint
+
+# Kaydırıcı alanı üzerinde ızgara eksenleri (uçlar dahil)
+DEFAULT_AXES = {
+    'temperature': np.linspace(-40, 70, 23),   # 5 °C
+    'humidity': np.linspace(10, 95, 18),       # 5 %
+    'vibration': np.linspace(0.1, 50.0, 26),   # ~2 g
+    'pressure': np.linspace(800, 1200, 17)     # 25 hPa
+}
+
+
+class RiskSurface:
+    """Izgara üzerinde önceden hesaplanmış risk skoru yüzeyi
+
+    Her sorgu, çevreleyen hücrenin 16 köşe değerinden ara değerlenir. Köşe yayılımı
+    (corner_spread) köşe değerlerinin aralığıdır (en büyük - en küçük); hücre
+    içindeki model değişiminin sezgisel bir tahminidir, model hatası için garanti
+    edilmiş bir sınır değildir. Izgara dışındaki ya da karar eşiğine köşe
+    yayılımından daha yakın noktalar gerçek modelle skorlanır.
+    """
+
+    def __init__(self, predictor, axes: Optional[Dict[str, np.ndarray]] = None,
+                 values: Optional[np.ndarray] = None):
+        self.predictor = predictor
+        self.axes = {name: np.asarray((axes or DEFAULT_AXES)[name], dtype=np.float64)
+                     for name in predictor.feature_names}
+        self.values = values
+
+        # Hücre köşelerinin bit desenleri ve düz dizideki eksen adımları
+        dims = len(self.axes)
+        self._corners = np.array(list(product((0, 1), repeat=dims)))
+        self._strides = np.array([int(np.prod(self.shape[d + 1:])) for d in range(dims)])
+
+    @property
+    def shape(self):
+        return tuple(len(axis) for axis in self.axes.values())
+
+    def build(self, batch_size: int = 50_000) -> 'RiskSurface':
+        """Izgara noktalarını predict_batch ile parçalar halinde skorlar"""
+
+        grids = np.meshgrid(*self.axes.values(), indexing='ij')
+        points = pd.DataFrame({name: grid.ravel() for name, grid in zip(self.axes, grids)})
+
+        values = np.empty(len(points), dtype=np.float32)
+        for start in range(0, len(points), batch_size):
+            batch = self.predictor.predict_batch(points.iloc[start:start + batch_size])
+            values[start:start + batch_size] = batch['risk_score'].to_numpy()
+
+        self.values = values.reshape(self.shape)
+        return self
+
+    @classmethod
+    def for_model(cls, predictor, model_path: str = 'models/risk_predictor.joblib',
+                  axes: Optional[Dict[str, np.ndarray]] = None) -> 'RiskSurface':
+        """Model dosyasının yanındaki yüzeyi bellek eşlemeli açar; yoksa veya model
+        değiştiyse yeniden hesaplayıp kaydeder"""
+
+        surface = cls(predictor, axes)
+        base = os.path.splitext(model_path)[0]
+        values_path = base + '.surface.npy'
+        meta_path = base + '.surface.json'
+
+        meta = {
+            'fingerprint': model_fingerprint(model_path),
+            'axes': {name: axis.tolist() for name, axis in surface.axes.items()}
+        }
+
+        if os.path.exists(values_path) and os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as f:
+                if json.load(f) == meta:
+                    surface.values = np.load(values_path, mmap_mode='r')
+                    return surface
+
+        surface.build()
+        surface.save(values_path, meta_path, meta)
+        surface.values = np.load(values_path, mmap_mode='r')
+        return surface
+
+    def save(self, values_path: str, meta_path: str, meta: Dict):
+        """Yüzeyi ve üst verisini geçici dosyalar üzerinden atomik olarak yazar"""
+
+        tmp_values = values_path + '.tmp'
+        with open(tmp_values, 'wb') as f:
+            np.save(f, self.values)
+        os.replace(tmp_values, values_path)
+
+        tmp_meta = meta_path + '.tmp'
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta, meta_path)
+
+    def interpolate(self, X):
+        """Ara değerlenmiş risk, köşe yayılımı ve ızgara içinde olma maskesi döndürür
+
+        X, özellik adlarıyla indekslenebilen bir DataFrame veya dizi sözlüğüdür.
+        """
+
+        columns = [np.atleast_1d(np.asarray(X[name], dtype=np.float64)) for name in self.axes]
+        n = len(columns[0])
+        lower, fractions = [], []
+        inside = np.ones(n, dtype=bool)
+
+        for x, axis in zip(columns, self.axes.values()):
+            inside &= (x >= axis[0]) & (x <= axis[-1])
+
+            i = np.clip(np.searchsorted(axis, x, side='right') - 1, 0, len(axis) - 2)
+            lower.append(i)
+            fractions.append(np.clip((x - axis[i]) / (axis[i + 1] - axis[i]), 0.0, 1.0))
+
+        # Hücrenin 2^d köşesi tek bir düz indeksleme ile okunur; köşe ağırlığı her
+        # eksende (1 - f) veya f çarpanıdır
+        corners, strides = self._corners, self._strides
+
+        base = sum(i * stride for i, stride in zip(lower, strides))
+        flat = np.asarray(self.values).reshape(-1)
+        values = flat[base[None, :] + (corners @ strides)[:, None]].astype(np.float64)
+
+        weights = np.ones_like(values)
+        for d, f in enumerate(fractions):
+            weights *= np.where(corners[:, d:d + 1] == 1, f[None, :], 1.0 - f[None, :])
+
+        risk = (weights * values).sum(axis=0)
+        low = values.min(axis=0)
+        high = values.max(axis=0)
+
+        return risk, high - low, inside
+
+    def lookup(self, X: pd.DataFrame, fallback: bool = True) -> pd.DataFrame:
+        """Risk skoru, köşe yayılımı ve kaynağı ('surface' / 'model') döndürür
+
+        fallback=True ise ızgara dışı ve karar eşiğine köşe yayılımından yakın
+        noktalar gerçek modelle skorlanır; bu noktaların köşe yayılımı 0'dır.
+        """
+
+        risk, spread, inside = self.interpolate(X)
+        source = np.full(len(X), 'surface', dtype=object)
+
+        if fallback:
+            threshold = self.predictor.decision_threshold
+            exact = ~inside | (np.abs(risk - threshold) <= spread)
+
+            if exact.any():
+                scored = self.predictor.predict_batch(X.loc[exact, self.predictor.feature_names])
+                risk[exact] = scored['risk_score'].to_numpy()
+                spread[exact] = 0.0
+                source[exact] = 'model'
+
+        return pd.DataFrame({
+            'risk_score': np.round(risk, 3),
+            'corner_spread': np.round(spread, 3),
+            'source': source
+        }, index=X.index)
+
+    def lookup_one(self, temperature: float, humidity: float, vibration: float,
+                   pressure: float, fallback: bool = True) -> dict:
+        """Tek nokta için risk skoru, köşe yayılımı ve kaynak döndürür"""
+
+        point = {
+            'temperature': temperature,
+            'humidity': humidity,
+            'vibration': vibration,
+            'pressure': pressure
+        }
+        risk, spread, inside = self.interpolate(point)
+
+        # Çoğu sorgu DataFrame kurulmadan doğrudan yüzeyden yanıtlanır
+        near_boundary = abs(risk[0] - self.predictor.decision_threshold) <= spread[0]
+        if not fallback or (inside[0] and not near_boundary):
+            return {
+                'risk_score': round(float(risk[0]), 3),
+                'corner_spread': round(float(spread[0]), 3),
+                'source': 'surface'
+            }
+
+        X = pd.DataFrame([{
+            'temperature': temperature,
+            'humidity': humidity,
+            'vibration': vibration,
+            'pressure': pressure
+        }])
+        return self.lookup(X, fallback).iloc[0].to_dict()
@@ -0,0 +1,205 @@
+"""
+TestScope AI - Test Kabini Telemetri Simülatörü
+TestDataGenerator'ın ürettiği test kayıtlarını, test tipine özgü zaman profilleri
+(termal şok çevrimleri, nem rampaları, titreşim taramaları) ile yüksek örnekleme
+hızlı sensör zaman serilerine dönüştürür.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from data_generator import TestDataGenerator
+from utils.dataset_schema import FEATURE_COLUMNS
+from utils.ring_buffer import RingBuffer
+
+# Kanal sırası: temperature, humidity, vibration, pressure
+TEMP, HUM, VIB, PRES = range(len(FEATURE_COLUMNS))
+
+# Kabin ortam koşulları (rampaların başlangıç değeri)
+AMBIENT = np.array([23.0, 50.0, 0.0, 1013.25])
+
+# Kanal başına sensör gürültüsü (standart sapma)
+SENSOR_NOISE = np.array([0.05, 0.2, 0.01, 0.1], dtype=np.float32)
+
+
+class ChamberTelemetrySimulator:
+    """Test tipine göre kabin sensör zaman serisi üretici
+
+    Her test kaydının sıcaklık, nem, titreşim ve basınç değerleri profil ayar
+    noktası olarak kullanılır. Örnekler sabit boyutlu bloklar halinde hesaplanır
+    ve isteğe bağlı olarak önceden ayrılmış bir RingBuffer'a yazılır.
+    """
+
+    def __init__(self, sample_rate: float = 1000.0, block_size: int = 65_536,
+                 duration_scale: float = 60.0,
+                 generator: Optional[TestDataGenerator] = None):
+        if sample_rate <= 0:
+            raise ValueError(f"Geçersiz örnekleme hızı: {sample_rate}")
+        if block_size <= 0:
+            raise ValueError(f"Geçersiz blok boyutu: {block_size}")
+
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        # Test süresinin (dakika) simüle edilen saniyeye çarpanı; 60 gerçek zamandır
+        self.duration_scale = duration_scale
+        self.generator = generator or TestDataGenerator()
+
+        # Blok içi zaman ofsetleri ve blok çalışma alanı bir kez ayrılır
+        self._offsets = np.arange(block_size, dtype=np.float64) / sample_rate
+        self._block = np.empty((len(FEATURE_COLUMNS), block_size), dtype=np.float64)
+
+        # Test tipi -> profil fonksiyonu
+        self.profiles: Dict[str, Callable] = {
+            'high_temp': self._temperature_ramp,
+            'low_temp': self._temperature_ramp,
+            'thermal_shock': self._thermal_shock,
+            'humidity_resistance': self._humidity_ramp,
+            'condensation': self._condensation,
+            'water_splash': self._water_splash,
+            'mechanical_vibration': self._sine_sweep,
+            'acoustic_vibration': self._random_vibration,
+            'shock': self._shock_pulses
+        }
+
+    def make_buffer(self, seconds: float = 60.0) -> RingBuffer:
+        """Son ``seconds`` saniyelik telemetriyi tutacak tampon oluşturur"""
+
+        return RingBuffer(int(seconds * self.sample_rate), len(FEATURE_COLUMNS))
+
+    def iter_blocks(self, tests: Optional[pd.DataFrame] = None, num_tests: int = 10,
+                    seed: Optional[int] = None,
+                    buffer: Optional[RingBuffer] = None) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """Testlerin telemetrisini (test_id, zaman, değerler) blokları halinde üretir
+
+        tests verilmezse TestDataGenerator ile num_tests kayıt üretilir. Zaman her
+        testin başından itibaren saniyedir; değerler ``(kanal, n)`` biçimlidir ve bir
+        sonraki bloğa kadar geçerli olan çalışma alanı görünümleridir. buffer
+        verilirse her blok ayrıca tampona yazılır.
+        """
+
+        # Test verisi ve sensör gürültüsü aynı kök tohumdan türetilen bağımsız akışlarla üretilir;
+        # tohum verilmezse üretici gibi global np.random durumundan çözülür (np.random.seed ile tekrarlanabilir)
+        data_seed, noise_seed = np.random.SeedSequence(self.generator._resolve_seed(seed)).spawn(2)
+        rng = np.random.default_rng(noise_seed)
+        if tests is None:
+            tests = self.generator.generate_test_data(num_tests,
+                                                      seed=int(data_seed.generate_state(1)[0]))
+
+        setpoints = tests[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+        durations = tests['test_duration'].to_numpy(dtype=np.float64) * self.duration_scale
+        test_ids = tests['test_id'].to_numpy()
+        test_types = tests['test_type'].astype(str).to_numpy()
+
+        for test_id, test_type, setpoint, duration in zip(test_ids, test_types, setpoints, durations):
+            profile = self.profiles.get(test_type)
+            if profile is None:
+                raise ValueError(f"Bilinmeyen test tipi: {test_type}")
+
+            total = int(duration * self.sample_rate)
+
+            for start in range(0, total, self.block_size):
+                n = min(self.block_size, total - start)
+                t = self._offsets[:n] + start / self.sample_rate
+                block = self._block[:, :n]
+
+                # Tüm kanallar ayar noktasında başlar, profil etkin kanalları yeniden yazar
+                block[:] = setpoint[:, None]
+                profile(t, duration, setpoint, block, rng)
+                block += SENSOR_NOISE[:, None] * rng.standard_normal((len(FEATURE_COLUMNS), n),
+                                                                     dtype=np.float32)
+
+                if buffer is not None:
+                    buffer.write(block, t)
+
+                yield int(test_id), t, block
+
+    def simulate(self, tests: Optional[pd.DataFrame] = None, num_tests: int = 10,
+                 seed: Optional[int] = None,
+                 buffer: Optional[RingBuffer] = None) -> RingBuffer:
+        """Tüm testleri simüle edip tampona yazar; tampon döndürülür"""
+
+        if buffer is None:
+            buffer = self.make_buffer()
+
+        for _ in self.iter_blocks(tests, num_tests, seed, buffer):
+            pass
+
+        return buffer
+
+    # Profiller - t: saniye dizisi, out: (kanal, n) ayar noktalarıyla doldurulmuş blok
+
+    @staticmethod
+    def _ramp(t: np.ndarray, start: float, target: float, ramp_seconds: float) -> np.ndarray:
+        """Başlangıç değerinden hedefe doğrusal rampa, ardından bekleme"""
+
+        return start + (target - start) * np.clip(t / ramp_seconds, 0.0, 1.0)
+
+    def _temperature_ramp(self, t, duration, setpoint, out, rng):
+        """Yüksek/düşük sıcaklık: ortamdan ayar noktasına rampa ve bekleme"""
+
+        out[TEMP] = self._ramp(t, AMBIENT[TEMP], setpoint[TEMP], 0.1 * duration)
+
+    def _thermal_shock(self, t, duration, setpoint, out, rng, cycles: int = 5):
+        """Termal şok: ayar noktası ile ortama göre simetriği arasında çevrim
+
+        Her yarım çevrimde sıcaklık, transfer sonrası birinci dereceden yanıtla hedefe yaklaşır.
+        """
+
+        hot = max(setpoint[TEMP], 2 * AMBIENT[TEMP] - setpoint[TEMP])
+        cold = min(setpoint[TEMP], 2 * AMBIENT[TEMP] - setpoint[TEMP])
+        half = duration / (2 * cycles)
+        tau = half / 5
+
+        phase = np.mod(t, 2 * half)
+        heating = phase < half
+        elapsed = np.where(heating, phase, phase - half)
+        target = np.where(heating, hot, cold)
+        previous = np.where(heating, cold, hot)
+
+        out[TEMP] = target + (previous - target) * np.exp(-elapsed / tau)
+
+    def _humidity_ramp(self, t, duration, setpoint, out, rng):
+        """Nem dayanımı: ortam neminden ayar noktasına rampa ve bekleme"""
+
+        out[HUM] = self._ramp(t, AMBIENT[HUM], setpoint[HUM], 0.2 * duration)
+
+    def _condensation(self, t, duration, setpoint, out, rng, cycles: int = 4):
+        """Yoğuşma: sıcaklık çevrimi, sıcaklık düştükçe bağıl nem yükselir"""
+
+        swing = np.sin(2 * np.pi * cycles * t / duration)
+        out[TEMP] = setpoint[TEMP] + 10.0 * swing
+        out[HUM] = np.clip(setpoint[HUM] - 15.0 * swing, 0.0, 100.0)
+
+    def _water_splash(self, t, duration, setpoint, out, rng, period: float = 60.0,
+                      spray_seconds: float = 10.0):
+        """Su sıçratma: periyodik püskürtme aralıklarında nem doyuma çıkar"""
+
+        spraying = np.mod(t, period) < spray_seconds
+        out[HUM] = np.where(spraying, 100.0, setpoint[HUM])
+
+    def _sine_sweep(self, t, duration, setpoint, out, rng, f_start: float = 5.0,
+                    f_end: float = 500.0):
+        """Mekanik titreşim: logaritmik sinüs taraması, genlik ayar noktasıdır
+
+        Frekans, örnekleme hızının yarısını (Nyquist) aşmayacak şekilde sınırlanır.
+        """
+
+        f_end = min(f_end, self.sample_rate / 2)
+        sweep = min(duration, 600.0)
+        rate = np.log(f_end / f_start) / sweep
+        phase = 2 * np.pi * f_start * np.expm1(rate * np.mod(t, sweep)) / rate
+
+        out[VIB] = setpoint[VIB] * np.sin(phase)
+
+    def _random_vibration(self, t, duration, setpoint, out, rng):
+        """Akustik titreşim: RMS değeri ayar noktası olan geniş bantlı gürültü"""
+
+        out[VIB] = setpoint[VIB] * rng.standard_normal(len(t), dtype=np.float32)
+
+    def _shock_pulses(self, t, duration, setpoint, out, rng, period: float = 1.0,
+                      width: float = 0.011):
+        """Darbe: her periyotta 11 ms yarım sinüs darbesi, tepe değeri ayar noktasıdır"""
+
+        phase = np.mod(t, period)
+        out[VIB] = np.where(phase < width, setpoint[VIB] * np.sin(np.pi * phase / width), 0.0)
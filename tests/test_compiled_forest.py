@@ -0,0 +1,56 @@
+"""
+TestScope AI - Derlenmiş Orman Motoru Testleri
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import data_generator
+from models.compiled_forest import CompiledForest, compile_model
+from models.risk_predictor import RiskPredictor
+
+
+@pytest.fixture(scope='module')
+def trained_model():
+    X, y = data_generator.TestDataGenerator().generate_training_data(1500, seed=0)
+    predictor = RiskPredictor(n_jobs=1)
+    predictor.train(X, y, evaluation='oob')
+    return predictor
+
+
+@pytest.fixture(scope='module')
+def rows(trained_model):
+    X, _ = data_generator.TestDataGenerator().generate_training_data(3000, seed=1)
+    X = X[trained_model.feature_names]
+    # Kaydırıcı ızgarasındaki (eşiklere denk gelebilen) tamsayı değerler de denenir
+    grid = X.round({'temperature': 0, 'humidity': 0, 'vibration': 1, 'pressure': 0})
+    return np.vstack([X.to_numpy(), grid.to_numpy()])
+
+
+def sklearn_proba(model: RiskPredictor, X: np.ndarray) -> np.ndarray:
+    features = pd.DataFrame(X, columns=model.feature_names)
+    return model.model.predict_proba(model.scaler.transform(features))
+
+
+def test_engine_probabilities_equal_sklearn(trained_model, rows):
+    engine = compile_model(trained_model.model, trained_model.scaler)
+
+    assert np.array_equal(engine.predict_proba(rows), sklearn_proba(trained_model, rows))
+    assert np.array_equal(engine.predict_proba(rows[0]), sklearn_proba(trained_model, rows[:1]))
+
+
+def test_saved_engine_is_memory_mapped_and_equal(trained_model, rows, tmp_path):
+    engine = compile_model(trained_model.model, trained_model.scaler)
+    engine.save(str(tmp_path / 'engine'))
+
+    loaded = CompiledForest.load(str(tmp_path / 'engine'))
+
+    assert isinstance(loaded.threshold.base, np.memmap)
+    assert isinstance(loaded.leaf_values.base, np.memmap)
+    assert loaded.depth == engine.depth
+    assert np.array_equal(loaded.predict_proba(rows), sklearn_proba(trained_model, rows))
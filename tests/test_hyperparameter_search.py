@@ -0,0 +1,63 @@
+"""
+TestScope AI - Bütçeli Hiperparametre Araması Testleri
+"""
+
+import os
+import sys
+import types
+
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import data_generator
+import models.hyperparameter_search as hyperparameter_search
+from models.hyperparameter_search import BudgetedSearch
+
+PARAM_SPACE = {'C': [0.001, 0.01, 0.1, 1, 10, 100], 'fit_intercept': [True, False]}
+
+
+@pytest.fixture(scope='module')
+def training_data():
+    return data_generator.TestDataGenerator().generate_training_data(1200, seed=0)
+
+
+def fake_clock(monkeypatch, trials_before_timeout: int):
+    """Her bütçe kontrolünde bir saniye ilerleyen saat; bu kadar denemeden sonra bütçe dolar"""
+
+    ticks = iter(range(10_000))
+    monkeypatch.setattr(hyperparameter_search, 'time',
+                        types.SimpleNamespace(perf_counter=lambda: next(ticks)))
+    return trials_before_timeout + 0.5
+
+
+def search(time_budget=None) -> BudgetedSearch:
+    return BudgetedSearch(LogisticRegression(max_iter=1000), PARAM_SPACE, n_candidates=9,
+                          sampler='random', time_budget=time_budget, n_jobs=1)
+
+
+@pytest.mark.parametrize('partial_trials', [1, 2])
+def test_timeout_mid_rung_selects_from_completed_rung(training_data, monkeypatch, partial_trials):
+    X, y = training_data
+    first_rung = len(search().sample_candidates())
+
+    searcher = search(fake_clock(monkeypatch, first_rung + partial_trials))
+    searcher.fit(X, y)
+
+    completed = searcher.trials[:first_rung]
+    best = max(completed, key=lambda t: t['score'])
+
+    assert searcher.budget_exhausted
+    assert len(searcher.trials) == first_rung + partial_trials
+    assert searcher.best_params_ == best['params']
+    assert searcher.best_score_ == best['score']
+
+
+def test_timeout_in_first_rung_uses_finished_trials(training_data, monkeypatch):
+    X, y = training_data
+
+    searcher = search(fake_clock(monkeypatch, 3))
+    searcher.fit(X, y)
+
+    assert searcher.budget_exhausted
+    assert searcher.best_score_ == max(t['score'] for t in searcher.trials)
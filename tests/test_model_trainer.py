@@ -0,0 +1,48 @@
+"""
+TestScope AI - Eğitim Pipeline'ı Önbellek Testleri
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import models.model_trainer as model_trainer
+from models.model_trainer import ModelTrainer
+
+
+@pytest.fixture
+def training_runs(tmp_path, monkeypatch):
+    """Pipeline'ı geçici dizinlerle çalıştırır; model eğitimi çağrılarını sayar"""
+
+    calls = []
+    train = ModelTrainer.train_multiple_models
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return train(self, *args, **kwargs)
+
+    monkeypatch.setattr(ModelTrainer, 'train_multiple_models', counting)
+
+    def run(**kwargs):
+        ModelTrainer().full_training_pipeline(
+            600, cache_dir=str(tmp_path / 'cache'), plot_dpi=20,
+            model_path=str(tmp_path / 'model.joblib'), plot_path=str(tmp_path / 'plots') + os.sep,
+            report_path=str(tmp_path / 'report.txt'), **kwargs
+        )
+        return len(calls)
+
+    return run
+
+
+def test_default_run_is_served_from_cache(training_runs):
+    assert training_runs() == 1
+    assert training_runs() == 1
+
+
+def test_training_options_are_part_of_model_key(training_runs, monkeypatch):
+    assert training_runs() == 1
+
+    monkeypatch.setattr(model_trainer, 'TRAIN_OPTIONS', {'test_size': 0.25, 'evaluation': 'auto'})
+    assert training_runs() == 2
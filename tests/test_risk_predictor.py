@@ -0,0 +1,98 @@
+"""
+TestScope AI - RiskPredictor Testleri
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import data_generator
+from models.risk_predictor import RiskPredictor
+
+FEATURES = ['temperature', 'humidity', 'vibration', 'pressure']
+
+
+@pytest.fixture(scope='module')
+def training_data():
+    return data_generator.TestDataGenerator().generate_training_data(1500, seed=0)
+
+
+@pytest.fixture(scope='module')
+def trained_model(training_data):
+    X, y = training_data
+    predictor = RiskPredictor(n_jobs=1)
+    predictor.train(X, y, evaluation='oob')
+    return predictor
+
+
+def uncached_prediction(model: RiskPredictor, row: pd.DataFrame) -> dict:
+    """Önbelleği atlayarak (olasılıkları doğrudan hesaplayarak) tahmin yapar"""
+
+    cache, model.cache = model.cache, None
+    try:
+        return model.predict(row)
+    finally:
+        model.cache = cache
+
+
+def frame(temperature: float, humidity: float, vibration: float, pressure: float) -> pd.DataFrame:
+    return pd.DataFrame([[temperature, humidity, vibration, pressure]], columns=FEATURES)
+
+
+@pytest.mark.parametrize('temperatures', [(59.6, 60.4), (60.4, 59.6), (60.0, 60.4), (60.4, 60.0)])
+def test_cached_prediction_does_not_depend_on_call_order(trained_model, temperatures):
+    trained_model.cache.clear()
+
+    for temperature in temperatures:
+        row = frame(temperature, 80, 20, 1000)
+        assert trained_model.predict(row) == uncached_prediction(trained_model, row)
+
+
+def test_grid_inputs_are_served_from_cache(trained_model):
+    trained_model.cache.clear()
+    row = frame(60, 80, 2.3, 1000)
+    hits = trained_model.cache.hits
+
+    first = trained_model.predict(row)
+    second = trained_model.predict(row)
+
+    assert first == second == uncached_prediction(trained_model, row)
+    assert trained_model.cache.hits == hits + 1
+
+
+@pytest.mark.parametrize('evaluation', ['oob', 'cv'])
+def test_evaluation_metrics_round_trip(training_data, tmp_path, evaluation):
+    X, y = training_data
+    predictor = RiskPredictor(n_jobs=1)
+    metrics = predictor.train(X, y, evaluation=evaluation, cv_jobs=1)
+
+    if evaluation == 'oob':
+        assert metrics['oob_score'] is not None
+        assert metrics['cv_mean'] is None and metrics['cv_std'] is None
+    else:
+        assert metrics['oob_score'] is None
+        assert metrics['cv_mean'] is not None and metrics['cv_std'] is not None
+
+    path = str(tmp_path / 'risk_predictor.joblib')
+    predictor.save_model(path)
+    loaded = RiskPredictor()
+    loaded.load_model(path)
+
+    assert loaded.evaluation == evaluation
+    assert loaded.oob_score == metrics['oob_score']
+    assert loaded.cv_mean == metrics['cv_mean']
+    assert loaded.cv_std == metrics['cv_std']
+
+
+def test_batch_prediction_keeps_input_columns(trained_model, training_data):
+    X, _ = training_data
+    X = X.head(50).astype('float64')
+
+    results = trained_model.predict_batch(X)
+
+    pd.testing.assert_frame_equal(results[X.columns], X)
+    assert str(results['risk_score'].dtype) == 'float32'
+    assert list(results['prediction'].cat.categories) == ['PASS', 'FAIL']
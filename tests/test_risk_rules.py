@@ -0,0 +1,238 @@
+"""
+TestScope AI - Risk Kuralı Bant Testleri
+Kural dosyasından derlenen bantlar, kural motorundan önceki sabit if/elif
+eşikleriyle (kenar değerleri ve dahil/hariç karşılaştırmalar dahil) karşılaştırılır.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import data_generator
+from utils.data_processor import DataProcessor
+
+PARAMETERS = ['temperature', 'humidity', 'vibration', 'pressure']
+
+# Bant kenarları - her kenar, altındaki ve üstündeki komşu float değerlerle birlikte denenir
+EDGES = {
+    'temperature': [-35, -30, -20, -10, 0, 20, 30, 40, 50, 60, 65],
+    'humidity': [15, 60, 70, 80, 85, 90, 95],
+    'vibration': [10, 20, 25, 30, 40],
+    'pressure': [850, 900, 950, 1050, 1100, 1150]
+}
+NOMINAL = {'temperature': 25.0, 'humidity': 50.0, 'vibration': 5.0, 'pressure': 1000.0}
+
+STANDARDS = ['MIL-STD-810H Method 501.7', 'ISO 16750-4', 'IEC 60068-2-6', 'Bilinmeyen Standart']
+
+
+def baseline_risk_score(temp, humidity, vibration, pressure):
+    """Kural motorundan önceki TestDataGenerator._calculate_risk_score (gürültüsüz)"""
+
+    risk = 0.0
+
+    if temp > 65 or temp < -35:
+        risk += 0.5
+    elif temp > 60 or temp < -30:
+        risk += 0.4
+    elif temp > 50 or temp < -20:
+        risk += 0.3
+    elif temp > 40 or temp < -10:
+        risk += 0.2
+    elif temp > 30 or temp < 0:
+        risk += 0.1
+
+    if humidity > 95:
+        risk += 0.4
+    elif humidity > 90:
+        risk += 0.3
+    elif humidity > 80:
+        risk += 0.2
+    elif humidity < 15:
+        risk += 0.15
+
+    if vibration > 40:
+        risk += 0.5
+    elif vibration > 30:
+        risk += 0.4
+    elif vibration > 20:
+        risk += 0.3
+    elif vibration > 10:
+        risk += 0.2
+
+    if pressure < 850 or pressure > 1150:
+        risk += 0.3
+    elif pressure < 900 or pressure > 1100:
+        risk += 0.2
+    elif pressure < 950 or pressure > 1050:
+        risk += 0.1
+
+    high_risk_params = 0
+    if temp > 60 or temp < -30:
+        high_risk_params += 1
+    if humidity > 90:
+        high_risk_params += 1
+    if vibration > 30:
+        high_risk_params += 1
+    if pressure < 900 or pressure > 1100:
+        high_risk_params += 1
+
+    if high_risk_params >= 2:
+        risk += 0.2
+
+    return max(0.0, min(1.0, risk))
+
+
+def baseline_risk_factors(temperature, humidity, vibration, pressure):
+    """Kural motorundan önceki DataProcessor.calculate_risk_factors"""
+
+    if temperature >= 60:
+        temp_risk = 0.95
+    elif temperature >= 50:
+        temp_risk = 0.8
+    elif temperature >= 40:
+        temp_risk = 0.6
+    elif temperature >= 30:
+        temp_risk = 0.4
+    elif temperature >= 20:
+        temp_risk = 0.2
+    else:
+        temp_risk = 0.1
+
+    if humidity >= 90:
+        humidity_risk = 0.95
+    elif humidity >= 85:
+        humidity_risk = 0.85
+    elif humidity >= 80:
+        humidity_risk = 0.7
+    elif humidity >= 70:
+        humidity_risk = 0.5
+    elif humidity >= 60:
+        humidity_risk = 0.3
+    else:
+        humidity_risk = 0.1
+
+    if vibration >= 40:
+        vibration_risk = 0.9
+    elif vibration >= 30:
+        vibration_risk = 0.8
+    elif vibration >= 25:
+        vibration_risk = 0.5
+    elif vibration >= 20:
+        vibration_risk = 0.4
+    elif vibration >= 10:
+        vibration_risk = 0.2
+    else:
+        vibration_risk = 0.1
+
+    if pressure <= 850 or pressure >= 1150:
+        pressure_risk = 0.8
+    elif pressure <= 900 or pressure >= 1100:
+        pressure_risk = 0.5
+    elif pressure <= 950 or pressure >= 1050:
+        pressure_risk = 0.2
+    else:
+        pressure_risk = 0.05
+
+    return {
+        'temperature_risk': temp_risk,
+        'humidity_risk': humidity_risk,
+        'vibration_risk': vibration_risk,
+        'pressure_risk': pressure_risk,
+        'total_risk': (temp_risk + humidity_risk + vibration_risk + pressure_risk) / 4
+    }
+
+
+def edge_cases() -> pd.DataFrame:
+    """Her kenarda (tam kenar ve iki komşu float) tek parametresi değişen satırlar
+    ile rastgele birleşik satırlar"""
+
+    rows = []
+    for name, edges in EDGES.items():
+        for edge in edges:
+            for value in (np.nextafter(edge, -np.inf), float(edge), np.nextafter(edge, np.inf)):
+                rows.append({**NOMINAL, name: value})
+
+    # Kenar değerlerinden rastgele birleşimler - kombinasyon riskini de kapsar
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        row = {}
+        for name, edges in EDGES.items():
+            edge = float(rng.choice(edges))
+            row[name] = edge + rng.choice([-1.0, -1e-9, 0.0, 1e-9, 1.0])
+        rows.append(row)
+
+    return pd.DataFrame(rows, columns=PARAMETERS)
+
+
+@pytest.fixture(scope='module')
+def cases():
+    return edge_cases()
+
+
+@pytest.fixture(scope='module')
+def generator():
+    return data_generator.TestDataGenerator()
+
+
+@pytest.fixture(scope='module')
+def processor():
+    return DataProcessor()
+
+
+def row_standards(n: int) -> list:
+    return [STANDARDS[i % len(STANDARDS)] for i in range(n)]
+
+
+@pytest.mark.parametrize('per_row_standards', [False, True])
+def test_risk_scores_match_baseline(generator, cases, per_row_standards):
+    standards = row_standards(len(cases)) if per_row_standards else None
+    scores = generator.calculate_risk_scores(
+        *(cases[name].to_numpy() for name in PARAMETERS),
+        noise=np.zeros(len(cases)), standards=standards
+    )
+    expected = [baseline_risk_score(*row) for row in cases.itertuples(index=False)]
+
+    np.testing.assert_array_equal(scores, expected)
+
+
+def test_scalar_risk_score_matches_baseline(generator, cases, monkeypatch):
+    monkeypatch.setattr(np.random, 'normal', lambda *args, **kwargs: 0.0)
+
+    for i, row in enumerate(cases.itertuples(index=False)):
+        expected = baseline_risk_score(*row)
+        assert generator._calculate_risk_score(*row) == expected, row
+        assert generator._calculate_risk_score(*row, standard=STANDARDS[i % len(STANDARDS)]) == expected, row
+
+
+@pytest.mark.parametrize('per_row_standards', [False, True])
+def test_risk_factors_batch_match_baseline(processor, cases, per_row_standards):
+    standards = row_standards(len(cases)) if per_row_standards else None
+    factors = processor.calculate_risk_factors_batch(cases, standards)
+    expected = pd.DataFrame([baseline_risk_factors(*row) for row in cases.itertuples(index=False)])
+
+    pd.testing.assert_frame_equal(factors, expected, check_exact=True)
+
+
+def test_scalar_risk_factors_match_baseline(processor, cases):
+    for i, row in enumerate(cases.itertuples(index=False)):
+        expected = baseline_risk_factors(*row)
+        assert processor.calculate_risk_factors(*row) == expected, row
+        assert processor.calculate_risk_factors(*row, standard=STANDARDS[i % len(STANDARDS)]) == expected, row
+
+
+def test_generated_scores_use_row_standards(generator, monkeypatch):
+    seen = {}
+    score = generator.calculate_risk_scores
+
+    def recording(*args, **kwargs):
+        seen['standards'] = kwargs.get('standards')
+        return score(*args, **kwargs)
+
+    monkeypatch.setattr(generator, 'calculate_risk_scores', recording)
+    data = generator.generate_test_data(200, seed=0)
+
+    assert list(seen['standards']) == list(data['standard'])
@@ -0,0 +1,39 @@
+"""
+TestScope AI - Telemetri Simülatörü Testleri
+"""
+
+import itertools
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from telemetry_simulator import ChamberTelemetrySimulator
+
+
+def first_blocks(seed=None, count: int = 3) -> list:
+    blocks = ChamberTelemetrySimulator().iter_blocks(num_tests=2, seed=seed)
+    return [(test_id, time.copy(), values.copy())
+            for test_id, time, values in itertools.islice(blocks, count)]
+
+
+def assert_same_blocks(first: list, second: list):
+    assert len(first) == len(second)
+    for (id_a, time_a, values_a), (id_b, time_b, values_b) in zip(first, second):
+        assert id_a == id_b
+        np.testing.assert_array_equal(time_a, time_b)
+        np.testing.assert_array_equal(values_a, values_b)
+
+
+def test_unseeded_blocks_follow_global_seed():
+    np.random.seed(7)
+    first = first_blocks()
+    np.random.seed(7)
+    second = first_blocks()
+
+    assert_same_blocks(first, second)
+
+
+def test_seeded_blocks_are_reproducible():
+    assert_same_blocks(first_blocks(seed=3), first_blocks(seed=3))
@@ -0,0 +1,34 @@
+"""
+TestScope AI - Toplu Parametre Doğrulama Testleri
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.data_processor import DataProcessor
+from utils.dataset_schema import DatasetSchema
+
+PARAMETERS = ['temperature', 'humidity', 'vibration', 'pressure']
+
+
+def test_batch_messages_equal_scalar_messages():
+    processor = DataProcessor()
+    plan = pd.DataFrame({
+        'temperature': [75.3, -45.7, 25.0, 70.1],
+        'humidity': [50.0, 96.4, 8.2, 95.0],
+        'vibration': [5.5, 0.05, 50.3, 2.3],
+        'pressure': [1013.2, 790.6, 1200.0, 1250.8]
+    })
+    # Şema sayısal sütunları float32'ye dönüştürür
+    compact = DatasetSchema().apply(plan)
+
+    report = processor.validate_test_parameters_batch(compact)
+    messages = report.messages(rows=range(len(plan)))
+
+    for row, values in plan.iterrows():
+        scalar = processor.validate_test_parameters(*(values[p] for p in PARAMETERS))
+        assert messages[row] == scalar['warnings']
+    assert any(messages.values())
@@ -4,5 +4,16 @@ TestScope AI - Yardımcı Araçlar
 
 from .data_processor import DataProcessor
 from .visualizer import Visualizer
+from .risk_bands import BandTable
+from .columnar_storage import ColumnarStorage
+from .dataset_schema import DatasetSchema
+from .standards import StandardLookup
+from .ring_buffer import RingBuffer
+from .append_dataset import AppendableDataset
+from .artifact_cache import ArtifactCache
+from .risk_rules import RiskRuleEngine
+from .validation_report import ValidationReport
+from .frame_cache import FrameCache
+from .trend_aggregator import TrendAggregate
 
-__all__ = ['DataProcessor', 'Visualizer'] 
\ No newline at end of file
+__all__ = ['DataProcessor', 'Visualizer', 'BandTable', 'ColumnarStorage', 'DatasetSchema', 'StandardLookup', 'RingBuffer', 'AppendableDataset', 'ArtifactCache', 'RiskRuleEngine', 'ValidationReport', 'FrameCache', 'TrendAggregate'] 
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+TestScope AI - Eklemeli Test Veri Seti
+Bölümlenmiş Parquet/Feather veri setine yeni test kayıtlarını, test_id
+numaralandırmasını sürdürerek ekler. Küçük bir manifest dosyası satır sayısını,
+eklenen partileri ve bölüm başına tarih aralığını tutar.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional
+import json
+import os
+
+from .columnar_storage import ColumnarStorage
+from .dataset_schema import DatasetSchema
+
+
+class AppendableDataset:
+    """Yalnızca ekleme yapılan test veri seti ve manifesti
+
+    Her ``append`` çağrısı veri setine ``batch-NNNNNN`` adlı yeni dosyalar ekler;
+    mevcut dosyalara dokunulmaz. İzleme değeri (watermark) son eklenen test_id'dir;
+    ``read_since`` yalnızca bu değerden sonra eklenen partilerin dosyalarını okur.
+    """
+
+    MANIFEST_NAME = '_manifest.json'
+
+    def __init__(self, path: str, file_format: str = 'parquet'):
+        self.path = path
+        self.manifest_path = os.path.join(path, self.MANIFEST_NAME)
+        self.schema = DatasetSchema()
+
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        elif os.path.isdir(path) and os.listdir(path):
+            # Manifest olmadan yazılmış veri seti - manifest bir kez taranarak kurulur
+            self.manifest = self._build_manifest(ColumnarStorage.detect_format(path))
+            self._save_manifest()
+        else:
+            self.manifest = self._empty_manifest(file_format)
+
+        self.storage = ColumnarStorage(self.manifest['format'])
+
+    @property
+    def row_count(self) -> int:
+        return self.manifest['row_count']
+
+    @property
+    def watermark(self) -> int:
+        """Son eklenen kaydın test_id değeri (boş veri setinde 0)"""
+
+        return self.manifest['last_test_id']
+
+    @property
+    def partitions(self) -> Dict[str, Dict]:
+        """Bölüm başına satır sayısı ve min/max test_date"""
+
+        return self.manifest['partitions']
+
+    def append(self, df: pd.DataFrame) -> int:
+        """Kayıtları veri setine ekler ve yeni izleme değerini döndürür
+
+        test_id sütunu son kayıttan devam edecek şekilde yeniden numaralandırılır.
+        """
+
+        if df.empty:
+            return self.watermark
+
+        first_id = self.watermark + 1
+        df = df.assign(test_id=np.arange(first_id, first_id + len(df),
+                                         dtype=self.schema.dtypes['test_id']))
+
+        batch = len(self.manifest['batches'])
+        self.storage.write(df, self.path, basename=self._batch_basename(batch))
+
+        self.manifest['batches'].append({
+            'batch': batch,
+            'rows': len(df),
+            'first_test_id': first_id,
+            'last_test_id': first_id + len(df) - 1
+        })
+        self.manifest['row_count'] += len(df)
+        self.manifest['last_test_id'] = first_id + len(df) - 1
+        self._update_partitions(df)
+        self._save_manifest()
+
+        return self.watermark
+
+    def read_since(self, watermark: int = 0, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """İzleme değerinden sonra eklenen kayıtları okur
+
+        Yalnızca test_id aralığı izleme değerini aşan partilerin dosyaları açılır.
+        """
+
+        batches = [b['batch'] for b in self.manifest['batches'] if b['last_test_id'] > watermark]
+
+        if None in batches:
+            # Manifest öncesi yazılmış dosyalar parti adı taşımaz; tüm veri seti filtrelenir
+            files = None
+        else:
+            prefixes = tuple(self._batch_basename(b) + '-' for b in batches)
+            files = sorted(os.path.join(root, name)
+                           for root, _, names in os.walk(self.path)
+                           for name in names if prefixes and name.startswith(prefixes))
+
+        df = self.storage.read(self.path, columns=columns, files=files,
+                               after_test_id=watermark)
+        if 'test_id' in df.columns:
+            df = df.sort_values('test_id', ignore_index=True)
+
+        return self.schema.apply(df)
+
+    @staticmethod
+    def _batch_basename(batch: int) -> str:
+        return f'batch-{batch:06d}'
+
+    @staticmethod
+    def _empty_manifest(file_format: str) -> Dict:
+        return {
+            'format': file_format,
+            'row_count': 0,
+            'last_test_id': 0,
+            'batches': [],
+            'partitions': {}
+        }
+
+    def _build_manifest(self, file_format: str) -> Dict:
+        """Mevcut veri setini tarayarak manifest oluşturur (tüm dosyalar tek parti sayılır)"""
+
+        self.manifest = self._empty_manifest(file_format)
+        df = ColumnarStorage(file_format).read(
+            self.path, columns=['test_id', 'test_category', 'test_date']
+        )
+        if df.empty:
+            return self.manifest
+
+        ids = self.schema.parse_test_ids(df['test_id'])
+        self.manifest['batches'].append({
+            'batch': None,
+            'rows': len(df),
+            'first_test_id': int(ids.min()),
+            'last_test_id': int(ids.max())
+        })
+        self.manifest['row_count'] = len(df)
+        self.manifest['last_test_id'] = int(ids.max())
+        self._update_partitions(df)
+
+        return self.manifest
+
+    def _update_partitions(self, df: pd.DataFrame):
+        """Eklenen kayıtların bölüm satır sayılarını ve tarih aralıklarını manifeste işler"""
+
+        dates = pd.to_datetime(df['test_date'])
+        summary = dates.groupby(
+            [df['test_category'].astype(str).to_numpy(), ColumnarStorage.month_key(dates)]
+        ).agg(['size', 'min', 'max'])
+
+        partitions = self.manifest['partitions']
+        for (category, month), row in summary.iterrows():
+            key = f'test_category={category}/test_month={month}'
+            entry = partitions.setdefault(key, {
+                'rows': 0, 'min_date': row['min'].isoformat(), 'max_date': row['max'].isoformat()
+            })
+            entry['rows'] += int(row['size'])
+            entry['min_date'] = min(entry['min_date'], row['min'].isoformat())
+            entry['max_date'] = max(entry['max_date'], row['max'].isoformat())
+
+    def _save_manifest(self):
+        """Manifesti geçici dosyaya yazıp atomik olarak yerine taşır"""
+
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
@@ -0,0 +1,134 @@
+"""
+TestScope AI - İçerik Adresli Yapıt Önbelleği
+Pipeline aşamalarının çıktılarını, girdilerinin ve yapılandırmasının SHA-1 özetiyle
+adlandırılan dizinlerde saklar. Her aşama için son kullanılan girdiler tutulur;
+böylece ıskalarda hangi girdinin değiştiği raporlanabilir.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from typing import Callable, Dict, Optional, Tuple
+
+
+class ArtifactCache:
+    """Aşama adı + girdi özeti -> yapıt dizini
+
+    Yapıtlar geçici dizine yazılıp yerine taşınır; yarım kalan bir yazım önbellekte
+    görünmez. Her aşamada en son kullanılan ``keep`` yapıt saklanır.
+    """
+
+    def __init__(self, root: str = '.cache/training', keep: int = 5, verbose: bool = True):
+        if keep < 1:
+            raise ValueError(f"Geçersiz saklama sayısı: {keep}")
+
+        self.root = root
+        self.keep = keep
+        self.verbose = verbose
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(stage: str, inputs: Dict) -> str:
+        """Aşama girdilerinin kanonik JSON özetinden yapıt anahtarı üretir"""
+
+        payload = json.dumps({'stage': stage, 'inputs': inputs}, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def file_hash(path: str) -> Optional[str]:
+        """Dosya içeriğinin SHA-1 özeti (dosya yoksa None)"""
+
+        if not os.path.exists(path):
+            return None
+
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def path(self, stage: str, key: str) -> str:
+        return os.path.join(self.root, stage, key)
+
+    def lookup(self, stage: str, inputs: Dict) -> Tuple[str, Optional[str]]:
+        """(anahtar, yapıt dizini) döndürür; yapıt yoksa dizin None olur
+
+        Sonuç ve ıska nedeni (ilk çalıştırma ya da değişen girdiler) yazdırılır.
+        """
+
+        key = self.key(stage, inputs)
+        path = self.path(stage, key)
+
+        if os.path.isdir(path):
+            self.hits += 1
+            os.utime(path)
+            self._log(stage, f"isabet ({key[:10]})")
+            return key, path
+
+        self.misses += 1
+        self._log(stage, f"ıska - {self._miss_reason(stage, inputs)}")
+        return key, None
+
+    def store(self, stage: str, key: str, inputs: Dict, writer: Callable[[str], None]) -> str:
+        """writer(dizin) ile yapıtı üretir ve atomik olarak önbelleğe taşır"""
+
+        path = self.path(stage, key)
+        tmp_path = f'{path}.tmp-{os.getpid()}'
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+
+        writer(tmp_path)
+        with open(os.path.join(tmp_path, 'inputs.json'), 'w', encoding='utf-8') as f:
+            json.dump(inputs, f, sort_keys=True, default=str)
+
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Aynı anahtar başka bir süreç tarafından yazıldı; içerik aynıdır
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+        self._remember(stage, inputs)
+        self._prune(stage)
+        return path
+
+    def _miss_reason(self, stage: str, inputs: Dict) -> str:
+        """Son kullanılan girdilerle karşılaştırarak ıska nedenini açıklar"""
+
+        latest_path = os.path.join(self.root, stage, 'latest.json')
+        if not os.path.exists(latest_path):
+            return "önbellekte kayıt yok"
+
+        with open(latest_path, encoding='utf-8') as f:
+            previous = json.load(f)
+
+        current = json.loads(json.dumps(inputs, default=str))
+        changed = sorted(name for name in set(previous) | set(current)
+                         if previous.get(name) != current.get(name))
+        if not changed:
+            return "yapıt silinmiş"
+        return "değişen girdiler: " + ", ".join(changed)
+
+    def _remember(self, stage: str, inputs: Dict):
+        latest_path = os.path.join(self.root, stage, 'latest.json')
+        tmp_path = f'{latest_path}.tmp-{os.getpid()}'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(inputs, f, sort_keys=True, default=str)
+        os.replace(tmp_path, latest_path)
+
+    def _prune(self, stage: str):
+        """Aşamada en son kullanılan keep yapıt dışındakileri siler"""
+
+        stage_dir = os.path.join(self.root, stage)
+        entries = [os.path.join(stage_dir, name) for name in os.listdir(stage_dir)
+                   if '.' not in name and os.path.isdir(os.path.join(stage_dir, name))]
+        entries.sort(key=os.path.getmtime, reverse=True)
+
+        for old_path in entries[self.keep:]:
+            shutil.rmtree(old_path, ignore_errors=True)
+
+    def _log(self, stage: str, message: str):
+        if self.verbose:
+            print(f"[önbellek] {stage}: {message}")
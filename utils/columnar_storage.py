@@ -0,0 +1,144 @@
+"""
+TestScope AI - Sütunlu Veri Depolama
+Test verisini test_category ve test_date ayına göre bölümlenmiş Parquet/Feather
+veri seti olarak yazar; okurken yalnızca istenen sütun ve bölümleri yükler.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import List, Optional, Sequence, Union
+import os
+import shutil
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+    ds = None
+
+MonthLike = Union[int, str, pd.Timestamp]
+
+
+class ColumnarStorage:
+    """Bölümlenmiş (hive) Parquet/Feather veri seti okuma ve yazma"""
+
+    SUPPORTED_FORMATS = ('parquet', 'feather')
+    PARTITION_COLUMNS = ['test_category', 'test_month']
+
+    def __init__(self, file_format: str = 'parquet'):
+        if file_format not in self.SUPPORTED_FORMATS:
+            raise ValueError(f"Desteklenmeyen dosya formatı: {file_format}")
+        if pa is None:
+            raise ImportError("Sütunlu depolama için pyarrow gerekli: pip install pyarrow")
+
+        self.file_format = file_format
+
+    @staticmethod
+    def is_dataset(path: str) -> bool:
+        """Yolun bölümlenmiş bir veri seti dizini olup olmadığını döndürür"""
+
+        return os.path.isdir(path)
+
+    @classmethod
+    def detect_format(cls, path: str) -> str:
+        """Veri seti dizinindeki dosya uzantısından formatı belirler"""
+
+        for _, _, files in os.walk(path):
+            for name in files:
+                extension = os.path.splitext(name)[1].lstrip('.')
+                if extension in cls.SUPPORTED_FORMATS:
+                    return extension
+
+        raise FileNotFoundError(f"Veri seti dosyası bulunamadı: {path}")
+
+    @staticmethod
+    def month_key(dates: pd.Series) -> np.ndarray:
+        """Tarihleri YYYYMM biçiminde tamsayı ay anahtarına çevirir"""
+
+        dates = pd.to_datetime(dates)
+        return (dates.dt.year * 100 + dates.dt.month).to_numpy(dtype=np.int32)
+
+    def write(self, df: pd.DataFrame, path: str, basename: str = 'part-00000',
+              overwrite: bool = False):
+        """DataFrame'i test_category ve ay bölümlerine ayırarak yazar
+
+        Aynı dizine farklı basename ile yapılan yazımlar mevcut dosyalara eklenir.
+        """
+
+        if overwrite and os.path.exists(path):
+            shutil.rmtree(path)
+
+        table = pa.Table.from_pandas(
+            df.assign(test_month=self.month_key(df['test_date'])),
+            preserve_index=False
+        )
+
+        ds.write_dataset(
+            table, path,
+            format=self.file_format,
+            partitioning=self.PARTITION_COLUMNS,
+            partitioning_flavor='hive',
+            basename_template=f'{basename}-{{i}}.{self.file_format}',
+            existing_data_behavior='overwrite_or_ignore'
+        )
+
+    def read(self, path: str, columns: Optional[List[str]] = None,
+             categories: Optional[Sequence[str]] = None,
+             start_month: Optional[MonthLike] = None,
+             end_month: Optional[MonthLike] = None,
+             files: Optional[List[str]] = None,
+             after_test_id: Optional[int] = None) -> pd.DataFrame:
+        """Veri setini okur - yalnızca istenen sütunlar ve bölümler diskten yüklenir
+
+        start_month / end_month dahil sınırlardır; 202501, '2025-01' veya tarih verilebilir.
+        files verilirse yalnızca bu dosyalar okunur; after_test_id verilirse yalnızca
+        test_id değeri bundan büyük satırlar döndürülür.
+        """
+
+        partitioning = ds.HivePartitioning.discover(infer_dictionary=True)
+
+        if files is not None and not files:
+            # Okunacak dosya yok - veri seti şemasıyla boş tablo döndürülür
+            schema = ds.dataset(path, format=self.file_format, partitioning=partitioning).schema
+            if columns is None:
+                columns = [name for name in schema.names if name != 'test_month']
+            return schema.empty_table().select(list(columns)).to_pandas()
+
+        dataset = ds.dataset(
+            path if files is None else files, format=self.file_format,
+            partitioning=partitioning,
+            partition_base_dir=None if files is None else path
+        )
+
+        # Bölüm filtreleri - eşleşmeyen dizinler hiç okunmaz
+        conditions = []
+        if categories is not None:
+            conditions.append(ds.field('test_category').isin(list(categories)))
+        if start_month is not None:
+            conditions.append(ds.field('test_month') >= self.parse_month(start_month))
+        if end_month is not None:
+            conditions.append(ds.field('test_month') <= self.parse_month(end_month))
+        if after_test_id is not None:
+            conditions.append(ds.field('test_id') > after_test_id)
+
+        row_filter = None
+        for condition in conditions:
+            row_filter = condition if row_filter is None else row_filter & condition
+
+        # Ay anahtarı yalnızca açıkça istenirse döndürülür
+        if columns is None:
+            columns = [name for name in dataset.schema.names if name != 'test_month']
+
+        table = dataset.to_table(columns=list(columns), filter=row_filter)
+        return table.to_pandas()
+
+    @staticmethod
+    def parse_month(month: MonthLike) -> int:
+        """Ay değerini YYYYMM tamsayısına çevirir"""
+
+        if isinstance(month, (int, np.integer)):
+            return int(month)
+
+        month = pd.Timestamp(month)
+        return month.year * 100 + month.month
@@ -4,8 +4,25 @@ TestScope AI - Veri İşleme Araçları
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# pyarrow varsa çok iş parçacıklı CSV ayrıştırıcısı, yoksa pandas C ayrıştırıcısı
+CSV_ENGINE = 'pyarrow' if pyarrow is not None else 'c'
+
+from .columnar_storage import ColumnarStorage
+from .frame_cache import FRAME_CACHE
+from .dataset_schema import DatasetSchema
+from .risk_rules import RISK_RULES
+from .validation_report import ValidationReport, violation_message
+from .standards import STANDARD_LOOKUP
+from .trend_aggregator import TrendAggregate, TREND_COLUMNS
 
 class DataProcessor:
     """Veri işleme ve analiz araçları"""
@@ -17,17 +34,103 @@ class DataProcessor:
             'vibration': {'min': 0.1, 'max': 50.0, 'unit': 'g'},
             'pressure': {'min': 800, 'max': 1200, 'unit': 'hPa'}
         }
+        self.schema = DatasetSchema()
+        
+        # Risk faktörü bantları - utils/risk_rules.json 'risk_factors' kural seti
+        self.risk_rules = RISK_RULES
+        self.risk_factor_bands = RISK_RULES.tables('risk_factors')
     
-    def load_data(self, filepath: str) -> pd.DataFrame:
-        """CSV dosyasından veri yükler"""
+    def load_data(self, filepath: str, columns: Optional[List[str]] = None,
+                  categories: Optional[List[str]] = None,
+                  start_month=None, end_month=None, use_cache: bool = True) -> pd.DataFrame:
+        """CSV dosyasından veya bölümlenmiş Parquet/Feather veri setinden veri yükler
+        
+        Sütunlu veri setlerinde yalnızca istenen sütunlar ve test_category / ay
+        bölümleri okunur. start_month / end_month dahil sınırlardır ('2025-01' gibi).
+        Sütunlar DatasetSchema tiplerine dönüştürülür.
+        
+        Ayrıştırılan çerçeve süreç genelinde (yol, boyut, değişiklik zamanı, seçenekler)
+        ile önbelleğe alınır; değişmeyen dosya ikinci kez ayrıştırılmaz. Dönen çerçeve
+        paylaşılır, yerinde değiştirilmemelidir.
+        """
         
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Dosya bulunamadı: {filepath}")
         
-        df = pd.read_csv(filepath)
-        print(f"Veri yüklendi: {len(df)} kayıt")
+        def load() -> pd.DataFrame:
+            if ColumnarStorage.is_dataset(filepath):
+                storage = ColumnarStorage(ColumnarStorage.detect_format(filepath))
+                df = storage.read(filepath, columns=columns, categories=categories,
+                                  start_month=start_month, end_month=end_month)
+            else:
+                df = self._load_csv(filepath, columns, categories, start_month, end_month)
+            return self.schema.apply(df)
+        
+        if not use_cache:
+            df = load()
+            print(f"Veri yüklendi: {len(df)} kayıt")
+            return df
+        
+        options = (
+            None if columns is None else tuple(columns),
+            None if categories is None else tuple(categories),
+            str(start_month), str(end_month)
+        )
+        df, cached = FRAME_CACHE.get_or_load(filepath, options, load)
+        print(f"Veri {'önbellekten ' if cached else ''}yüklendi: {len(df)} kayıt")
         return df
     
+    def _load_csv(self, filepath: str, columns: Optional[List[str]],
+                  categories: Optional[List[str]], start_month, end_month) -> pd.DataFrame:
+        """CSV dosyasını okur ve sütunlu veri setiyle aynı filtreleri uygular"""
+        
+        filter_columns = []
+        if categories is not None:
+            filter_columns.append('test_category')
+        if start_month is not None or end_month is not None:
+            filter_columns.append('test_date')
+        
+        usecols = None
+        if columns is not None:
+            usecols = list(dict.fromkeys(list(columns) + filter_columns))
+        
+        # Açık tipler: sayısal sütunlar doğrudan şema tipinde, düşük kardinaliteli
+        # sütunlar kategori olarak ayrıştırılır; tarih okuma sırasında çözülür
+        dtypes = {}
+        for column, dtype in self.schema.dtypes.items():
+            if usecols is not None and column not in usecols:
+                continue
+            if column == 'test_id':
+                dtypes[column] = str
+            elif isinstance(dtype, pd.CategoricalDtype):
+                dtypes[column] = 'category'
+            elif dtype.kind != 'M':
+                dtypes[column] = dtype
+        
+        header = pd.read_csv(filepath, nrows=0).columns
+        dtypes = {column: dtype for column, dtype in dtypes.items() if column in header}
+        parse_dates = ['test_date'] if 'test_date' in header and (
+            usecols is None or 'test_date' in usecols) else False
+        
+        df = pd.read_csv(filepath, usecols=usecols, dtype=dtypes, parse_dates=parse_dates,
+                         engine=CSV_ENGINE)
+        
+        mask = pd.Series(True, index=df.index)
+        if categories is not None:
+            mask &= df['test_category'].isin(categories)
+        if start_month is not None or end_month is not None:
+            months = ColumnarStorage.month_key(df['test_date'])
+            if start_month is not None:
+                mask &= months >= ColumnarStorage.parse_month(start_month)
+            if end_month is not None:
+                mask &= months <= ColumnarStorage.parse_month(end_month)
+        
+        df = df[mask]
+        if columns is not None:
+            df = df[list(columns)]
+        
+        return df.reset_index(drop=True)
+    
     def validate_test_parameters(self, temperature: float, humidity: float, 
                                vibration: float, pressure: float) -> Dict:
         """Test parametrelerini doğrular"""
@@ -38,53 +141,19 @@ class DataProcessor:
             'errors': []
         }
         
-        # Sıcaklık kontrolü
-        if temperature < self.test_limits['temperature']['min']:
-            validation['warnings'].append(
-                f"Sıcaklık çok düşük: {temperature}°C "
-                f"(minimum: {self.test_limits['temperature']['min']}°C)"
-            )
-        elif temperature > self.test_limits['temperature']['max']:
-            validation['warnings'].append(
-                f"Sıcaklık çok yüksek: {temperature}°C "
-                f"(maksimum: {self.test_limits['temperature']['max']}°C)"
-            )
-        
-        # Nem kontrolü
-        if humidity < self.test_limits['humidity']['min']:
-            validation['warnings'].append(
-                f"Nem çok düşük: {humidity}% "
-                f"(minimum: {self.test_limits['humidity']['min']}%)"
-            )
-        elif humidity > self.test_limits['humidity']['max']:
-            validation['warnings'].append(
-                f"Nem çok yüksek: {humidity}% "
-                f"(maksimum: {self.test_limits['humidity']['max']}%)"
-            )
-        
-        # Titreşim kontrolü
-        if vibration < self.test_limits['vibration']['min']:
-            validation['warnings'].append(
-                f"Titreşim çok düşük: {vibration}g "
-                f"(minimum: {self.test_limits['vibration']['min']}g)"
-            )
-        elif vibration > self.test_limits['vibration']['max']:
-            validation['warnings'].append(
-                f"Titreşim çok yüksek: {vibration}g "
-                f"(maksimum: {self.test_limits['vibration']['max']}g)"
-            )
-        
-        # Basınç kontrolü
-        if pressure < self.test_limits['pressure']['min']:
-            validation['warnings'].append(
-                f"Basınç çok düşük: {pressure}hPa "
-                f"(minimum: {self.test_limits['pressure']['min']}hPa)"
-            )
-        elif pressure > self.test_limits['pressure']['max']:
-            validation['warnings'].append(
-                f"Basınç çok yüksek: {pressure}hPa "
-                f"(maksimum: {self.test_limits['pressure']['max']}hPa)"
-            )
+        values = {'temperature': temperature, 'humidity': humidity,
+                  'vibration': vibration, 'pressure': pressure}
+        
+        # Limit kontrolleri - metinler toplu doğrulama raporuyla aynı biçimdedir
+        for parameter, value in values.items():
+            if value < self.test_limits[parameter]['min']:
+                validation['warnings'].append(
+                    violation_message(parameter, 'low', value, self.test_limits)
+                )
+            elif value > self.test_limits[parameter]['max']:
+                validation['warnings'].append(
+                    violation_message(parameter, 'high', value, self.test_limits)
+                )
         
         # Kritik hatalar
         if len(validation['errors']) > 0:
@@ -92,78 +161,63 @@ class DataProcessor:
         
         return validation
     
-    def calculate_risk_factors(self, temperature: float, humidity: float, 
-                             vibration: float, pressure: float) -> Dict:
-        """Risk faktörlerini hesaplar - Gerçek risk değerleri (0-1 aralığı)"""
-        
-        risk_factors = {}
-        
-        # Sıcaklık riski - 60°C üzeri yüksek risk
-        if temperature >= 60:
-            temp_risk = 0.95  # %95 risk (neredeyse %100)
-        elif temperature >= 50:
-            temp_risk = 0.8   # %80 risk
-        elif temperature >= 40:
-            temp_risk = 0.6   # %60 risk
-        elif temperature >= 30:
-            temp_risk = 0.4   # %40 risk
-        elif temperature >= 20:
-            temp_risk = 0.2   # %20 risk
-        else:
-            temp_risk = 0.1   # %10 risk (düşük)
-        
-        risk_factors['temperature_risk'] = temp_risk
-        
-        # Nem riski - %85 nem yüksek risk
-        if humidity >= 90:
-            humidity_risk = 0.95  # %95 risk
-        elif humidity >= 85:
-            humidity_risk = 0.85  # %85 risk (görseldeki değer)
-        elif humidity >= 80:
-            humidity_risk = 0.7   # %70 risk
-        elif humidity >= 70:
-            humidity_risk = 0.5   # %50 risk
-        elif humidity >= 60:
-            humidity_risk = 0.3   # %30 risk
-        else:
-            humidity_risk = 0.1   # %10 risk
-        
-        risk_factors['humidity_risk'] = humidity_risk
-        
-        # Titreşim riski - 25g orta risk
-        if vibration >= 40:
-            vibration_risk = 0.9   # %90 risk
-        elif vibration >= 30:
-            vibration_risk = 0.8   # %80 risk
-        elif vibration >= 25:
-            vibration_risk = 0.5   # %50 risk (görseldeki değer)
-        elif vibration >= 20:
-            vibration_risk = 0.4   # %40 risk
-        elif vibration >= 10:
-            vibration_risk = 0.2   # %20 risk
-        else:
-            vibration_risk = 0.1   # %10 risk
+    def validate_test_parameters_batch(self, data: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> ValidationReport:
+        """Test planındaki tüm satırları tek geçişte doğrular
         
-        risk_factors['vibration_risk'] = vibration_risk
-        
-        # Basınç riski - 1013hPa normal basınç, düşük risk
-        if pressure <= 850 or pressure >= 1150:
-            pressure_risk = 0.8   # %80 risk
-        elif pressure <= 900 or pressure >= 1100:
-            pressure_risk = 0.5   # %50 risk
-        elif pressure <= 950 or pressure >= 1050:
-            pressure_risk = 0.2   # %20 risk
-        else:
-            pressure_risk = 0.05  # %5 risk (1013hPa normal)
+        Parametre ve yön başına ihlal maskeleri ile özet sayıları içeren bir
+        ValidationReport döndürür; uyarı metinleri report.messages(rows) ile yalnızca
+        gösterilecek satırlar için üretilir.
+        """
         
-        risk_factors['pressure_risk'] = pressure_risk
+        columns = {parameter: np.asarray(data[parameter]) for parameter in self.test_limits}
+        index = data.index if isinstance(data, pd.DataFrame) else None
+        return ValidationReport(columns, self.test_limits, index)
+    
+    def calculate_risk_factors(self, temperature: float, humidity: float, 
+                             vibration: float, pressure: float,
+                             standard: Optional[str] = None) -> Dict:
+        """Risk faktörlerini hesaplar - Gerçek risk değerleri (0-1 aralığı)
+        
+        Bantlar 'risk_factors' kural setinden gelir; standard verilirse o standardın
+        ailesine ait tablolar kullanılır.
+        """
+        
+        bands = (self.risk_factor_bands if standard is None
+                 else self.risk_rules.tables('risk_factors', standard))
+        
+        risk_factors = {
+            'temperature_risk': bands['temperature'].lookup_one(temperature),
+            'humidity_risk': bands['humidity'].lookup_one(humidity),
+            'vibration_risk': bands['vibration'].lookup_one(vibration),
+            'pressure_risk': bands['pressure'].lookup_one(pressure)
+        }
         
         # Toplam risk - Ağırlıklı ortalama
-        total_risk = (temp_risk + humidity_risk + vibration_risk + pressure_risk) / 4
-        risk_factors['total_risk'] = total_risk
+        risk_factors['total_risk'] = (risk_factors['temperature_risk'] + risk_factors['humidity_risk']
+                                      + risk_factors['vibration_risk'] + risk_factors['pressure_risk']) / 4
         
         return risk_factors
     
+    def calculate_risk_factors_batch(self, data: Union[pd.DataFrame, Dict[str, np.ndarray]],
+                                     standards=None) -> pd.DataFrame:
+        """Risk faktörlerini satır başına tek çağrıda hesaplar
+        
+        data, temperature / humidity / vibration / pressure sütunlarını içeren bir
+        DataFrame veya dizi sözlüğüdür. calculate_risk_factors ile aynı bantları
+        uygular; sonuçlar skaler sürümle birebir aynıdır. standards tek bir standart
+        adı ya da satır başına standart adları (ör. veri setinin 'standard' sütunu) olabilir.
+        """
+        
+        bands = self.risk_rules.evaluate('risk_factors', data, standards)
+        factors = {f'{name}_risk': values for name, (values, _) in bands.items()}
+        
+        # Toplama sırası skaler sürümle aynı tutulur (kayan nokta eşitliği için)
+        factors['total_risk'] = (factors['temperature_risk'] + factors['humidity_risk']
+                                 + factors['vibration_risk'] + factors['pressure_risk']) / 4
+        
+        index = data.index if isinstance(data, pd.DataFrame) else None
+        return pd.DataFrame(factors, index=index)
+    
     def get_test_recommendations(self, risk_score: float) -> List[str]:
         """Risk skoruna göre test önerileri"""
         
@@ -196,43 +250,79 @@ class DataProcessor:
         return recommendations
     
     def analyze_test_trends(self, df: pd.DataFrame) -> Dict:
-        """Test verilerindeki trendleri analiz eder"""
-        
-        analysis = {}
-        
-        # Test kategorilerine göre dağılım
-        if 'test_category' in df.columns:
-            category_counts = df['test_category'].value_counts()
-            analysis['category_distribution'] = category_counts.to_dict()
-        
-        # Pass/Fail oranları
-        if 'pass_fail' in df.columns:
-            pass_fail_counts = df['pass_fail'].value_counts()
-            analysis['pass_fail_ratio'] = {
-                'pass_count': pass_fail_counts.get('PASS', 0),
-                'fail_count': pass_fail_counts.get('FAIL', 0),
-                'pass_rate': pass_fail_counts.get('PASS', 0) / len(df) * 100
-            }
+        """Test verilerindeki trendleri analiz eder
         
-        # Risk skoru analizi
-        if 'risk_score' in df.columns:
-            analysis['risk_analysis'] = {
-                'mean_risk': df['risk_score'].mean(),
-                'median_risk': df['risk_score'].median(),
-                'std_risk': df['risk_score'].std(),
-                'min_risk': df['risk_score'].min(),
-                'max_risk': df['risk_score'].max()
-            }
+        Sayımlar, toplamlar, min/max ve medyan tek geçişte birleştirilebilir bir
+        TrendAggregate özetinden hesaplanır (bkz. analyze_test_trends_scan).
+        """
         
-        # Test süresi analizi
-        if 'test_duration' in df.columns:
-            analysis['duration_analysis'] = {
-                'mean_duration': df['test_duration'].mean(),
-                'median_duration': df['test_duration'].median(),
-                'total_hours': df['test_duration'].sum() / 60  # Saat cinsinden
-            }
+        return TrendAggregate.from_frame(df).result()
+    
+    def analyze_test_trends_scan(self, filepath: str, chunk_size: int = 250_000,
+                                 categories: Optional[List[str]] = None,
+                                 max_workers: Optional[int] = None) -> Dict:
+        """Veriyi belleğe tamamen yüklemeden trend analizi yapar
+        
+        CSV dosyası chunk_size satırlık parçalar halinde, bölümlenmiş veri seti ise
+        dosya başına (max_workers iş parçacığıyla paralel) okunur. Her parça kısmi bir
+        TrendAggregate özetine indirgenir ve özetler birleştirilir; yalnızca trend
+        sütunları okunur. Sonuç analyze_test_trends ile aynı biçimdedir.
+        """
         
-        return analysis
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"Dosya bulunamadı: {filepath}")
+        if chunk_size <= 0:
+            raise ValueError(f"Geçersiz parça boyutu: {chunk_size}")
+        
+        if ColumnarStorage.is_dataset(filepath):
+            aggregate = self._scan_dataset(filepath, categories, max_workers)
+        else:
+            aggregate = TrendAggregate.from_chunks(
+                self._iter_csv_chunks(filepath, chunk_size, categories))
+        
+        print(f"Trend analizi tamamlandı: {aggregate.rows} kayıt tarandı")
+        return aggregate.result()
+    
+    def _scan_dataset(self, filepath: str, categories: Optional[List[str]],
+                      max_workers: Optional[int]) -> TrendAggregate:
+        """Veri seti dosyalarını paralel özetleyip birleştirir"""
+        
+        storage = ColumnarStorage(ColumnarStorage.detect_format(filepath))
+        files = sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(filepath)
+            for name in names if name.endswith('.' + storage.file_format)
+        )
+        if not files:
+            return TrendAggregate()
+        
+        available = storage.read(filepath, files=[]).columns
+        columns = [c for c in TREND_COLUMNS if c in available]
+        
+        def summarize(path: str) -> TrendAggregate:
+            return TrendAggregate.from_frame(
+                storage.read(filepath, columns=columns, categories=categories, files=[path]))
+        
+        aggregate = TrendAggregate()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for partial in executor.map(summarize, files):
+                aggregate.merge(partial)
+        return aggregate
+    
+    def _iter_csv_chunks(self, filepath: str, chunk_size: int,
+                         categories: Optional[List[str]]):
+        """CSV dosyasının trend sütunlarını parça parça okur"""
+        
+        header = pd.read_csv(filepath, nrows=0).columns
+        columns = [c for c in TREND_COLUMNS if c in header]
+        dtypes = {c: self.schema.dtypes[c] for c in columns
+                  if not isinstance(self.schema.dtypes[c], pd.CategoricalDtype)}
+        
+        # pyarrow motoru parça parça okumayı desteklemez
+        for chunk in pd.read_csv(filepath, usecols=columns, dtype=dtypes, chunksize=chunk_size):
+            if categories is not None:
+                chunk = chunk[chunk['test_category'].isin(categories)]
+            yield chunk
     
     def export_test_report(self, test_data: Dict, analysis_results: Dict, 
                           filename: str = 'test_report.txt') -> None:
@@ -298,4 +388,13 @@ class DataProcessor:
             }
         }
         
+        # Her metodun hangi kategori/test tipi çiftlerinde kullanıldığı derlenmiş tablodan okunur
+        for family, info in standards_info.items():
+            info['test_types'] = {
+                method: STANDARD_LOOKUP.test_types_for(
+                    f"{family} Method {method}" if family == 'MIL-STD-810' else method
+                )
+                for method in info['methods']
+            }
+        
         return standards_info 
\ No newline at end of file
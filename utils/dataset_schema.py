@@ -0,0 +1,132 @@
+"""
+TestScope AI - Test Veri Seti Şeması
+Üretici, DataProcessor.load_data ve RiskPredictor.predict_batch tarafından
+paylaşılan sıkıştırılmış sütun tipleri (categorical, float32, int16).
+"""
+
+import pandas as pd
+import numpy as np
+
+from .standards import STANDARD_LOOKUP
+
+# Düşük kardinaliteli sütunların sabit kategori listeleri (standart eşleme tablosundan)
+TEST_CATEGORIES = STANDARD_LOOKUP.categories
+
+TEST_TYPES = STANDARD_LOOKUP.test_types
+
+STANDARDS = STANDARD_LOOKUP.standards
+
+# Kod 0: PASS, kod 1: FAIL - kategori kodu doğrudan model hedef değişkenidir
+PASS_FAIL_LABELS = ['PASS', 'FAIL']
+
+FEATURE_COLUMNS = ['temperature', 'humidity', 'vibration', 'pressure']
+
+TEST_ID_PREFIX = 'TEST_'
+
+
+class DatasetSchema:
+    """Test veri seti için açık ve paylaşılan sütun tipi şeması"""
+
+    def __init__(self):
+        self.dtypes = {
+            'test_id': np.dtype(np.int32),
+            'test_category': pd.CategoricalDtype(TEST_CATEGORIES),
+            'test_type': pd.CategoricalDtype(TEST_TYPES),
+            'temperature': np.dtype(np.float32),
+            'humidity': np.dtype(np.float32),
+            'vibration': np.dtype(np.float32),
+            'pressure': np.dtype(np.float32),
+            'risk_score': np.dtype(np.float32),
+            'pass_fail': pd.CategoricalDtype(PASS_FAIL_LABELS),
+            'test_duration': np.dtype(np.int16),
+            'test_date': np.dtype('datetime64[us]'),
+            'standard': pd.CategoricalDtype(STANDARDS),
+            # Tahmin çıktıları (predict_batch)
+            'prediction': pd.CategoricalDtype(PASS_FAIL_LABELS),
+            'confidence': np.dtype(np.float32)
+        }
+
+    def categorical(self, column: str, codes: np.ndarray) -> pd.Categorical:
+        """Tamsayı kodlardan şemadaki kategori tipinde dizi oluşturur"""
+
+        return pd.Categorical.from_codes(codes, dtype=self.dtypes[column])
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """DataFrame sütunlarını şema tiplerine dönüştürür (şemada olmayan sütunlar korunur)"""
+
+        converted = {}
+
+        for column in df.columns:
+            dtype = self.dtypes.get(column)
+            if dtype is None:
+                continue
+
+            values = df[column]
+
+            if column == 'test_id':
+                converted[column] = self.parse_test_ids(values)
+            elif isinstance(dtype, pd.CategoricalDtype):
+                # Şemada olmayan değerler kaybolmasın diye kategoriler genişletilir
+                extra = sorted(set(values.dropna().unique()) - set(dtype.categories))
+                if extra:
+                    dtype = pd.CategoricalDtype(list(dtype.categories) + extra)
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    # Sırasız kategorik tipler kategori sırası farklı olsa da eşit sayılır
+                    # (astype dokunmaz); kodların şemayla aynı olması için açıkça sıralanır
+                    converted[column] = values.cat.set_categories(dtype.categories)
+                else:
+                    converted[column] = values.astype(dtype)
+            elif dtype.kind == 'M':
+                converted[column] = pd.to_datetime(values).astype(dtype)
+            elif values.dtype != dtype:
+                converted[column] = values.astype(dtype)
+
+        return df.assign(**converted) if converted else df
+
+    def parse_test_ids(self, values: pd.Series) -> pd.Series:
+        """'TEST_000123' biçimindeki kimlikleri tamsayıya çevirir"""
+
+        if pd.api.types.is_integer_dtype(values.dtype):
+            return values.astype(self.dtypes['test_id'])
+
+        # Dizeden tamsayıya doğrudan dönüşüm to_numeric'ten birkaç kat hızlıdır
+        numbers = values.astype(str).str.removeprefix(TEST_ID_PREFIX)
+        return numbers.astype(self.dtypes['test_id'])
+
+    @staticmethod
+    def format_test_ids(values) -> np.ndarray:
+        """Tamsayı kimlikleri görüntüleme için 'TEST_000123' biçimine çevirir"""
+
+        numbers = np.asarray(values).astype(str)
+        return np.char.add(TEST_ID_PREFIX, np.char.zfill(numbers, 6))
+
+    def with_display_ids(self, df: pd.DataFrame) -> pd.DataFrame:
+        """CSV dışa aktarımı ve görüntüleme için test_id sütunu 'TEST_000123' biçiminde kopya
+
+        Bellekte kimlikler tamsayı tutulur; dışa verilen dosyalar ve arayüz eski biçimi
+        korur. CSV'den okurken parse_test_ids önekli kimlikleri yeniden tamsayıya çevirir.
+        """
+
+        if 'test_id' not in df.columns:
+            return df
+        return df.assign(test_id=self.format_test_ids(df['test_id']))
+
+    def memory_report(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Şema uygulanmadan önce ve sonra sütun başına satır başı bayt değerlerini döndürür"""
+
+        compact = self.apply(df)
+        rows = max(len(df), 1)
+
+        before = df.memory_usage(deep=True, index=False) / rows
+        after = compact.memory_usage(deep=True, index=False) / rows
+
+        report = pd.DataFrame({
+            'before_dtype': df.dtypes.astype(str),
+            'after_dtype': compact.dtypes.astype(str),
+            'bytes_per_row_before': before,
+            'bytes_per_row_after': after
+        })
+        report.loc['TOPLAM'] = ['', '', before.sum(), after.sum()]
+        report['reduction'] = report['bytes_per_row_before'] / report['bytes_per_row_after']
+
+        return report
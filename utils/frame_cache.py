@@ -0,0 +1,89 @@
+"""
+TestScope AI - Süreç Geneli Veri Çerçevesi Önbelleği
+Ayrıştırılmış veri setlerini dosya yolu, boyutu ve değişiklik zamanı ile
+anahtarlayarak saklar; değişmeyen dosya bir süreçte ikinci kez ayrıştırılmaz.
+"""
+
+import pandas as pd
+import threading
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple
+
+
+class FrameCache:
+    """(yol, dosya imzası, okuma seçenekleri) -> DataFrame LRU önbelleği
+
+    Dosya imzası tek dosyada (boyut, değişiklik zamanı), bölümlenmiş veri seti
+    dizininde ise (dosya sayısı, toplam boyut, en son değişiklik zamanı) olur.
+    Dönen çerçeveler oturumlar arasında paylaşılır; yerinde değiştirilmemelidir.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        if max_entries <= 0:
+            raise ValueError(f"Geçersiz önbellek boyutu: {max_entries}")
+
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def signature(path: str) -> Tuple:
+        """Dosya veya dizinin içerik değişikliğini yansıtan imza"""
+
+        if not os.path.isdir(path):
+            stat = os.stat(path)
+            return (stat.st_size, stat.st_mtime_ns)
+
+        count, total_size, latest = 0, 0, 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                stat = os.stat(os.path.join(root, name))
+                count += 1
+                total_size += stat.st_size
+                latest = max(latest, stat.st_mtime_ns)
+        return (count, total_size, latest)
+
+    def get_or_load(self, path: str, options: Hashable,
+                    loader: Callable[[], pd.DataFrame]) -> Tuple[pd.DataFrame, bool]:
+        """Önbellekteki çerçeveyi veya loader() sonucunu döndürür: (çerçeve, isabet mi)"""
+
+        path = os.path.abspath(path)
+        key = (path, self.signature(path), options)
+
+        with self._lock:
+            frame = self._entries.get(key)
+            if frame is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return frame.copy(deep=False), True
+
+        frame = loader()
+
+        with self._lock:
+            self.misses += 1
+            # Aynı dosyanın eski sürümleri artık geçersizdir
+            for stale in [k for k in self._entries if k[0] == path and k[1] != key[1]]:
+                del self._entries[stale]
+
+            self._entries[key] = frame
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return frame.copy(deep=False), False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """İsabet / ıska sayıları ve kayıt sayısı"""
+
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Süreç genelinde tek çerçeve önbelleği
+FRAME_CACHE = FrameCache()
@@ -0,0 +1,80 @@
+"""
+TestScope AI - Halka Tampon
+Sabit kapasiteli, önceden ayrılmış çok kanallı örnek tamponu; blok yazımları
+en fazla iki dilim kopyası ile yapılır, en eski örneklerin üzerine yazılır.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+
+class RingBuffer:
+    """Zaman damgalı çok kanallı halka tampon
+
+    Örnekler ``(kanal, kapasite)`` biçimli tek bir dizide tutulur; her kanal bellekte
+    bitişiktir. Tampon dolduğunda yeni bloklar en eski örneklerin üzerine yazılır.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1, dtype=np.float32):
+        if capacity <= 0:
+            raise ValueError(f"Geçersiz tampon kapasitesi: {capacity}")
+
+        self.capacity = capacity
+        self.channels = channels
+        self.data = np.zeros((channels, capacity), dtype=dtype)
+        self.times = np.zeros(capacity, dtype=np.float64)
+
+        # Sonraki yazım konumu ve şimdiye kadar yazılan toplam örnek sayısı
+        self._head = 0
+        self.total_written = 0
+
+    def __len__(self) -> int:
+        return min(self.total_written, self.capacity)
+
+    def write(self, values: np.ndarray, times: Optional[np.ndarray] = None):
+        """``(kanal, n)`` biçimli bloğu tampona ekler
+
+        Blok kapasiteden büyükse yalnızca son ``kapasite`` örnek tutulur.
+        """
+
+        n = values.shape[1]
+        self.total_written += n
+
+        if n >= self.capacity:
+            self.data[:] = values[:, n - self.capacity:]
+            if times is not None:
+                self.times[:] = times[n - self.capacity:]
+            self._head = 0
+            return
+
+        first = min(n, self.capacity - self._head)
+        end = self._head + first
+
+        self.data[:, self._head:end] = values[:, :first]
+        self.data[:, :n - first] = values[:, first:]
+        if times is not None:
+            self.times[self._head:end] = times[:first]
+            self.times[:n - first] = times[first:]
+
+        self._head = (self._head + n) % self.capacity
+
+    def latest(self, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Son n örneği (zaman damgaları, değerler) olarak kronolojik sırada kopyalar"""
+
+        size = len(self)
+        n = size if n is None else min(n, size)
+        start = (self._head - n) % self.capacity
+
+        if start + n <= self.capacity:
+            return self.times[start:start + n].copy(), self.data[:, start:start + n].copy()
+
+        tail = self.capacity - start
+        times = np.concatenate((self.times[start:], self.times[:n - tail]))
+        values = np.concatenate((self.data[:, start:], self.data[:, :n - tail]), axis=1)
+        return times, values
+
+    def clear(self):
+        """Tamponu boşaltır (bellek yeniden ayrılmaz)"""
+
+        self._head = 0
+        self.total_written = 0
@@ -0,0 +1,88 @@
+"""
+TestScope AI - Risk Bandı Tabloları
+Eşik bantlarını sıralı eşik/değer dizilerine derleyip toplu (vektörel) değerlendirir.
+"""
+
+import numpy as np
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Sequence, Tuple, Union
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+class BandTable:
+    """Parça parça sabit risk bandı tablosu
+
+    Bantlar, küçükten büyüğe sıralı eşiklerle tanımlanır. Her eşik ``(değer, strict)``
+    çiftidir: ``strict=True`` ise üst banda ``x > değer`` ile, ``strict=False`` ise
+    ``x >= değer`` ile geçilir. ``values`` eşik sayısından bir fazla elemana sahiptir;
+    ``values[i]``, ``i`` adet eşiğin aşıldığı aralığın risk değeridir.
+
+    Örnek - ``x < 0`` için 0.1, ``0 <= x <= 30`` için 0.0, ``x > 30`` için 0.1::
+
+        BandTable([(0, False), (30, True)], [0.1, 0.0, 0.1])
+    """
+
+    def __init__(self, edges: List[Tuple[float, bool]], values: Sequence[float],
+                 high_risk_min: Optional[float] = None):
+        if len(values) != len(edges) + 1:
+            raise ValueError("Bant değer sayısı eşik sayısından bir fazla olmalı")
+
+        thresholds = [edge for edge, _ in edges]
+        if any(b < a for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError("Bant eşikleri küçükten büyüğe sıralı olmalı")
+
+        self.edges = list(edges)
+        self.values = np.asarray(values, dtype=np.float64)
+
+        # Aşılması "x > e" olan ve "x >= e" olan eşikler ayrı dizilerde tutulur;
+        # aşılan eşik sayısı iki searchsorted çağrısının toplamıdır
+        self._strict_edges = np.array([e for e, strict in edges if strict], dtype=np.float64)
+        self._inclusive_edges = np.array([e for e, strict in edges if not strict], dtype=np.float64)
+
+        # Skaler yol için aynı eşikler Python listesi olarak (bisect, dizi oluşturmadan)
+        self._strict_list = self._strict_edges.tolist()
+        self._inclusive_list = self._inclusive_edges.tolist()
+        self._value_list = self.values.tolist()
+
+        # Kombinasyon riski için "yüksek risk" sayılan bantlar
+        self.high_risk_min = high_risk_min
+        if high_risk_min is None:
+            self.high_risk = np.zeros(len(self.values), dtype=bool)
+        else:
+            self.high_risk = self.values >= high_risk_min
+        self._high_list = self.high_risk.tolist()
+
+    def band_index(self, x: ArrayLike) -> np.ndarray:
+        """Her değer için bant indeksini (aşılan eşik sayısı) döndürür"""
+
+        x = np.asarray(x, dtype=np.float64)
+        return (np.searchsorted(self._strict_edges, x, side='left')
+                + np.searchsorted(self._inclusive_edges, x, side='right'))
+
+    def lookup(self, x: ArrayLike) -> np.ndarray:
+        """Değerlerin düştüğü bantların risk değerlerini döndürür"""
+
+        return self.values[self.band_index(x)]
+
+    def band_index_one(self, x: float) -> int:
+        """Tek bir değerin bant indeksi (band_index ile aynı kurallar)"""
+
+        return bisect_left(self._strict_list, x) + bisect_right(self._inclusive_list, x)
+
+    def lookup_one(self, x: float) -> float:
+        """Tek bir değerin risk değeri - skaler çağrılar için dizi oluşturmadan"""
+
+        return self._value_list[self.band_index_one(x)]
+
+    def lookup_one_with_flag(self, x: float) -> Tuple[float, bool]:
+        """Tek bir değerin risk değeri ve yüksek risk bayrağı"""
+
+        idx = self.band_index_one(x)
+        return self._value_list[idx], self._high_list[idx]
+
+    def lookup_with_flags(self, x: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """Risk değerlerini ve yüksek risk bayraklarını tek bant araması ile döndürür"""
+
+        idx = self.band_index(x)
+        return self.values[idx], self.high_risk[idx]
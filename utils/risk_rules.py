@@ -0,0 +1,168 @@
+"""
+TestScope AI - Risk Kural Motoru
+Parametre ve standart başına risk bantlarını veri dosyasından (risk_rules.json)
+okur, her tabloyu bir kez BandTable'a (sıralı eşik/değer dizileri) derler ve
+hem skaler hem toplu değerlendirmeye aynı tabloları sunar.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import json
+import os
+
+from .risk_bands import BandTable
+
+# Varsayılan kural dosyası (modülün yanında)
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'risk_rules.json')
+
+# Kural setlerinin değerlendirdiği parametreler
+PARAMETERS = ['temperature', 'humidity', 'vibration', 'pressure']
+
+
+class RiskRuleEngine:
+    """Kural seti -> standart ailesi -> parametre -> derlenmiş BandTable
+
+    Her kural setinin bir ``default`` tablosu vardır; ``standards`` altındaki aileler
+    (ör. 'MIL-STD-810') yalnızca farklı olan parametreleri tanımlar, geri kalanı
+    varsayılandan devralınır. Bir standart adı ('MIL-STD-810 Method 501.7' gibi),
+    önekiyle eşleşen aileye; hiçbirine uymuyorsa varsayılan tablolara düşer.
+    """
+
+    def __init__(self, rules: Dict):
+        rule_sets = rules.get('rule_sets')
+        if not rule_sets:
+            raise ValueError("Geçersiz risk kuralları: 'rule_sets' bulunamadı")
+
+        self.rules = rules
+        self._tables: Dict[str, Dict[Optional[str], Dict[str, BandTable]]] = {}
+
+        for name, rule_set in rule_sets.items():
+            default = {parameter: self._compile(name, parameter, spec)
+                       for parameter, spec in rule_set['default'].items()}
+            missing = [p for p in PARAMETERS if p not in default]
+            if missing:
+                raise ValueError(f"Geçersiz risk kuralları: {name} için eksik parametreler {missing}")
+
+            tables = {None: default}
+            for family, overrides in rule_set.get('standards', {}).items():
+                tables[family] = dict(default)
+                for parameter, spec in overrides.items():
+                    tables[family][parameter] = self._compile(name, parameter, spec)
+            self._tables[name] = tables
+
+        # Uzun aile adı önce denenir ('IEC 60068-2' gibi alt aileler tanımlanırsa)
+        self._families = {
+            name: sorted((f for f in tables if f is not None), key=len, reverse=True)
+            for name, tables in self._tables.items()
+        }
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_RULES_PATH) -> 'RiskRuleEngine':
+        """Kural dosyasını (JSON) okuyup derler"""
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Risk kural dosyası bulunamadı: {path}")
+
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @staticmethod
+    def _compile(rule_set: str, parameter: str, spec: Dict) -> BandTable:
+        if parameter not in PARAMETERS:
+            raise ValueError(f"Desteklenmeyen parametre: {parameter} ({rule_set})")
+
+        return BandTable(
+            [(float(edge), bool(strict)) for edge, strict in spec['edges']],
+            spec['values'],
+            high_risk_min=spec.get('high_risk_min')
+        )
+
+    @property
+    def rule_sets(self) -> List[str]:
+        return list(self._tables)
+
+    def families(self, rule_set: str) -> List[str]:
+        """Kural setinde ayrı tablosu olan standart aileleri"""
+
+        return [f for f in self._tables[self._check(rule_set)] if f is not None]
+
+    def family(self, rule_set: str, standard: Optional[str]) -> Optional[str]:
+        """Standart adının düştüğü aile (eşleşme yoksa None: varsayılan tablolar)"""
+
+        if standard is None:
+            return None
+        for family in self._families[self._check(rule_set)]:
+            if standard.startswith(family):
+                return family
+        return None
+
+    def tables(self, rule_set: str, standard: Optional[str] = None) -> Dict[str, BandTable]:
+        """Standart için parametre -> BandTable sözlüğü"""
+
+        return self._tables[self._check(rule_set)][self.family(rule_set, standard)]
+
+    def lookup_one(self, rule_set: str, parameter: str, value: float,
+                   standard: Optional[str] = None) -> float:
+        """Tek değerin risk değeri"""
+
+        return self.tables(rule_set, standard)[parameter].lookup_one(value)
+
+    def evaluate(self, rule_set: str, data: Union[pd.DataFrame, Dict[str, np.ndarray]],
+                 standards: Union[None, str, Sequence[str], pd.Series] = None,
+                 parameters: Sequence[str] = PARAMETERS) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Parametre başına (risk değerleri, yüksek risk bayrakları) dizilerini döndürür
+
+        standards tek bir ad, satır başına ad dizisi veya kategorik sütun olabilir.
+        Satırlar standart ailelerine göre gruplanır; her grup tek searchsorted
+        çağrısıyla değerlendirilir (satır başına Python dallanması yok).
+        """
+
+        rule_set = self._check(rule_set)
+        columns = {p: np.asarray(data[p], dtype=np.float64) for p in parameters}
+
+        if standards is None or isinstance(standards, str):
+            tables = self.tables(rule_set, standards)
+            return {p: tables[p].lookup_with_flags(columns[p]) for p in parameters}
+
+        # Ad -> aile eşlemesi yalnızca farklı adlar üzerinde yapılır
+        names, codes = self._factorize(standards)
+        family_list = [None] + self.families(rule_set)
+        name_family = np.array([family_list.index(self.family(rule_set, name)) for name in names],
+                               dtype=np.int16)
+        row_family = name_family[codes] if len(names) else np.zeros(len(codes), dtype=np.int16)
+
+        n = len(row_family)
+        results = {p: (np.empty(n, dtype=np.float64), np.empty(n, dtype=bool)) for p in parameters}
+
+        for index in np.unique(row_family):
+            rows = np.flatnonzero(row_family == index)
+            tables = self._tables[rule_set][family_list[index]]
+            for p in parameters:
+                values, flags = tables[p].lookup_with_flags(columns[p][rows])
+                results[p][0][rows] = values
+                results[p][1][rows] = flags
+
+        return results
+
+    @staticmethod
+    def _factorize(standards) -> Tuple[List[str], np.ndarray]:
+        """Standart adlarını (benzersiz adlar, satır kodları) çiftine çevirir"""
+
+        if isinstance(standards, pd.Series) and isinstance(standards.dtype, pd.CategoricalDtype):
+            # Kategorik sütunda kodlar hazırdır; eksik değerler (-1) son ada eşlenir
+            names = [str(c) for c in standards.cat.categories] + ['']
+            codes = standards.cat.codes.to_numpy()
+            return names, np.where(codes < 0, len(names) - 1, codes)
+
+        codes, uniques = pd.factorize(pd.Series(standards), use_na_sentinel=False)
+        return [str(u) for u in uniques], codes
+
+    def _check(self, rule_set: str) -> str:
+        if rule_set not in self._tables:
+            raise ValueError(f"Desteklenmeyen kural seti: {rule_set}")
+        return rule_set
+
+
+# Süreç genelinde tek kural motoru (dosya bir kez okunup derlenir)
+RISK_RULES = RiskRuleEngine.from_file()
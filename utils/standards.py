@@ -0,0 +1,100 @@
+"""
+TestScope AI - Test Standardı Eşleme Tablosu
+Kategori -> test tipi -> standart eşlemesini bir kez tamsayı kodlu tabloya derler;
+tüm sütunlar dizi indeksleme ile eşlenir.
+"""
+
+import numpy as np
+from typing import Dict, List, Tuple
+
+# Kategori -> test tipi -> standart
+STANDARD_MAP = {
+    'temperature': {
+        'high_temp': 'MIL-STD-810 Method 501.7',
+        'low_temp': 'MIL-STD-810 Method 502.7',
+        'thermal_shock': 'IEC 60068-2-14'
+    },
+    'humidity': {
+        'humidity_resistance': 'MIL-STD-810 Method 507.7',
+        'condensation': 'ISO 16750-4',
+        'water_splash': 'IEC 60529'
+    },
+    'vibration': {
+        'mechanical_vibration': 'MIL-STD-810 Method 514.8',
+        'acoustic_vibration': 'MIL-STD-810 Method 515.8',
+        'shock': 'IEC 60068-2-27'
+    }
+}
+
+# Eşlemede bulunmayan kategori/test tipi çiftleri için standart
+DEFAULT_STANDARD = 'ISO 16750'
+
+
+class StandardLookup:
+    """Derlenmiş (kategori kodu, test tipi kodu) -> standart kodu tablosu"""
+
+    def __init__(self, mapping: Dict[str, Dict[str, str]] = STANDARD_MAP,
+                 default: str = DEFAULT_STANDARD):
+        self.categories = list(mapping)
+        self.test_types = list(dict.fromkeys(t for types in mapping.values() for t in types))
+        self.standards = list(dict.fromkeys(
+            [s for types in mapping.values() for s in types.values()] + [default]
+        ))
+        self.default = default
+
+        self._category_index = {c: i for i, c in enumerate(self.categories)}
+        self._type_index = {t: i for i, t in enumerate(self.test_types)}
+        self._standard_index = {s: i for i, s in enumerate(self.standards)}
+
+        # Tanımsız çiftler varsayılan standarda düşer
+        self.default_code = self._standard_index[default]
+        self.table = np.full((len(self.categories), len(self.test_types)),
+                             self.default_code, dtype=np.int16)
+        self._defined = np.zeros(self.table.shape, dtype=bool)
+
+        for category, types in mapping.items():
+            for test_type, standard in types.items():
+                c, t = self._category_index[category], self._type_index[test_type]
+                self.table[c, t] = self._standard_index[standard]
+                self._defined[c, t] = True
+
+    def get(self, category: str, test_type: str) -> str:
+        """Tek bir kategori/test tipi çifti için standardı döndürür"""
+
+        c = self._category_index.get(category)
+        t = self._type_index.get(test_type)
+        if c is None or t is None:
+            return self.default
+        return self.standards[self.table[c, t]]
+
+    def lookup_codes(self, category_codes: np.ndarray, type_codes: np.ndarray) -> np.ndarray:
+        """Kategori ve test tipi kodu dizilerini standart kodlarına eşler
+
+        Tablonun dışında kalan (negatif/bilinmeyen) kodlar varsayılan standarda düşer.
+        """
+
+        category_codes = np.asarray(category_codes)
+        type_codes = np.asarray(type_codes)
+
+        valid = ((category_codes >= 0) & (category_codes < self.table.shape[0])
+                 & (type_codes >= 0) & (type_codes < self.table.shape[1]))
+
+        return np.where(
+            valid,
+            self.table[np.where(valid, category_codes, 0), np.where(valid, type_codes, 0)],
+            self.default_code
+        ).astype(np.int16)
+
+    def test_types_for(self, standard: str) -> List[Tuple[str, str]]:
+        """Verilen standarda eşlenen (kategori, test tipi) çiftlerini döndürür"""
+
+        code = self._standard_index.get(standard)
+        if code is None:
+            return []
+
+        rows, cols = np.nonzero((self.table == code) & self._defined)
+        return [(self.categories[c], self.test_types[t]) for c, t in zip(rows, cols)]
+
+
+# Süreç genelinde bir kez derlenen varsayılan tablo
+STANDARD_LOOKUP = StandardLookup()
@@ -0,0 +1,252 @@
+"""
+TestScope AI - Birleştirilebilir Trend Özetleri
+analyze_test_trends istatistiklerini parça (chunk) veya bölüm başına kısmi özetler
+olarak hesaplar: sayımlar, toplam, ortalamadan sapma kareleri toplamı, min/max ve
+bir kantil taslağı. Kısmi özetler sırası önemsiz biçimde birleştirilir; böylece
+bellekten büyük veri setleri parça parça veya paralel taranabilir.
+"""
+
+import pandas as pd
+import numpy as np
+from collections import Counter
+from typing import Dict, Iterable
+
+# Özet çıkarılan sayısal sütunlar
+NUMERIC_COLUMNS = ['risk_score', 'test_duration']
+
+# Sayımı tutulan kategorik sütunlar
+COUNT_COLUMNS = ['test_category', 'pass_fail']
+
+# Trend analizinin okuduğu tüm sütunlar
+TREND_COLUMNS = COUNT_COLUMNS + NUMERIC_COLUMNS
+
+
+class StreamingMoments:
+    """Birleştirilebilir sayım, toplam, min/max ve varyans özeti
+
+    Kareler toplamı, sayısal kararlılık için ortalamadan sapmalar üzerinden (M2)
+    tutulur; iki özet Chan'ın paralel varyans formülüyle birleştirilir.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.m2 = 0.0
+        self.minimum = np.nan
+        self.maximum = np.nan
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else np.nan
+
+    def update(self, values: np.ndarray) -> 'StreamingMoments':
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        chunk = StreamingMoments()
+        chunk.count = len(values)
+        chunk.total = float(values.sum())
+        chunk.m2 = float(((values - chunk.total / chunk.count) ** 2).sum())
+        chunk.minimum = float(values.min())
+        chunk.maximum = float(values.max())
+        return self.merge(chunk)
+
+    def merge(self, other: 'StreamingMoments') -> 'StreamingMoments':
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.total, self.m2 = other.count, other.total, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return self
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def std(self, ddof: int = 1) -> float:
+        """Standart sapma (varsayılan pandas gibi örneklem, ddof=1)"""
+
+        if self.count <= ddof:
+            return np.nan
+        return float(np.sqrt(self.m2 / (self.count - ddof)))
+
+
+class QuantileSketch:
+    """Birleştirilebilir kantil taslağı
+
+    Farklı değer sayısı max_size'ı aşmadıkça (değer, sayı) çiftlerini tam tutar ve
+    pandas ile aynı doğrusal ara değerlemeyle kesin kantil verir. Aşılırsa komşu
+    değerler eşit ağırlıklı gruplarda ağırlıklı ortalamaya sıkıştırılır; sonuç
+    yaklaşık olur (``exact`` False).
+    """
+
+    def __init__(self, max_size: int = 4096):
+        if max_size < 2:
+            raise ValueError(f"Geçersiz taslak boyutu: {max_size}")
+
+        self.max_size = max_size
+        self.values = np.empty(0, dtype=np.float64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.exact = True
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, values: np.ndarray) -> 'QuantileSketch':
+        values = np.asarray(values, dtype=np.float64)
+        unique, counts = np.unique(values[~np.isnan(values)], return_counts=True)
+        return self._add(unique, counts)
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        self.exact &= other.exact
+        return self._add(other.values, other.counts)
+
+    def _add(self, values: np.ndarray, counts: np.ndarray) -> 'QuantileSketch':
+        if len(values) == 0:
+            return self
+
+        unique, inverse = np.unique(np.concatenate([self.values, values]), return_inverse=True)
+        self.counts = np.bincount(inverse, weights=np.concatenate([self.counts, counts]),
+                                  minlength=len(unique)).astype(np.int64)
+        self.values = unique
+
+        if len(self.values) > self.max_size:
+            self._compress()
+        return self
+
+    def _compress(self):
+        """Değerleri max_size/2 eşit ağırlıklı gruba sıkıştırır"""
+
+        target = self.max_size // 2
+        before = np.cumsum(self.counts) - self.counts
+        groups = (before * target // self.count).astype(np.int64)
+
+        counts = np.bincount(groups, weights=self.counts)
+        values = np.bincount(groups, weights=self.values * self.counts) / np.maximum(counts, 1)
+
+        keep = counts > 0
+        self.values = values[keep]
+        self.counts = counts[keep].astype(np.int64)
+        self.exact = False
+
+    def quantile(self, q: float) -> float:
+        """q kantili (pandas 'linear' ara değerlemesi)"""
+
+        n = self.count
+        if n == 0:
+            return np.nan
+
+        position = (n - 1) * q
+        low, high = int(np.floor(position)), int(np.ceil(position))
+
+        # k. sıra istatistiği: kümülatif sayısı k'dan büyük ilk değer
+        cumulative = np.cumsum(self.counts)
+        low_value = self.values[np.searchsorted(cumulative, low, side='right')]
+        high_value = self.values[np.searchsorted(cumulative, high, side='right')]
+
+        return float(low_value + (position - low) * (high_value - low_value))
+
+
+class TrendAggregate:
+    """analyze_test_trends için birleştirilebilir kısmi özet
+
+    ``update`` bir parçayı ekler, ``merge`` iki özeti birleştirir, ``result``
+    analyze_test_trends ile aynı biçimde analiz sözlüğü döndürür.
+    """
+
+    def __init__(self, sketch_size: int = 4096):
+        self.rows = 0
+        self.columns = set()
+        self.counts: Dict[str, Counter] = {column: Counter() for column in COUNT_COLUMNS}
+        self.moments = {column: StreamingMoments() for column in NUMERIC_COLUMNS}
+        self.sketches = {column: QuantileSketch(sketch_size) for column in NUMERIC_COLUMNS}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, sketch_size: int = 4096) -> 'TrendAggregate':
+        return cls(sketch_size).update(df)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame], sketch_size: int = 4096) -> 'TrendAggregate':
+        aggregate = cls(sketch_size)
+        for chunk in chunks:
+            aggregate.update(chunk)
+        return aggregate
+
+    def update(self, df: pd.DataFrame) -> 'TrendAggregate':
+        """Bir parçanın sayımlarını ve sayısal özetlerini ekler"""
+
+        self.rows += len(df)
+        self.columns.update(df.columns)
+
+        for column in COUNT_COLUMNS:
+            if column in df.columns:
+                counts = df[column].value_counts()
+                self.counts[column].update({k: int(v) for k, v in counts.items() if v})
+
+        for column in NUMERIC_COLUMNS:
+            if column in df.columns:
+                values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                self.moments[column].update(values)
+                self.sketches[column].update(values)
+
+        return self
+
+    def merge(self, other: 'TrendAggregate') -> 'TrendAggregate':
+        """Başka bir parçanın/bölümün özetini bu özete ekler"""
+
+        self.rows += other.rows
+        self.columns |= other.columns
+        for column in COUNT_COLUMNS:
+            self.counts[column].update(other.counts[column])
+        for column in NUMERIC_COLUMNS:
+            self.moments[column].merge(other.moments[column])
+            self.sketches[column].merge(other.sketches[column])
+        return self
+
+    def result(self) -> Dict:
+        """Birleşik özetten analyze_test_trends biçiminde analiz sözlüğü üretir"""
+
+        analysis = {}
+
+        # Test kategorilerine göre dağılım
+        if 'test_category' in self.columns:
+            analysis['category_distribution'] = dict(self.counts['test_category'].most_common())
+
+        # Pass/Fail oranları
+        if 'pass_fail' in self.columns:
+            pass_fail = self.counts['pass_fail']
+            analysis['pass_fail_ratio'] = {
+                'pass_count': pass_fail.get('PASS', 0),
+                'fail_count': pass_fail.get('FAIL', 0),
+                'pass_rate': pass_fail.get('PASS', 0) / self.rows * 100 if self.rows else np.nan
+            }
+
+        # Risk skoru analizi
+        if 'risk_score' in self.columns:
+            moments = self.moments['risk_score']
+            analysis['risk_analysis'] = {
+                'mean_risk': moments.mean,
+                'median_risk': self.sketches['risk_score'].quantile(0.5),
+                'std_risk': moments.std(),
+                'min_risk': moments.minimum,
+                'max_risk': moments.maximum
+            }
+
+        # Test süresi analizi
+        if 'test_duration' in self.columns:
+            moments = self.moments['test_duration']
+            analysis['duration_analysis'] = {
+                'mean_duration': moments.mean,
+                'median_duration': self.sketches['test_duration'].quantile(0.5),
+                'total_hours': moments.total / 60  # Saat cinsinden
+            }
+
+        return analysis
@@ -0,0 +1,119 @@
+"""
+TestScope AI - Toplu Parametre Doğrulama Raporu
+Test planındaki her satırın limit ihlallerini parametre ve yön başına boolean
+maskeler olarak tutar. Uyarı metinleri yalnızca istenen satırlar için üretilir.
+"""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+# Parametre -> uyarı metinlerindeki ad
+PARAMETER_LABELS = {
+    'temperature': 'Sıcaklık',
+    'humidity': 'Nem',
+    'vibration': 'Titreşim',
+    'pressure': 'Basınç'
+}
+
+# İhlal yönleri: (yön, metindeki sıfat, metindeki limit adı, limit anahtarı)
+DIRECTIONS = [
+    ('low', 'düşük', 'minimum', 'min'),
+    ('high', 'yüksek', 'maksimum', 'max')
+]
+
+
+def display_value(value):
+    """Değeri uyarı metni için hazırlar
+
+    NumPy ondalık değerleri (ör. şemadaki float32 sütunlar) kendi en kısa
+    gösterimleriyle Python float'a çevrilir: float32 75.3, 75.30000305175781 yerine
+    skaler yoldaki gibi 75.3 yazılır. Diğer değerler olduğu gibi döner.
+    """
+
+    if isinstance(value, np.floating):
+        return float(np.format_float_positional(value))
+    return value
+
+
+def violation_message(parameter: str, direction: str, value, limits: Dict) -> str:
+    """Tek bir ihlal için uyarı metni (validate_test_parameters ile aynı biçim)"""
+
+    for name, adjective, limit_name, key in DIRECTIONS:
+        if name == direction:
+            unit = limits[parameter]['unit']
+            return (f"{PARAMETER_LABELS[parameter]} çok {adjective}: {display_value(value)}{unit} "
+                    f"({limit_name}: {limits[parameter][key]}{unit})")
+
+    raise ValueError(f"Geçersiz ihlal yönü: {direction}")
+
+
+class ValidationReport:
+    """Toplu doğrulama sonucu
+
+    ``masks[(parametre, yön)]`` satır başına ihlal maskesidir (yön: 'low' / 'high').
+    Metinler ``messages`` ile, yalnızca gösterilen satırlar için üretilir.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], limits: Dict,
+                 index: Optional[pd.Index] = None):
+        self.columns = columns
+        self.limits = limits
+        self.index = index
+        self.masks: Dict[tuple, np.ndarray] = {}
+
+        for parameter, values in columns.items():
+            # Skaler sürümdeki if/elif ile aynı: düşük ihlali varsa yüksek kontrol edilmez
+            low = values < limits[parameter]['min']
+            self.masks[(parameter, 'low')] = low
+            self.masks[(parameter, 'high')] = ~low & (values > limits[parameter]['max'])
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    @property
+    def has_warnings(self) -> np.ndarray:
+        """En az bir limit ihlali olan satırların maskesi"""
+
+        mask = np.zeros(len(self), dtype=bool)
+        for violation in self.masks.values():
+            mask |= violation
+        return mask
+
+    def summary(self) -> Dict:
+        """Parametre/yön başına ihlal sayıları ve uyarılı satır sayısı"""
+
+        counts = {f'{parameter}_{direction}': int(mask.sum())
+                  for (parameter, direction), mask in self.masks.items()}
+        return {
+            'rows': len(self),
+            'rows_with_warnings': int(self.has_warnings.sum()),
+            'violations': counts
+        }
+
+    def messages(self, rows: Optional[Sequence[int]] = None, limit: int = 100) -> Dict[int, List[str]]:
+        """Satır konumu -> uyarı metinleri
+
+        rows verilmezse uyarılı ilk ``limit`` satır için üretilir. Anahtarlar
+        satır konumlarıdır (0 tabanlı); index verilmişse etiketler ``labels`` ile alınır.
+        """
+
+        if rows is None:
+            rows = np.flatnonzero(self.has_warnings)[:limit]
+
+        result = {}
+        for row in rows:
+            row = int(row)
+            result[row] = [
+                violation_message(parameter, direction, self.columns[parameter][row], self.limits)
+                for (parameter, direction), mask in self.masks.items()
+                if mask[row]
+            ]
+        return result
+
+    def labels(self, rows: Sequence[int]) -> List:
+        """Satır konumlarının özgün index etiketleri"""
+
+        if self.index is None:
+            return list(rows)
+        return list(self.index[np.asarray(rows, dtype=np.int64)])